@@ -0,0 +1,75 @@
+"""
+Benchmark + parity check: ONNX Runtime int8 embedder vs PyTorch.
+
+Run from backend/whisper_asr (needs onnxruntime + transformers; the
+first run exports and quantizes the model into data/onnx/):
+    python benchmarks/embedding_onnx_bench.py
+
+Parity: per-sentence cosine between the two engines' vectors, and
+whether semantic_classify picks the same intent on both.
+Latency: batch-size-1 encode, the shape of a single live call.
+"""
+
+import time
+
+import numpy as np
+
+from src.embedding_service import EmbeddingService, DEFAULT_MODEL
+from src.nlp.semantic_fallback import TEMPLATE_TEXTS, TEMPLATE_INTENT
+
+SENTENCES = [
+    "there is a fire near orion mall please come fast",
+    "my father collapsed he is not breathing",
+    "two bikes crashed on outer ring road someone is bleeding",
+    "a man is following me and threatening me",
+    "smoke coming out of the kitchen of our apartment",
+    "my child swallowed something and is choking",
+    "someone broke into the house and stole jewellery",
+    "the building wall fell down people are trapped",
+    "please send an ambulance to koramangala fifth block",
+    "hello can you hear me",
+]
+
+MIN_COSINE = 0.98
+
+
+def intents(service):
+    templates = np.asarray(service.encode(TEMPLATE_TEXTS, convert_to_tensor=False))
+    queries = np.asarray(service.encode(SENTENCES, convert_to_tensor=False))
+    return [TEMPLATE_INTENT[i] for i in (queries @ templates.T).argmax(axis=1)]
+
+
+def latency(service, runs=50):
+    service.encode(SENTENCES[0], convert_to_tensor=False)   # warm up
+    times = []
+    for i in range(runs):
+        text = SENTENCES[i % len(SENTENCES)]
+        start = time.perf_counter()
+        service.encode(text, convert_to_tensor=False)
+        times.append(time.perf_counter() - start)
+    return np.percentile(times, 50), np.percentile(times, 95)
+
+
+if __name__ == "__main__":
+    torch_svc = EmbeddingService(DEFAULT_MODEL, cache_dir=None, backend="torch")
+    onnx_svc = EmbeddingService(DEFAULT_MODEL, cache_dir=None, backend="onnx")
+
+    a = np.asarray(torch_svc.encode(SENTENCES, convert_to_tensor=False))
+    b = np.asarray(onnx_svc.encode(SENTENCES, convert_to_tensor=False))
+    if onnx_svc.backend != "onnx":
+        raise SystemExit("❌ onnxruntime not available")
+
+    cos = (a * b).sum(axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+    same = sum(x == y for x, y in zip(intents(torch_svc), intents(onnx_svc)))
+
+    print(f"cosine vs torch: min {cos.min():.4f}  mean {cos.mean():.4f}")
+    print(f"intent agreement: {same}/{len(SENTENCES)}")
+
+    print(f"\n{'engine':10} {'p50':>10} {'p95':>10}")
+    for name, svc in (("torch", torch_svc), ("onnx-int8", onnx_svc)):
+        p50, p95 = latency(svc)
+        print(f"{name:10} {p50 * 1e3:8.2f}ms {p95 * 1e3:8.2f}ms")
+
+    if cos.min() < MIN_COSINE or same != len(SENTENCES):
+        raise SystemExit(f"❌ parity check failed (min cosine {cos.min():.4f}, {same}/{len(SENTENCES)} intents)")
+    print("\n✅ parity OK")
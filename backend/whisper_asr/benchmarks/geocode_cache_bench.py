@@ -0,0 +1,103 @@
+"""
+Demo + benchmark: geocode cache in front of a local stand-in for the
+Google Geocoding API (no key or network needed).
+
+Run from backend/whisper_asr:
+    python benchmarks/geocode_cache_bench.py
+
+The stand-in answers after a fixed delay (like a real round trip) and
+returns ZERO_RESULTS for unknown places, so negative caching shows up.
+Uses a throwaway DB, not data/respondr.db.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+LATENCY_SEC = 0.15
+PLACES = {
+    "orion mall, bangalore, india": (13.0108, 77.5550),
+    "christ university, bangalore, india": (12.9345, 77.6060),
+    "manipal hospital, bangalore, india": (12.9592, 77.6484),
+}
+QUERIES = [
+    "Orion Mall, Bangalore, India",
+    "orion  mall, Bangalore, India",      # same place, different spelling
+    "Christ University, Bangalore, India",
+    "Manipal Hospital, Bangalore, India",
+    "Nowhere Layout, Bangalore, India",   # ZERO_RESULTS
+] * 20
+
+requests_served = 0
+
+
+class StandIn(BaseHTTPRequestHandler):
+    def do_GET(self):
+        global requests_served
+        requests_served += 1
+        time.sleep(LATENCY_SEC)
+
+        address = parse_qs(urlparse(self.path).query)["address"][0]
+        key = " ".join(address.lower().split())
+        if key in PLACES:
+            lat, lng = PLACES[key]
+            body = {"status": "OK", "results": [{
+                "formatted_address": address,
+                "geometry": {"location": {"lat": lat, "lng": lng}},
+                "place_id": f"standin-{abs(hash(key))}"
+            }]}
+        else:
+            body = {"status": "ZERO_RESULTS", "results": []}
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+if __name__ == "__main__":
+    server = HTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    os.environ["GOOGLE_MAPS_API_KEY"] = "stand-in"
+    os.environ["GEOCODE_API_URL"] = f"http://127.0.0.1:{server.server_port}/geocode/json"
+
+    import src.db.database as database
+    database.DB_PATH = Path(tempfile.mkdtemp()) / "geocode_bench.db"
+
+    from src.location.geocoder import GoogleGeocoder
+    from src.location.geocode_cache import get_geocode_cache, GeocodeCache
+    import src.location.geocode_cache as geocode_cache
+
+    # Google backend only: the offline table would answer most of these
+    geocode_location = GoogleGeocoder().geocode
+
+    start = time.perf_counter()
+    for q in QUERIES:
+        geocode_location(q)
+    elapsed = time.perf_counter() - start
+    print(f"{len(QUERIES)} lookups in {elapsed * 1e3:.1f}ms, "
+          f"{requests_served} HTTP requests (uncached: {len(QUERIES)} × {LATENCY_SEC * 1e3:.0f}ms)")
+    print("stats:", get_geocode_cache().snapshot())
+
+    # Restart: fresh process-level cache, same SQLite table
+    geocode_cache._cache = GeocodeCache()
+    served_before = requests_served
+    start = time.perf_counter()
+    for q in QUERIES:
+        geocode_location(q)
+    print(f"\nafter restart: {(time.perf_counter() - start) * 1e3:.1f}ms, "
+          f"{requests_served - served_before} HTTP requests")
+    print("stats:", get_geocode_cache().snapshot())
+
+    server.shutdown()
@@ -0,0 +1,63 @@
+"""
+Benchmark: gazetteer/trie location extractor vs the previous regex.
+
+Run from backend/whisper_asr:
+    python benchmarks/location_extractor_bench.py
+
+The legacy extractor re-compiled its regexes per call and its
+`(?:\\s[a-z]{2,})*` name group backtracks on long lowercase text with
+no place suffix — the pathological cases below.
+"""
+
+import re
+import time
+
+from src.nlp.location_extractor import extract_location, PLACE_SUFFIXES
+
+
+def legacy_extract_location(text: str):
+    original = text.strip()
+    acronym_pattern = re.compile(
+        r"\b([A-Z]{2,5})\s+(apartment|apartments|colony|layout|society|residency|pg|hostel|college|campus|hospital|mall)\b",
+        re.IGNORECASE
+    )
+    match = acronym_pattern.search(original)
+    if match:
+        return match.group(0).title()
+
+    name_pattern = re.compile(
+        r"\b([a-z]{2,}(?:\s[a-z]{2,})*)\s(" + "|".join(PLACE_SUFFIXES) + r")\b",
+        re.IGNORECASE
+    )
+    match = name_pattern.search(original)
+    if match:
+        return match.group(0).title()
+    return None
+
+
+CASES = {
+    "short, with place": "there is a fire near orion mall please come fast",
+    "short, no place": "my father collapsed he is not breathing please help",
+    "500 chars, place at end": ("please help us quickly " * 22) + "near church street",
+    "pathological 2k chars, no place": "help " * 400,
+    "pathological 8k chars, no place": "someone is bleeding badly " * 320,
+    "pathological 8k chars, near-miss suffixes": "streets roads malls " * 400,
+}
+
+
+def bench(fn, text, min_time=0.2):
+    n, start = 0, time.perf_counter()
+    while True:
+        fn(text)
+        n += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / n
+
+
+if __name__ == "__main__":
+    print(f"{'case':45} {'legacy':>12} {'trie':>12} {'speedup':>8}")
+    for name, text in CASES.items():
+        old = bench(legacy_extract_location, text)
+        new = bench(extract_location, text)
+        print(f"{name:45} {old * 1e6:10.1f}µs {new * 1e6:10.1f}µs {old / new:7.1f}x")
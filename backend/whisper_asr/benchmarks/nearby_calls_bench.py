@@ -0,0 +1,98 @@
+"""
+Benchmark: "active calls within R metres in the last T minutes" via the
+calls_rtree spatial index vs a plain scan of `calls`.
+
+Run from backend/whisper_asr (builds a throwaway DB, not data/respondr.db):
+    python benchmarks/nearby_calls_bench.py [rows]
+"""
+
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import src.db.database as database
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+DAYS = 90
+CENTRE = (12.9716, 77.5946)   # Bangalore
+QUERY = dict(lat=12.9352, lng=77.6245, radius_m=500, minutes=60)
+
+
+def build(path: Path, now: datetime):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+    CREATE TABLE calls (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT, emergency_type TEXT, priority TEXT,
+        location_text TEXT, latitude REAL, longitude REAL, status TEXT
+    )
+    """)
+    from src.db.spatial_index import init_spatial_index
+    init_spatial_index(conn)
+
+    rng = random.Random(0)
+    statuses = ["new", "dispatched", "resolved", "resolved", "resolved"]
+
+    def rows():
+        for _ in range(ROWS):
+            ts = now - timedelta(seconds=rng.uniform(0, DAYS * 86400))
+            yield (
+                ts.isoformat(), "fire", "high", None,
+                CENTRE[0] + rng.uniform(-0.25, 0.25),
+                CENTRE[1] + rng.uniform(-0.25, 0.25),
+                rng.choice(statuses)
+            )
+
+    conn.executemany("""
+        INSERT INTO calls (timestamp, emergency_type, priority, location_text,
+                           latitude, longitude, status)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, rows())
+    conn.commit()
+    conn.close()
+
+
+def full_scan(lat, lng, radius_m, minutes, now):
+    from src.db.spatial_index import _haversine_m
+
+    conn = database.get_connection()
+    rows = conn.execute("""
+        SELECT id, latitude, longitude FROM calls
+        WHERE timestamp >= ? AND status != 'resolved' AND latitude IS NOT NULL
+    """, ((now - timedelta(minutes=minutes)).isoformat(),)).fetchall()
+    conn.close()
+    return [r for r in rows if _haversine_m(lat, lng, r[1], r[2]) <= radius_m]
+
+
+def timed(fn, runs=20):
+    fn()
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = fn()
+    return (time.perf_counter() - start) / runs, result
+
+
+if __name__ == "__main__":
+    database.DB_PATH = Path(tempfile.mkdtemp()) / "nearby_bench.db"
+    now = datetime.utcnow()
+
+    start = time.perf_counter()
+    build(database.DB_PATH, now)
+    print(f"built {ROWS:,} calls in {time.perf_counter() - start:.1f}s")
+
+    from src.db.spatial_index import find_nearby_calls
+
+    print(f"{'query':16} {'R*Tree':>10} {'ts index + scan':>16} {'calls':>6}")
+    for name, query in (
+        ("500m / 1h", QUERY),
+        ("3km / 24h", dict(QUERY, radius_m=3000, minutes=24 * 60)),
+        ("1km / 7d", dict(QUERY, radius_m=1000, minutes=7 * 24 * 60)),
+    ):
+        t_idx, hits = timed(lambda: find_nearby_calls(**query, now=now))
+        t_scan, scan = timed(lambda: full_scan(**query, now=now), runs=3)
+        assert sorted(c["id"] for c in hits) == sorted(r[0] for r in scan)
+        print(f"{name:16} {t_idx * 1e3:8.2f}ms {t_scan * 1e3:14.2f}ms {len(hits):6}")
@@ -0,0 +1,38 @@
+"""
+Benchmark: offline geocoder (bundled places table) lookup latency.
+
+Run from backend/whisper_asr:
+    python benchmarks/offline_geocoder_bench.py
+"""
+
+import time
+
+from src.location.geocoder import OfflineGeocoder
+
+CASES = {
+    "exact": "Orion Mall, Bangalore, India",
+    "alias": "Indira Nagar, Bangalore, India",
+    "prefix": "Orion, Bangalore, India",
+    "token cover": "Orion Mall Main Gate, Bangalore, India",
+    "misspelled (fuzzy)": "Koramangla, Bangalore, India",
+    "miss": "Some Unknown Layout, Bangalore, India",
+}
+
+
+def bench(fn, text, min_time=0.2):
+    n, start = 0, time.perf_counter()
+    while True:
+        fn(text)
+        n += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / n
+
+
+if __name__ == "__main__":
+    geocoder = OfflineGeocoder()
+    print(f"{'case':22} {'latency':>10}  result")
+    for name, text in CASES.items():
+        result = geocoder.geocode(text)
+        found = f"{result['formatted_address']} ({result['confidence']})" if result else "-"
+        print(f"{name:22} {bench(geocoder.geocode, text) * 1e6:8.1f}µs  {found}")
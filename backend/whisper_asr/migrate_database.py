@@ -20,7 +20,8 @@ def migrate_database():
         ("status", "TEXT DEFAULT 'new'"),
         ("assigned_unit", "TEXT"),
         ("dispatched_at", "TEXT"),
-        ("created_at", "TEXT DEFAULT (datetime('now'))")
+        ("created_at", "TEXT DEFAULT (datetime('now'))"),
+        ("analysis_stage", "TEXT DEFAULT 'final'")
     ]
     
     # Get existing columns
@@ -37,6 +38,11 @@ def migrate_database():
         else:
             print(f"✓ Column {column_name} already exists")
     
+    # Spatial index over calls (R*Tree + sync triggers, backfilled)
+    from src.db.spatial_index import init_spatial_index
+    init_spatial_index(conn)
+    print("✅ Spatial index ready: calls_rtree")
+
     conn.commit()
     conn.close()
     
@@ -0,0 +1,48 @@
+"""
+Batch re-transcription of stored recordings (resumable).
+
+Usage:
+    python run_batch_transcription.py --update-db
+    python run_batch_transcription.py --checkpoint data/retx_medium.jsonl
+
+Re-running with the same checkpoint skips recordings already done.
+Use a new checkpoint file after changing the model.
+"""
+
+import argparse
+import glob
+import os
+
+from src.pipeline.batch_process import BatchCallProcessor, BatchCheckpoint
+from src.db.call_repository import update_call_transcript
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch re-transcribe recordings")
+    parser.add_argument("--recordings-dir", default="recordings")
+    parser.add_argument("--pattern", default="RE*.wav")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--checkpoint", default="data/batch_checkpoint.jsonl")
+    parser.add_argument(
+        "--update-db", action="store_true",
+        help="write new transcripts/analysis back to matching calls rows"
+    )
+    args = parser.parse_args()
+
+    wav_paths = sorted(glob.glob(os.path.join(args.recordings_dir, args.pattern)))
+    checkpoint = BatchCheckpoint(args.checkpoint)
+
+    def on_result(result):
+        if args.update_db:
+            updated = update_call_transcript(result["audio_path"], result)
+            print(f"💾 {result['audio_path']} → {updated} row(s) updated")
+
+    batch = BatchCallProcessor(batch_size=args.batch_size)
+    processed, elapsed = batch.run(wav_paths, checkpoint, on_result=on_result)
+
+    rate = processed / elapsed if elapsed else 0.0
+    print(f"\n🏁 Done: {processed} recordings in {elapsed:.1f}s ({rate:.2f}/s)")
+
+
+if __name__ == "__main__":
+    main()
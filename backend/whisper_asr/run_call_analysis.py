@@ -1,13 +1,26 @@
 from src.pipeline.process_call import CallProcessor
 
+_processor = None
+
+
+def get_processor():
+    """
+    Lazily build ONE CallProcessor per process (models come from
+    src.model_registry, so nothing is reloaded between calls).
+    """
+    global _processor
+    if _processor is None:
+        _processor = CallProcessor()
+    return _processor
+
 
 def run_analysis(wav_path: str):
     """
     Core analysis entrypoint.
     Used by both local testing and Twilio.
+    Never waits on geocoding (see CallProcessor.process).
     """
-    processor = CallProcessor()
-    return processor.process(wav_path)
+    return get_processor().process(wav_path)
 
 
 def analyze_call_audio(wav_path: str):
@@ -24,6 +37,11 @@ def analyze_call_audio(wav_path: str):
 if __name__ == "__main__":
     result = run_analysis("test_audio/sample8.wav")
 
+    # ASR is done; only this CLI waits for a lookup still in flight
+    geo_future = result.pop("geo_future", None)
+    if geo_future is not None:
+        result["analysis"]["geo"] = geo_future.result()
+
     print("\n🚨 FINAL RESULT")
     print("Language:", result["language"])
     print("Transcript:", result["transcript"])
@@ -0,0 +1,71 @@
+"""
+Re-score calls already in data/respondr.db (no audio needed).
+
+Usage:
+    python run_reanalysis.py --dry-run        # print what would change
+    python run_reanalysis.py --workers 8      # write updates
+
+Run after editing keyword_sets.py or the classifier.
+"""
+
+import argparse
+import time
+
+from src.db.call_repository import iter_call_transcripts, update_call_analyses
+from src.pipeline.reanalysis import Reanalyzer, diff_fields
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-analyse stored call transcripts")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true", help="show diffs, write nothing")
+    parser.add_argument("--no-semantic", action="store_true", help="skip MiniLM fallback")
+    parser.add_argument(
+        "--no-geocode", action="store_true",
+        help="don't re-geocode changed locations (their coordinates are cleared)"
+    )
+    args = parser.parse_args()
+
+    stats = {"rows": 0, "changed": 0}
+
+    def on_batch(results):
+        updates = []
+        for row, new in results:
+            stats["rows"] += 1
+            changes = diff_fields(row, new)
+            if not changes:
+                continue
+
+            stats["changed"] += 1
+            updates.append(new)
+
+            if args.dry_run:
+                print(f"📝 call {row['id']}")
+                for field, (old, value) in changes.items():
+                    print(f"    {field}: {old!r} → {value!r}")
+
+        if not args.dry_run:
+            update_call_analyses(updates)   # one transaction per batch
+
+        elapsed = time.time() - start
+        print(f"⏱️  {stats['rows']} rows, {stats['changed']} changed, "
+              f"{stats['rows'] / elapsed:.0f} rows/s")
+
+    start = time.time()
+    Reanalyzer(
+        workers=args.workers,
+        use_semantic=not args.no_semantic,
+        geocode=not args.no_geocode
+    ).run(
+        iter_call_transcripts(args.batch_size), on_batch
+    )
+    elapsed = time.time() - start
+
+    mode = "would change" if args.dry_run else "updated"
+    print(f"\n🏁 {stats['rows']} rows in {elapsed:.1f}s "
+          f"({stats['rows'] / elapsed if elapsed else 0:.0f} rows/s), {stats['changed']} {mode}")
+
+
+if __name__ == "__main__":
+    main()
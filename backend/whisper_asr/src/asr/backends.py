@@ -0,0 +1,271 @@
+# whisper_asr/src/asr/backends.py
+
+"""
+Pluggable ASR engines.
+
+Every backend returns the same plain dict as openai-whisper:
+{
+    text: full transcript,
+    language: detected language,
+    segments: [{start, end, text, words: [{start, end, word}]}]
+}
+so WhisperASRService / OfflineASR never touch engine-specific objects.
+"""
+
+import numpy as np
+
+
+class ASRBackend:
+    """
+    Minimal interface every engine implements.
+    """
+
+    name = "base"
+
+    def transcribe(
+        self,
+        audio,
+        language: str = None,
+        prompt: str = None,
+        word_timestamps: bool = False,
+        condition_on_previous_text: bool = True
+    ) -> dict:
+        raise NotImplementedError
+
+    def transcribe_batch(
+        self,
+        audios: list,
+        language: str = None,
+        batch_size: int = 8
+    ) -> list:
+        """
+        Transcribe several recordings. Engines that can batch override
+        this; the default simply loops.
+        """
+        return [self.transcribe(a, language=language) for a in audios]
+
+
+class OpenAIWhisperBackend(ASRBackend):
+    """
+    Reference openai-whisper engine (PyTorch, fp32 on CPU).
+    """
+
+    name = "whisper"
+
+    def __init__(self, model_name: str, device: str = "cpu"):
+        import whisper
+
+        self.model = whisper.load_model(model_name, device=device)
+
+    def transcribe(
+        self,
+        audio,
+        language: str = None,
+        prompt: str = None,
+        word_timestamps: bool = False,
+        condition_on_previous_text: bool = True
+    ) -> dict:
+        result = self.model.transcribe(
+            audio,
+            task="transcribe",
+            language=language,
+            fp16=False,       # 🔒 CPU-safe
+            initial_prompt=prompt,
+            word_timestamps=word_timestamps,
+            condition_on_previous_text=condition_on_previous_text
+        )
+
+        return {
+            "text": result.get("text", ""),
+            "language": result.get("language", "unknown"),
+            "segments": result.get("segments", [])
+        }
+
+    def transcribe_batch(
+        self,
+        audios: list,
+        language: str = None,
+        batch_size: int = 8
+    ) -> list:
+        """
+        Pack 30 s mel windows from ALL recordings into batched
+        encoder/decoder passes (whisper.decode accepts a mel batch).
+
+        Windows are decoded independently (no prompt carry-over), so
+        this trades a little cross-window context for throughput.
+        """
+        import torch
+        import whisper
+
+        windows = []   # (recording index, mel)
+        for i, audio in enumerate(audios):
+            audio = np.asarray(audio, dtype=np.float32)
+            for start in range(0, max(len(audio), 1), whisper.audio.N_SAMPLES):
+                piece = whisper.pad_or_trim(audio[start:start + whisper.audio.N_SAMPLES])
+                mel = whisper.log_mel_spectrogram(piece, self.model.dims.n_mels)
+                windows.append((i, mel))
+
+        options = whisper.DecodingOptions(
+            task="transcribe",
+            language=language,
+            fp16=False,
+            without_timestamps=True
+        )
+
+        texts = [[] for _ in audios]
+        languages = ["unknown"] * len(audios)
+
+        for b in range(0, len(windows), batch_size):
+            group = windows[b:b + batch_size]
+            mel = torch.stack([m for _, m in group]).to(self.model.device)
+
+            for (i, _), res in zip(group, whisper.decode(self.model, mel, options)):
+                if res.no_speech_prob > 0.6 and res.avg_logprob < -1.0:
+                    continue
+                texts[i].append(res.text.strip())
+                if languages[i] == "unknown":
+                    languages[i] = res.language
+
+        return [
+            {
+                "text": " ".join(t for t in parts if t),
+                "language": lang,
+                "segments": []
+            }
+            for parts, lang in zip(texts, languages)
+        ]
+
+
+class FasterWhisperBackend(ASRBackend):
+    """
+    CTranslate2 engine via faster-whisper (int8 weights on CPU).
+    """
+
+    name = "faster-whisper"
+
+    def __init__(
+        self,
+        model_name: str,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        cpu_threads: int = 0
+    ):
+        from faster_whisper import WhisperModel
+
+        self.model = WhisperModel(
+            model_name,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads
+        )
+        self._batched = None   # BatchedInferencePipeline, built on first batch
+
+    def transcribe(
+        self,
+        audio,
+        language: str = None,
+        prompt: str = None,
+        word_timestamps: bool = False,
+        condition_on_previous_text: bool = True
+    ) -> dict:
+        if isinstance(audio, np.ndarray):
+            audio = audio.astype(np.float32, copy=False)
+
+        segments, info = self.model.transcribe(
+            audio,
+            task="transcribe",
+            language=language,
+            initial_prompt=prompt,
+            word_timestamps=word_timestamps,
+            condition_on_previous_text=condition_on_previous_text
+        )
+
+        # Segments are a lazy generator → decoding happens here
+        out = []
+        for seg in segments:
+            out.append({
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "words": [
+                    {"start": w.start, "end": w.end, "word": w.word}
+                    for w in (seg.words or [])
+                ]
+            })
+
+        return {
+            "text": "".join(s["text"] for s in out),
+            "language": info.language or "unknown",
+            "segments": out
+        }
+
+    def transcribe_batch(
+        self,
+        audios: list,
+        language: str = None,
+        batch_size: int = 8
+    ) -> list:
+        """
+        faster-whisper batches the speech segments of ONE recording
+        (BatchedInferencePipeline, faster-whisper >= 1.1); recordings
+        are then processed one after another. Older versions have no
+        batched path → plain per-file loop, reported once.
+        """
+        if self._batched is None:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+                self._batched = BatchedInferencePipeline(model=self.model)
+            except ImportError:
+                self._batched = False
+                print("⚠️  faster-whisper has no BatchedInferencePipeline (< 1.1): batching inactive, transcribing file by file")
+
+        if not self._batched:
+            return super().transcribe_batch(audios, language=language, batch_size=batch_size)
+
+        results = []
+        for audio in audios:
+            segments, info = self._batched.transcribe(
+                np.asarray(audio, dtype=np.float32),
+                task="transcribe",
+                language=language,
+                batch_size=batch_size
+            )
+            segments = list(segments)
+            results.append({
+                "text": "".join(seg.text for seg in segments),
+                "language": info.language or "unknown",
+                "segments": [
+                    {"start": seg.start, "end": seg.end, "text": seg.text, "words": []}
+                    for seg in segments
+                ]
+            })
+
+        return results
+
+
+BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend
+}
+
+
+def load_backend(
+    name: str,
+    model_name: str,
+    device: str = "cpu",
+    compute_type: str = "int8"
+) -> ASRBackend:
+    """
+    Build the configured engine; fall back to openai-whisper if the
+    requested one is unavailable (package missing / model load fails).
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown ASR backend: {name} (choose from {list(BACKENDS)})")
+
+    if name == FasterWhisperBackend.name:
+        try:
+            return FasterWhisperBackend(model_name, device, compute_type)
+        except Exception as e:
+            print(f"⚠️  faster-whisper unavailable ({e}), falling back to openai-whisper")
+
+    return OpenAIWhisperBackend(model_name, device)
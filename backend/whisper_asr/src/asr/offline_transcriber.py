@@ -1,13 +1,15 @@
-import whisper
+from src.config import ASR_BACKEND, COMPUTE_TYPE
+from src.model_registry import get_asr_backend
+from src.streaming.audio_utils import load_audio
 
 class OfflineASR:
     """
     Offline, high-accuracy ASR using Whisper Large.
     """
 
-    def __init__(self, model_name="large-v2", device="cpu"):
-        print(f"🔊 Loading Whisper model: {model_name}")
-        self.model = whisper.load_model(model_name, device=device)
+    def __init__(self, model_name="large-v2", device="cpu", backend=ASR_BACKEND):
+        print(f"🔊 Loading Whisper model: {model_name} ({backend})")
+        self.backend = get_asr_backend(backend, model_name, device, COMPUTE_TYPE)
         print("✅ Whisper model loaded")
 
     def transcribe(self, audio_path: str) -> dict:
@@ -19,11 +21,7 @@ class OfflineASR:
             segments: whisper segments
         }
         """
-        result = self.model.transcribe(
-            audio_path,
-            task="transcribe",
-            fp16=False
-        )
+        result = self.backend.transcribe(load_audio(audio_path))
 
         return {
             "text": result.get("text", "").strip(),
@@ -1,7 +1,9 @@
 # whisper_asr/src/asr_service.py
 
-import whisper
+import numpy as np
 from .normalizer import normalize_text
+from .config import ASR_BACKEND, COMPUTE_TYPE
+from .model_registry import get_asr_backend
 
 # 🔒 HARD-LOCK SAFE MODEL CONFIG (Mac-friendly)
 WHISPER_MODEL_NAME = "medium"   # ← was large-v2 (too heavy)
@@ -10,40 +12,52 @@ DEVICE = "cpu"
 
 class WhisperASRService:
     """
-    Production-ready ASR service wrapper around OpenAI Whisper.
+    Production-ready ASR service wrapper around Whisper.
 
     - CPU-only (stable on Mac)
     - English decoding (romanized output)
     - Multilingual input (Hindi / Kannada / English)
     - Safe for streaming usage
+    - Engine is pluggable (config.ASR_BACKEND, see asr/backends.py)
     """
 
-    def __init__(self):
-        print(f"🔊 Loading Whisper model: {WHISPER_MODEL_NAME} ({DEVICE})")
+    def __init__(self, backend=None, model_name: str = WHISPER_MODEL_NAME):
+        if backend is None:
+            print(f"🔊 Loading Whisper model: {model_name} ({DEVICE}, {ASR_BACKEND})")
 
-        # Load model once (NO reloads)
-        self.model = whisper.load_model(
-            WHISPER_MODEL_NAME,
-            device=DEVICE
-        )
+            # Load model once per process (shared via model_registry)
+            backend = get_asr_backend(
+                ASR_BACKEND,
+                model_name,
+                device=DEVICE,
+                compute_type=COMPUTE_TYPE
+            )
+
+            print(f"✅ Whisper model loaded ({backend.name})")
 
-        print("✅ Whisper model loaded")
+        self.backend = backend
 
-    def transcribe(self, audio_path: str):
+    def transcribe(self, audio):
         """
         Transcribe an audio chunk.
 
+        Args:
+            audio: file path, or a mono 16 kHz float32 NumPy array
+                   (e.g. a view yielded by audio_chunker.iter_chunks)
+
         Returns:
             clean_text (str): normalized text (romanized if Hindi)
             detected_language (str)
             raw_text (str): raw Whisper output
         """
 
-        result = self.model.transcribe(
-            audio_path,
-            task="transcribe",
-            language="en",   # 🔒 Force English decoding
-            fp16=False       # 🔒 CPU-safe
+        if isinstance(audio, np.ndarray):
+            # Whisper expects float32; views stay zero-copy when dtype matches
+            audio = audio.astype(np.float32, copy=False)
+
+        result = self.backend.transcribe(
+            audio,
+            language="en"    # 🔒 Force English decoding
         )
 
         raw_text = result.get("text", "").strip()
@@ -53,3 +67,56 @@ class WhisperASRService:
         clean_text = normalize_text(raw_text)
 
         return clean_text, detected_language, raw_text
+
+    def transcribe_words(self, audio, prompt: str = None):
+        """
+        Word-level transcription for streaming (see StablePrefixDecoder).
+
+        Returns:
+            words (list): [(start_sec, end_sec, word)] relative to audio start
+            detected_language (str)
+        """
+
+        if isinstance(audio, np.ndarray):
+            audio = audio.astype(np.float32, copy=False)
+
+        result = self.backend.transcribe(
+            audio,
+            language="en",
+            prompt=prompt,
+            word_timestamps=True,
+            condition_on_previous_text=False
+        )
+
+        words = [
+            (w["start"], w["end"], w["word"])
+            for seg in result.get("segments", [])
+            for w in seg.get("words", [])
+        ]
+
+        return words, result.get("language", "unknown")
+
+    def transcribe_batch(self, audios: list, batch_size: int = 8):
+        """
+        Batched transcription of several 16 kHz float32 arrays.
+
+        Returns:
+            [(clean_text, detected_language, raw_text)] in input order
+        """
+
+        results = self.backend.transcribe_batch(
+            audios,
+            language="en",
+            batch_size=batch_size
+        )
+
+        out = []
+        for result in results:
+            raw_text = result.get("text", "").strip()
+            out.append((
+                normalize_text(raw_text),
+                result.get("language", "unknown"),
+                raw_text
+            ))
+
+        return out
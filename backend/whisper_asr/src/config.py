@@ -3,4 +3,52 @@
 WHISPER_MODEL_NAME = "large-v2"
 DEVICE = "cpu"          # locked to CPU for stability
 DECODE_LANGUAGE = "en"  # English decoding → romanized output
-FP16 = False            # CPU-safe
\ No newline at end of file
+FP16 = False            # CPU-safe
+
+# ASR engine: "faster-whisper" (CTranslate2) or "whisper" (reference)
+# faster-whisper falls back to "whisper" automatically if unavailable
+ASR_BACKEND = "faster-whisper"
+COMPUTE_TYPE = "int8"   # CTranslate2 weights on CPU
+
+# Background workers draining the /recording job queue
+JOB_WORKERS = 1
+
+# Multi-process ASR pool for the job workers
+# 0 → run in-process, None → size by cores + free memory
+ASR_POOL_WORKERS = 0
+ASR_THREADS_PER_WORKER = 4
+
+# Two-tier cascade: small model triages the first seconds of speech,
+# then the main model refines the same DB row
+CASCADE_TRIAGE = True
+TRIAGE_MODEL_NAME = "base"
+TRIAGE_SECONDS = 15.0
+
+# On-disk template embedding store (None → always re-encode)
+EMBEDDING_CACHE_DIR = "data/embedding_cache"
+
+# Sentence-embedding engine: "torch" (sentence-transformers) or "onnx"
+# (ONNX Runtime, int8; exported once into ONNX_CACHE_DIR, falls back
+# to "torch" if onnxruntime is unavailable)
+EMBEDDING_BACKEND = "torch"
+ONNX_CACHE_DIR = "data/onnx"
+
+# Geocode cache (SQLite, same DB as calls) + in-process LRU
+GEOCODE_CACHE_TTL_SEC = 30 * 24 * 3600      # places rarely move
+GEOCODE_NEGATIVE_TTL_SEC = 24 * 3600        # ZERO_RESULTS, retried daily
+GEOCODE_LRU_SIZE = 2048
+
+# Geocoder chain, tried in order until one answers:
+# "pincode" (bundled PIN table) → "offline" (bundled places table)
+# → "google" (network, needs key)
+GEOCODERS = ["pincode", "offline", "google"]
+
+# Geocoding HTTP client: keep-alive pool + bounded in-flight lookups
+GEOCODE_MAX_CONCURRENCY = 4
+GEOCODE_RETRIES = 3
+GEOCODE_BACKOFF_SEC = 0.5     # 0.5s, 1s, 2s between attempts
+GEOCODE_TIMEOUT_SEC = 5
+
+# Compiled PIN-code table (built from location/data/pincodes.csv,
+# memory-mapped on load; rebuilt automatically when the CSV changes)
+PINCODE_CACHE_DIR = "data/pincode_cache"
@@ -23,9 +23,10 @@ def save_call(call_data: dict):
             location_text,
             latitude,
             longitude,
-            status
+            status,
+            analysis_stage
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """, (
         datetime.utcnow().isoformat(),
         call_data.get("phone_number"),
@@ -42,11 +43,14 @@ def save_call(call_data: dict):
             if call_data["analysis"].get("geo") else None,
         call_data["analysis"].get("geo", {}).get("lng")
             if call_data["analysis"].get("geo") else None,
-        "new"
+        "new",
+        call_data.get("stage", "final")
     ))
 
+    call_id = cur.lastrowid
     conn.commit()
     conn.close()
+    return call_id
 
 
 def get_all_calls():
@@ -58,7 +62,8 @@ def get_all_calls():
         SELECT 
             id, timestamp, phone_number, audio_path, language,
             transcript, emergency_type, priority, confidence,
-            keywords, location_text, latitude, longitude, status
+            keywords, location_text, latitude, longitude, status,
+            analysis_stage
         FROM calls
         ORDER BY timestamp DESC
     """)
@@ -83,7 +88,8 @@ def get_all_calls():
             "location_text": row[10],
             "latitude": row[11],
             "longitude": row[12],
-            "status": row[13]
+            "status": row[13],
+            "analysis_stage": row[14]
         })
     
     return calls
@@ -98,7 +104,8 @@ def get_calls_by_status(status: str):
         SELECT 
             id, timestamp, phone_number, audio_path, language,
             transcript, emergency_type, priority, confidence,
-            keywords, location_text, latitude, longitude, status
+            keywords, location_text, latitude, longitude, status,
+            analysis_stage
         FROM calls
         WHERE status = ?
         ORDER BY timestamp DESC
@@ -124,7 +131,8 @@ def get_calls_by_status(status: str):
             "location_text": row[10],
             "latitude": row[11],
             "longitude": row[12],
-            "status": row[13]
+            "status": row[13],
+            "analysis_stage": row[14]
         })
     
     return calls
@@ -139,7 +147,8 @@ def get_call(call_id: int):
         SELECT 
             id, timestamp, phone_number, audio_path, language,
             transcript, emergency_type, priority, confidence,
-            keywords, location_text, latitude, longitude, status
+            keywords, location_text, latitude, longitude, status,
+            analysis_stage
         FROM calls
         WHERE id = ?
     """, (call_id,))
@@ -164,7 +173,8 @@ def get_call(call_id: int):
         "location_text": row[10],
         "latitude": row[11],
         "longitude": row[12],
-        "status": row[13]
+        "status": row[13],
+        "analysis_stage": row[14]
     }
 
 
@@ -201,3 +211,202 @@ def dispatch_call(call_id: int, unit: str = None):
 def resolve_call(call_id: int):
     """Legacy function - use update_call_status instead"""
     update_call_status(call_id, "resolved")
+
+
+def _analysis_values(call_data: dict):
+    analysis = call_data["analysis"]
+    location = analysis.get("location") or {}
+    geo = analysis.get("geo") or {}
+
+    return (
+        call_data.get("language"),
+        call_data.get("transcript"),
+        analysis.get("type"),
+        analysis.get("priority"),
+        analysis.get("confidence"),
+        json.dumps(analysis.get("keywords")),
+        location.get("text"),
+        geo.get("lat"),
+        geo.get("lng")
+    )
+
+
+_ANALYSIS_SET = """
+    language = ?,
+    transcript = ?,
+    emergency_type = ?,
+    priority = ?,
+    confidence = ?,
+    keywords = ?,
+    location_text = ?,
+    latitude = ?,
+    longitude = ?
+"""
+
+# Same, but a missing geo result keeps the stored coordinates
+_ANALYSIS_SET_KEEP_GEO = _ANALYSIS_SET.replace(
+    "latitude = ?", "latitude = COALESCE(?, latitude)"
+).replace(
+    "longitude = ?", "longitude = COALESCE(?, longitude)"
+)
+
+
+def update_call(call_id: int, call_data: dict):
+    """
+    Refine an existing row (e.g. provisional triage → final transcript).
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute(
+        "UPDATE calls SET" + _ANALYSIS_SET + ", analysis_stage = ? WHERE id = ?",
+        _analysis_values(call_data) + (call_data.get("stage", "final"), call_id)
+    )
+
+    conn.commit()
+    conn.close()
+
+
+def find_call_by_audio_path(audio_path: str):
+    """
+    Id of the newest row for a recording, or None.
+    """
+    conn = get_connection()
+    row = conn.execute(
+        "SELECT id FROM calls WHERE audio_path = ? ORDER BY id DESC LIMIT 1",
+        (audio_path,)
+    ).fetchone()
+    conn.close()
+    return row[0] if row else None
+
+
+def upsert_call(call_data: dict):
+    """
+    save_call, unless the recording already has a row (e.g. a job retry
+    after a provisional insert) → refine that row instead. Returns id.
+    """
+    call_id = find_call_by_audio_path(call_data.get("audio_path")) if call_data.get("audio_path") else None
+    if call_id is None:
+        return save_call(call_data)
+
+    update_call(call_id, call_data)
+    return call_id
+
+
+def update_call_geo(call_id: int, geo: dict):
+    """
+    Attach coordinates that arrived after the row was written.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute(
+        "UPDATE calls SET latitude = ?, longitude = ? WHERE id = ?",
+        (geo.get("lat"), geo.get("lng"), call_id)
+    )
+
+    conn.commit()
+    conn.close()
+
+
+def update_call_transcript(audio_path: str, call_data: dict):
+    """
+    Overwrite transcript + analysis of existing call(s) for a recording
+    (used when re-transcribing history). Returns number of rows updated.
+    Existing coordinates are only replaced by a new geo result.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute(
+        "UPDATE calls SET" + _ANALYSIS_SET_KEEP_GEO + "WHERE audio_path = ?",
+        _analysis_values(call_data) + (audio_path,)
+    )
+
+    updated = cur.rowcount
+    conn.commit()
+    conn.close()
+    return updated
+
+
+def iter_call_transcripts(batch_size: int = 500):
+    """
+    Stream (id, transcript, emergency_type, priority, confidence,
+    keywords, location_text, latitude, longitude) in id order, batch_size rows at a time
+    (keyset pagination → constant memory, no long-lived cursor).
+    """
+    last_id = 0
+
+    while True:
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT id, transcript, emergency_type, priority, confidence,
+                   keywords, location_text, latitude, longitude
+            FROM calls
+            WHERE id > ?
+            ORDER BY id
+            LIMIT ?
+        """, (last_id, batch_size))
+        rows = cur.fetchall()
+        conn.close()
+
+        if not rows:
+            return
+
+        yield [
+            {
+                "id": row[0],
+                "transcript": row[1],
+                "emergency_type": row[2],
+                "priority": row[3],
+                "confidence": row[4],
+                "keywords": json.loads(row[5]) if row[5] else [],
+                "location_text": row[6],
+                "latitude": row[7],
+                "longitude": row[8]
+            }
+            for row in rows
+        ]
+        last_id = rows[-1][0]
+
+
+def update_call_analyses(updates: list):
+    """
+    Write re-analysed classification fields for many calls in ONE
+    transaction. updates: dicts with id, emergency_type, priority,
+    confidence, keywords, location_text, latitude, longitude.
+    """
+    if not updates:
+        return 0
+
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.executemany("""
+        UPDATE calls
+        SET emergency_type = ?,
+            priority = ?,
+            confidence = ?,
+            keywords = ?,
+            location_text = ?,
+            latitude = ?,
+            longitude = ?
+        WHERE id = ?
+    """, [
+        (
+            u["emergency_type"],
+            u["priority"],
+            u["confidence"],
+            json.dumps(u["keywords"]),
+            u["location_text"],
+            u["latitude"],
+            u["longitude"],
+            u["id"]
+        )
+        for u in updates
+    ])
+
+    conn.commit()
+    conn.close()
+    return len(updates)
@@ -32,4 +32,58 @@ def init_db():
     """)
 
     conn.commit()
-    conn.close()
\ No newline at end of file
+    conn.close()
+
+
+# Columns added after the first release: (name, definition)
+CALL_COLUMNS = [
+    ("status", "TEXT DEFAULT 'new'"),
+    ("assigned_unit", "TEXT"),
+    ("dispatched_at", "TEXT"),
+    ("created_at", "TEXT"),
+    ("analysis_stage", "TEXT DEFAULT 'final'")
+]
+
+
+def init_calls_table(conn=None):
+    """
+    Idempotent startup schema check: create `calls` if missing and add
+    any column older DBs lack (so SELECTs never hit a missing column).
+    """
+    own = conn is None
+    conn = conn or get_connection()
+    cur = conn.cursor()
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS calls (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT,
+        phone_number TEXT,
+        audio_path TEXT,
+        language TEXT,
+        transcript TEXT,
+        emergency_type TEXT,
+        priority TEXT,
+        confidence REAL,
+        keywords TEXT,
+        location_text TEXT,
+        latitude REAL,
+        longitude REAL
+    )
+    """)
+
+    cur.execute("PRAGMA table_info(calls)")
+    existing = {row[1] for row in cur.fetchall()}
+    added = []
+    for name, definition in CALL_COLUMNS:
+        if name not in existing:
+            cur.execute(f"ALTER TABLE calls ADD COLUMN {name} {definition}")
+            added.append(name)
+
+    # One row per recording → lookups by audio_path (job retries)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_calls_audio_path ON calls(audio_path)")
+
+    conn.commit()
+    if own:
+        conn.close()
+    return added
@@ -0,0 +1,188 @@
+# src/db/spatial_index.py
+
+"""
+Spatial + time index over calls (SQLite R*Tree, same DB).
+
+calls_rtree holds one box per geocoded call:
+    (id, min_lat, max_lat, min_lng, max_lng, min_t, max_t)
+with t = minutes since the Unix epoch. Triggers on `calls` keep it in
+sync on insert / coordinate update / delete, so no writer has to know
+it exists.
+
+find_nearby_calls() asks the R*Tree for the radius' bounding box and
+time window (a handful of pages even at millions of rows), then applies
+the exact haversine distance and status filter to those candidates.
+R*Tree coordinates are 32-bit floats, rounded outward, so the box query
+is a superset and the exact filters below it keep results correct.
+"""
+
+import math
+from datetime import datetime, timedelta
+
+from src.db.database import get_connection
+
+EARTH_RADIUS_M = 6371000.0
+METRES_PER_DEG_LAT = 111320.0
+
+# Upper bounds for a nearby query: a city, a month
+MAX_RADIUS_M = 50000.0
+MAX_MINUTES = 30 * 24 * 60.0
+
+# Active = not yet closed (new / assigned / dispatched ...)
+CLOSED_STATUSES = ("resolved",)
+
+# ISO timestamp → minutes since epoch (julianday accepts the 'T' form)
+_T = "((julianday({col}) - 2440587.5) * 1440.0)"
+
+_INSERT_BOX = """
+    INSERT INTO calls_rtree (id, min_lat, max_lat, min_lng, max_lng, min_t, max_t)
+    SELECT NEW.id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude,
+           {t}, {t}
+    WHERE NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL;
+""".format(t=_T.format(col="NEW.timestamp"))
+
+
+def init_spatial_index(conn=None):
+    """
+    Create the R*Tree + sync triggers (idempotent) and backfill rows
+    that predate it.
+    """
+    own = conn is None
+    conn = conn or get_connection()
+    cur = conn.cursor()
+
+    cur.execute("""
+    CREATE VIRTUAL TABLE IF NOT EXISTS calls_rtree USING rtree(
+        id, min_lat, max_lat, min_lng, max_lng, min_t, max_t
+    )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_calls_timestamp ON calls(timestamp)")
+
+    cur.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS calls_rtree_insert AFTER INSERT ON calls
+    BEGIN
+        {_INSERT_BOX}
+    END
+    """)
+    cur.execute(f"""
+    CREATE TRIGGER IF NOT EXISTS calls_rtree_update
+    AFTER UPDATE OF latitude, longitude, timestamp ON calls
+    BEGIN
+        DELETE FROM calls_rtree WHERE id = OLD.id;
+        {_INSERT_BOX}
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS calls_rtree_delete AFTER DELETE ON calls
+    BEGIN
+        DELETE FROM calls_rtree WHERE id = OLD.id;
+    END
+    """)
+
+    # Backfill geocoded calls not yet in the tree
+    t = _T.format(col="timestamp")
+    cur.execute(f"""
+        INSERT INTO calls_rtree (id, min_lat, max_lat, min_lng, max_lng, min_t, max_t)
+        SELECT id, latitude, latitude, longitude, longitude, {t}, {t}
+        FROM calls
+        WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+          AND timestamp IS NOT NULL
+          AND id NOT IN (SELECT id FROM calls_rtree)
+    """)
+
+    conn.commit()
+    if own:
+        conn.close()
+
+
+def _haversine_m(lat1, lng1, lat2, lng2):
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def check_nearby_query(lat: float, lng: float, radius_m: float, minutes: float):
+    """
+    Raises ValueError unless every argument is finite and in range
+    (NaN would slip through every comparison in the box query).
+    """
+    if not all(math.isfinite(v) for v in (lat, lng, radius_m, minutes)):
+        raise ValueError("lat, lng, radius_m and minutes must be finite numbers")
+    if not -90 <= lat <= 90:
+        raise ValueError("lat must be between -90 and 90")
+    if not -180 <= lng <= 180:
+        raise ValueError("lng must be between -180 and 180")
+    if not 0 < radius_m <= MAX_RADIUS_M:
+        raise ValueError(f"radius_m must be > 0 and <= {MAX_RADIUS_M:g}")
+    if not 0 < minutes <= MAX_MINUTES:
+        raise ValueError(f"minutes must be > 0 and <= {MAX_MINUTES:g}")
+
+
+def find_nearby_calls(
+    lat: float,
+    lng: float,
+    radius_m: float = 500,
+    minutes: float = 60,
+    include_closed: bool = False,
+    now: datetime = None
+):
+    """
+    Active calls within radius_m of (lat, lng) received in the last
+    `minutes`, nearest first, each with distance_m.
+    """
+    check_nearby_query(lat, lng, radius_m, minutes)
+    now = now or datetime.utcnow()
+    since = now - timedelta(minutes=minutes)
+    since_t = (since - datetime(1970, 1, 1)).total_seconds() / 60.0
+
+    dlat = radius_m / METRES_PER_DEG_LAT
+    dlng = radius_m / (METRES_PER_DEG_LAT * max(math.cos(math.radians(lat)), 1e-6))
+
+    status_sql = "" if include_closed else (
+        "AND (c.status IS NULL OR c.status NOT IN (%s))" % ",".join("?" * len(CLOSED_STATUSES))
+    )
+
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute(f"""
+        SELECT c.id, c.timestamp, c.emergency_type, c.priority,
+               c.location_text, c.latitude, c.longitude, c.status
+        FROM calls_rtree r
+        JOIN calls c ON c.id = r.id
+        WHERE r.max_lat >= ? AND r.min_lat <= ?
+          AND r.max_lng >= ? AND r.min_lng <= ?
+          AND r.max_t >= ?
+          AND c.timestamp >= ?
+          {status_sql}
+    """, (
+        lat - dlat, lat + dlat,
+        lng - dlng, lng + dlng,
+        since_t - 1,          # float32 slack; exact check on timestamp
+        since.isoformat(),
+        *(() if include_closed else CLOSED_STATUSES)
+    ))
+
+    rows = cur.fetchall()
+    conn.close()
+
+    calls = []
+    for row in rows:
+        distance = _haversine_m(lat, lng, row[5], row[6])
+        if distance > radius_m:
+            continue
+        calls.append({
+            "id": row[0],
+            "timestamp": row[1],
+            "emergency_type": row[2],
+            "priority": row[3],
+            "location_text": row[4],
+            "latitude": row[5],
+            "longitude": row[6],
+            "status": row[7],
+            "distance_m": round(distance, 1)
+        })
+
+    calls.sort(key=lambda c: c["distance_m"])
+    return calls
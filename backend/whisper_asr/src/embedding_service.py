@@ -0,0 +1,177 @@
+# whisper_asr/src/embedding_service.py
+
+"""
+Lazy, shared sentence-embedding service.
+
+- The sentence-transformer is loaded on FIRST use (not at import)
+  through src.model_registry, so every caller shares one copy
+- Template sets are registered at import (cheap) and encoded once,
+  on first use or in warm_up()
+- Template embeddings persist in an on-disk .npy store keyed by
+  model name + hash of the template list (memory-mapped on load);
+  editing a template list changes the hash → recomputed automatically
+- Engine: PyTorch sentence-transformers, or ONNX Runtime int8
+  (config.EMBEDDING_BACKEND, see onnx_embedder.py)
+"""
+
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import threading
+
+import numpy as np
+
+from src.config import EMBEDDING_CACHE_DIR, EMBEDDING_BACKEND
+from src.model_registry import get_sentence_model, get_onnx_sentence_model
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+
+class EmbeddingService:
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        cache_dir: str = EMBEDDING_CACHE_DIR,
+        backend: str = EMBEDDING_BACKEND
+    ):
+        self.model_name = model_name
+        self.cache_dir = cache_dir
+        self.backend = backend
+        self._backend_checked = False
+        self._templates = {}     # name → list of texts
+        self._embeddings = {}    # name → encoded tensor
+        self._lock = threading.Lock()
+
+    def _resolve_backend(self):
+        """
+        Settle the engine before anything is keyed on it: "onnx" without
+        onnxruntime / transformers installed → "torch", decided up front.
+        """
+        if not self._backend_checked:
+            self._backend_checked = True
+            if self.backend == "onnx" and not all(
+                importlib.util.find_spec(mod) for mod in ("onnxruntime", "transformers")
+            ):
+                print("⚠️  onnxruntime / transformers not installed, falling back to PyTorch")
+                self.backend = "torch"
+        return self.backend
+
+    @property
+    def model(self):
+        if self._resolve_backend() == "onnx":
+            try:
+                return get_onnx_sentence_model(self.model_name)
+            except Exception as e:
+                print(f"⚠️  ONNX embedder unavailable ({e}), falling back to PyTorch")
+                self.backend = "torch"
+        return get_sentence_model(self.model_name)
+
+    @property
+    def model_id(self):
+        # int8 ONNX vectors differ slightly → separate template cache
+        return self.model_name + ("__onnx-int8" if self.backend == "onnx" else "")
+
+    def encode(self, texts, **kwargs):
+        # torch engine → tensors (as before); ONNX engine → NumPy, so
+        # inference never imports torch
+        kwargs.setdefault("convert_to_tensor", self._resolve_backend() == "torch")
+        return self.model.encode(texts, **kwargs)
+
+    @staticmethod
+    def cos_sim(a, b):
+        """
+        Cosine-similarity matrix (NumPy) for 1-D / 2-D embeddings;
+        accepts NumPy arrays or CPU tensors, never imports torch.
+        """
+        a = np.atleast_2d(np.asarray(a, dtype=np.float32))
+        b = np.atleast_2d(np.asarray(b, dtype=np.float32))
+        a = a / np.maximum(np.linalg.norm(a, axis=1, keepdims=True), 1e-12)
+        b = b / np.maximum(np.linalg.norm(b, axis=1, keepdims=True), 1e-12)
+        return a @ b.T
+
+    def register_templates(self, name: str, texts: list):
+        """
+        Declare a template set; encoding is deferred until needed.
+        """
+        with self._lock:
+            if self._templates.get(name) != list(texts):
+                self._templates[name] = list(texts)
+                self._embeddings.pop(name, None)
+
+    def _cache_path(self, name: str, texts: list):
+        digest = hashlib.sha1(
+            json.dumps([self.model_id, texts]).encode("utf-8")
+        ).hexdigest()[:16]
+        prefix = re.sub(r"[^A-Za-z0-9_.-]+", "_", f"{self.model_id}__{name}")
+        return os.path.join(self.cache_dir, f"{prefix}__{digest}.npy"), prefix
+
+    def _load_or_encode(self, name: str):
+        texts = self._templates[name]
+
+        if not self.cache_dir:
+            return self.encode(texts, convert_to_tensor=False)
+
+        # Key on the engine that will actually encode
+        self._resolve_backend()
+        path, prefix = self._cache_path(name, texts)
+        if os.path.exists(path):
+            try:
+                return np.load(path, mmap_mode="r")
+            except (OSError, ValueError):
+                pass   # corrupt / partial file → re-encode below
+
+        emb = np.asarray(self.encode(texts, convert_to_tensor=False), dtype=np.float32)
+
+        # The ONNX load itself can still fail over to torch → re-key
+        path, prefix = self._cache_path(name, texts)
+
+        # Atomic write, then drop stale hashes of the same template set
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, emb)
+        os.replace(tmp, path)
+
+        for old in glob.glob(os.path.join(self.cache_dir, f"{glob.escape(prefix)}__*.npy")):
+            if old != path:
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+
+        return np.load(path, mmap_mode="r")
+
+    def template_embeddings(self, name: str):
+        emb = self._embeddings.get(name)
+        if emb is not None:
+            return emb
+
+        with self._lock:
+            emb = self._embeddings.get(name)
+            if emb is None:
+                emb = self._load_or_encode(name)
+                self._embeddings[name] = emb
+            return emb
+
+    def warm_up(self):
+        """
+        Load (from disk) or encode every registered template set now
+        (e.g. at server start) instead of on the first fallback.
+        """
+        for name in list(self._templates):
+            self.template_embeddings(name)
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def get_embedding_service(model_name: str = DEFAULT_MODEL, backend: str = EMBEDDING_BACKEND) -> EmbeddingService:
+    with _services_lock:
+        key = (model_name, backend)
+        if key not in _services:
+            _services[key] = EmbeddingService(model_name, backend=backend)
+        return _services[key]
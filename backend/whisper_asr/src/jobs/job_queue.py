@@ -0,0 +1,221 @@
+# src/jobs/job_queue.py
+
+"""
+Durable SQLite-backed job queue (same DB as calls).
+
+Job lifecycle:
+    queued → running → done
+                     ↘ failed (after MAX_ATTEMPTS, else back to queued,
+                       claimable again after an exponential backoff)
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from src.db.database import get_connection
+
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SEC = 5.0   # 5s, 10s, 20s ... before a failed job is retried
+
+
+def _now():
+    return datetime.utcnow().isoformat()
+
+
+def init_jobs_table():
+    conn = get_connection()
+    cur = conn.cursor()
+
+    # WAL → webhook inserts don't block on workers reading/updating
+    cur.execute("PRAGMA journal_mode=WAL")
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT NOT NULL,
+        payload TEXT,
+        status TEXT DEFAULT 'queued',
+        stage TEXT,
+        attempts INTEGER DEFAULT 0,
+        error TEXT,
+        result TEXT,
+        worker TEXT,
+        created_at TEXT,
+        started_at TEXT,
+        finished_at TEXT
+    )
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, id)")
+
+    # Added after the first release → add to older DBs in place
+    cur.execute("PRAGMA table_info(jobs)")
+    if "available_at" not in [row[1] for row in cur.fetchall()]:
+        cur.execute("ALTER TABLE jobs ADD COLUMN available_at TEXT")
+
+    conn.commit()
+    conn.close()
+
+
+def enqueue_job(kind: str, payload: dict) -> int:
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute("""
+        INSERT INTO jobs (kind, payload, status, created_at)
+        VALUES (?, ?, 'queued', ?)
+    """, (kind, json.dumps(payload), _now()))
+
+    job_id = cur.lastrowid
+    conn.commit()
+    conn.close()
+    return job_id
+
+
+def claim_next_job(worker: str, kind: str = None):
+    """
+    Atomically move the oldest queued job to 'running'.
+    Returns the job dict, or None if the queue is empty.
+    """
+    conn = get_connection()
+    conn.isolation_level = None
+    cur = conn.cursor()
+
+    # Retries still backing off are skipped until available_at
+    ready = "status = 'queued' AND (available_at IS NULL OR available_at <= ?)"
+
+    try:
+        # IMMEDIATE → take the write lock before reading, so two
+        # workers can never claim the same row
+        cur.execute("BEGIN IMMEDIATE")
+
+        if kind:
+            cur.execute(f"""
+                SELECT id FROM jobs WHERE {ready} AND kind = ?
+                ORDER BY id LIMIT 1
+            """, (_now(), kind))
+        else:
+            cur.execute(f"""
+                SELECT id FROM jobs WHERE {ready}
+                ORDER BY id LIMIT 1
+            """, (_now(),))
+
+        row = cur.fetchone()
+        if not row:
+            cur.execute("COMMIT")
+            return None
+
+        cur.execute("""
+            UPDATE jobs
+            SET status = 'running', worker = ?, started_at = ?,
+                attempts = attempts + 1, stage = 'claimed'
+            WHERE id = ?
+        """, (worker, _now(), row[0]))
+        cur.execute("COMMIT")
+    except Exception:
+        # BEGIN itself may have failed ("database is locked") → nothing to undo
+        if conn.in_transaction:
+            cur.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+    return get_job(row[0])
+
+
+def update_job_stage(job_id: int, stage: str):
+    conn = get_connection()
+    conn.execute("UPDATE jobs SET stage = ? WHERE id = ?", (stage, job_id))
+    conn.commit()
+    conn.close()
+
+
+def complete_job(job_id: int, result: dict = None):
+    conn = get_connection()
+    conn.execute("""
+        UPDATE jobs
+        SET status = 'done', stage = 'done', result = ?, finished_at = ?
+        WHERE id = ?
+    """, (json.dumps(result) if result is not None else None, _now(), job_id))
+    conn.commit()
+    conn.close()
+
+
+def fail_job(job_id: int, error: str):
+    """
+    Requeue (after RETRY_BACKOFF_SEC * 2^(attempts-1)) until
+    MAX_ATTEMPTS, then mark failed.
+    """
+    conn = get_connection()
+    row = conn.execute("SELECT attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    attempts = row[0] if row else MAX_ATTEMPTS
+
+    retry_at = (
+        datetime.utcnow() + timedelta(seconds=RETRY_BACKOFF_SEC * 2 ** max(attempts - 1, 0))
+    ).isoformat()
+
+    conn.execute("""
+        UPDATE jobs
+        SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END,
+            error = ?,
+            finished_at = CASE WHEN attempts >= ? THEN ? ELSE NULL END,
+            available_at = CASE WHEN attempts >= ? THEN NULL ELSE ? END
+        WHERE id = ?
+    """, (MAX_ATTEMPTS, error, MAX_ATTEMPTS, _now(), MAX_ATTEMPTS, retry_at, job_id))
+    conn.commit()
+    conn.close()
+
+
+def requeue_stale_jobs():
+    """
+    Jobs left 'running' by a crashed process go back to the queue.
+    Call once at startup, before workers start.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("UPDATE jobs SET status = 'queued', stage = 'requeued' WHERE status = 'running'")
+    count = cur.rowcount
+    conn.commit()
+    conn.close()
+    return count
+
+
+def get_job(job_id: int):
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute("""
+        SELECT id, kind, payload, status, stage, attempts, error, result,
+               worker, created_at, started_at, finished_at
+        FROM jobs
+        WHERE id = ?
+    """, (job_id,))
+
+    row = cur.fetchone()
+    conn.close()
+
+    if not row:
+        return None
+
+    return {
+        "id": row[0],
+        "kind": row[1],
+        "payload": json.loads(row[2]) if row[2] else {},
+        "status": row[3],
+        "stage": row[4],
+        "attempts": row[5],
+        "error": row[6],
+        "result": json.loads(row[7]) if row[7] else None,
+        "worker": row[8],
+        "created_at": row[9],
+        "started_at": row[10],
+        "finished_at": row[11]
+    }
+
+
+def count_jobs_by_status():
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+    counts = dict(cur.fetchall())
+    conn.close()
+    return counts
@@ -0,0 +1,62 @@
+# src/jobs/worker.py
+
+import threading
+import time
+import traceback
+
+from src.jobs.job_queue import claim_next_job, complete_job, fail_job
+
+
+class JobWorker(threading.Thread):
+    """
+    Background thread that drains the SQLite job queue.
+
+    handler(job) → result dict (stored on the job) or raises.
+    """
+
+    def __init__(self, name: str, handler, kind: str = None, poll_sec: float = 1.0):
+        super().__init__(name=name, daemon=True)
+        self.handler = handler
+        self.kind = kind
+        self.poll_sec = poll_sec
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self._run_once()
+            except Exception as e:
+                # e.g. "database is locked" → log, back off, keep draining
+                print(f"⚠️  [{self.name}] queue error: {type(e).__name__}: {e}")
+                self._stop_event.wait(self.poll_sec)
+
+    def _run_once(self):
+        job = claim_next_job(self.name, self.kind)
+
+        if not job:
+            self._stop_event.wait(self.poll_sec)
+            return
+
+        print(f"⚙️  [{self.name}] job {job['id']} ({job['kind']}) started")
+        start = time.time()
+
+        try:
+            result = self.handler(job)
+            complete_job(job["id"], result)
+            print(f"✅ [{self.name}] job {job['id']} done in {time.time() - start:.1f}s")
+        except Exception as e:
+            traceback.print_exc()
+            fail_job(job["id"], f"{type(e).__name__}: {e}")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def start_workers(handler, count: int = 1, kind: str = None):
+    workers = [
+        JobWorker(f"worker-{i}", handler, kind=kind)
+        for i in range(count)
+    ]
+    for w in workers:
+        w.start()
+    return workers
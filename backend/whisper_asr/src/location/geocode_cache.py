@@ -0,0 +1,172 @@
+# whisper_asr/src/location/geocode_cache.py
+
+"""
+Two-level geocode cache: in-process LRU on top of a SQLite table
+(same DB as calls, so it survives restarts and is shared by workers).
+
+- Keyed by the normalised query (case / whitespace / punctuation folded)
+- Positive results expire after GEOCODE_CACHE_TTL_SEC
+- ZERO_RESULTS is cached too (result = None) with a shorter TTL, so a
+  place Google doesn't know isn't looked up on every call
+- Transient failures (network, OVER_QUERY_LIMIT, ...) are never cached
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from src.config import GEOCODE_CACHE_TTL_SEC, GEOCODE_NEGATIVE_TTL_SEC, GEOCODE_LRU_SIZE
+from src.db.database import get_connection
+
+_MISSING = object()
+
+
+def normalize_query(text: str) -> str:
+    text = re.sub(r"[^\w\s]+", " ", text.lower())
+    return " ".join(text.split())
+
+
+class GeocodeCache:
+    def __init__(
+        self,
+        ttl: float = GEOCODE_CACHE_TTL_SEC,
+        negative_ttl: float = GEOCODE_NEGATIVE_TTL_SEC,
+        lru_size: int = GEOCODE_LRU_SIZE
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.lru_size = lru_size
+
+        self._lru = OrderedDict()   # key → (expires_at, result)
+        self._lock = threading.Lock()
+        self._table_ready = False
+
+        self.stats = {"lru_hits": 0, "db_hits": 0, "negative_hits": 0, "misses": 0, "stores": 0}
+
+    # -----------------------------
+    # SQLite layer
+    # -----------------------------
+    def _ensure_table(self, conn):
+        if self._table_ready:
+            return
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS geocode_cache (
+            query TEXT PRIMARY KEY,
+            result TEXT,
+            created_at REAL,
+            expires_at REAL
+        )
+        """)
+        conn.commit()
+        self._table_ready = True
+
+    def _db_get(self, key: str):
+        conn = get_connection()
+        try:
+            self._ensure_table(conn)
+            row = conn.execute(
+                "SELECT result, expires_at FROM geocode_cache WHERE query = ?", (key,)
+            ).fetchone()
+        finally:
+            conn.close()
+
+        if not row or row[1] < time.time():
+            return _MISSING, None
+        return (json.loads(row[0]) if row[0] else None), row[1]
+
+    def _db_put(self, key: str, result, expires_at: float):
+        conn = get_connection()
+        try:
+            self._ensure_table(conn)
+            conn.execute("""
+                INSERT OR REPLACE INTO geocode_cache (query, result, created_at, expires_at)
+                VALUES (?, ?, ?, ?)
+            """, (key, json.dumps(result) if result else None, time.time(), expires_at))
+            conn.commit()
+        finally:
+            conn.close()
+
+    # -----------------------------
+    # LRU layer
+    # -----------------------------
+    def _lru_put(self, key: str, result, expires_at: float):
+        with self._lock:
+            self._lru[key] = (expires_at, result)
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def lookup(self, query: str):
+        """
+        (hit, result): hit is False when the query has to go to the
+        network; on a hit, result is the dict or None (cached ZERO_RESULTS).
+        """
+        key = normalize_query(query)
+
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry and entry[0] >= time.time():
+                self._lru.move_to_end(key)
+                self.stats["lru_hits"] += 1
+                if entry[1] is None:
+                    self.stats["negative_hits"] += 1
+                return True, entry[1]
+            if entry:
+                del self._lru[key]
+
+        result, expires_at = self._db_get(key)
+        if result is _MISSING:
+            with self._lock:
+                self.stats["misses"] += 1
+            return False, None
+
+        self._lru_put(key, result, expires_at)
+        with self._lock:
+            self.stats["db_hits"] += 1
+            if result is None:
+                self.stats["negative_hits"] += 1
+        return True, result
+
+    def put(self, query: str, result):
+        """
+        Store a lookup result; None means ZERO_RESULTS (negative entry).
+        """
+        key = normalize_query(query)
+        expires_at = time.time() + (self.ttl if result else self.negative_ttl)
+
+        self._db_put(key, result, expires_at)
+        self._lru_put(key, result, expires_at)
+        with self._lock:
+            self.stats["stores"] += 1
+
+    def purge_expired(self) -> int:
+        conn = get_connection()
+        try:
+            self._ensure_table(conn)
+            cur = conn.execute("DELETE FROM geocode_cache WHERE expires_at < ?", (time.time(),))
+            conn.commit()
+            return cur.rowcount
+        finally:
+            conn.close()
+
+    def snapshot(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["lru_size"] = len(self._lru)
+        lookups = stats["lru_hits"] + stats["db_hits"] + stats["misses"]
+        stats["hit_rate"] = round((lookups - stats["misses"]) / lookups, 3) if lookups else 0.0
+        return stats
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_geocode_cache() -> GeocodeCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = GeocodeCache()
+        return _cache
@@ -0,0 +1,101 @@
+# whisper_asr/src/location/geocode_client.py
+
+"""
+Pooled, non-blocking HTTP client for network geocoders.
+
+- One requests.Session with a keep-alive connection pool → DNS + TLS
+  paid once per connection, not per lookup
+- Transport retries (connect errors, 5xx) with exponential backoff via
+  urllib3; OVER_QUERY_LIMIT / UNKNOWN_ERROR retried the same way
+- submit() runs a lookup on a small thread pool (GEOCODE_MAX_CONCURRENCY
+  in flight at most) and returns a Future, so callers (ASR workers)
+  never block on the network
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import (
+    GEOCODE_MAX_CONCURRENCY,
+    GEOCODE_RETRIES,
+    GEOCODE_BACKOFF_SEC,
+    GEOCODE_TIMEOUT_SEC
+)
+
+RETRYABLE_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+
+
+class GeocodeClient:
+    def __init__(
+        self,
+        max_concurrency: int = GEOCODE_MAX_CONCURRENCY,
+        retries: int = GEOCODE_RETRIES,
+        backoff: float = GEOCODE_BACKOFF_SEC,
+        timeout: float = GEOCODE_TIMEOUT_SEC
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_concurrency,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"])
+            )
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="geocode"
+        )
+
+    def get_json(self, url: str, params: dict):
+        """
+        GET → (status, data). status is the API "status" field, or
+        "ERROR" when the request failed after all retries.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+                data = response.json()
+            except (requests.RequestException, ValueError) as e:
+                print(f"⚠️  Geocoding failed: {e}")
+                return "ERROR", None
+
+            status = data.get("status")
+            if status not in RETRYABLE_STATUSES or attempt == self.retries:
+                return status, data
+
+            time.sleep(self.backoff * (2 ** attempt))
+
+        return "ERROR", None
+
+    def submit(self, fn, *args):
+        return self.executor.submit(fn, *args)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_geocode_client() -> GeocodeClient:
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GeocodeClient()
+        return _client
@@ -1,33 +1,270 @@
+# whisper_asr/src/location/geocoder.py
+
+"""
+Pluggable geocoders.
+
+Every backend returns the same dict (or None on a miss):
+{formatted_address, lat, lng, place_id, confidence, source}
+
+- pincode: bundled PIN → centroid table (pincode_index), microseconds
+- offline: bundled places table (place_index + fuzzy landmark_index),
+  no key / network, microseconds
+- google:  Google Geocoding API behind the persistent geocode cache
+The configured chain (config.GEOCODERS) tries each in order, so most
+calls never leave the box and Google only sees the misses. A weak local
+answer (partial token cover, district centroid) below
+CHAIN_MIN_CONFIDENCE is kept only as a fallback: the chain goes on and a
+later geocoder's answer wins.
+
+geocode_location_async() answers local hits inline and hands network
+lookups to the pooled geocode_client → a Future.
+"""
+
 import os
-import requests
+import re
+from concurrent.futures import Future
+
+from src.config import GEOCODERS
+from src.location.geocode_cache import get_geocode_cache
+from src.location.geocode_client import get_geocode_client
+from src.location.landmark_index import get_landmark_index
+from src.location.pincode_index import get_pincode_index
+from src.location.place_index import get_place_index, normalize_place
 
 GOOGLE_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
+# Overridable so a local stand-in server can replace Google
+GEOCODE_API_URL = os.getenv(
+    "GEOCODE_API_URL", "https://maps.googleapis.com/maps/api/geocode/json"
+)
 
-def geocode_location(location_text: str):
+# Below this a hit doesn't end the chain (see module docstring)
+CHAIN_MIN_CONFIDENCE = 0.85
+
+
+class Geocoder:
     """
-    Converts text location into lat/lng using Google Maps
+    Minimal interface every geocoder implements.
     """
-    if not location_text or not GOOGLE_API_KEY:
+
+    name = "base"
+    local = False   # True → in-process, cheap enough to run inline
+
+    def geocode(self, location_text: str):
+        raise NotImplementedError
+
+
+class PincodeGeocoder(Geocoder):
+    name = "pincode"
+    local = True
+
+    PIN_RE = re.compile(r"\b([1-9][0-9]{5})\b")
+
+    def __init__(self):
+        self.pins = get_pincode_index()
+
+    def geocode(self, location_text: str):
+        match = self.PIN_RE.search(location_text)
+        entry = self.pins.lookup(match.group(1)) if match else None
+        if entry is None:
+            return None
+
+        area = entry["locality"] or entry["district"]
+        return {
+            "formatted_address": f"{area}, {entry['pincode']}, India",
+            "lat": entry["lat"],
+            "lng": entry["lng"],
+            "place_id": f"pin:{entry['pincode']}",
+            "confidence": entry["confidence"],
+            "source": self.name
+        }
+
+
+class OfflineGeocoder(Geocoder):
+    name = "offline"
+    local = True
+
+    def __init__(self):
+        self.places = get_place_index()
+        self.fuzzy = get_landmark_index()
+
+    def geocode(self, location_text: str):
+        place = self.places.lookup(location_text)
+
+        # Misspelled names ("Koramangla") → phonetic trigram index
+        if place is None:
+            place = self.fuzzy.lookup(normalize_place(location_text))
+            if place is None or place["lat"] is None:
+                return None
+            place = {**place, "confidence": round(0.9 * place["confidence"], 2)}
+
+        return {
+            "formatted_address": f"{place['name']}, Bangalore, Karnataka, India",
+            "lat": place["lat"],
+            "lng": place["lng"],
+            "place_id": "local:" + normalize_place(place["name"]).replace(" ", "-"),
+            "confidence": place["confidence"],
+            "source": self.name
+        }
+
+
+class GoogleGeocoder(Geocoder):
+    name = "google"
+
+    def _request(self, location_text: str):
+        """
+        One HTTP lookup → (status, result). result is None unless status == "OK".
+        """
+        params = {
+            "address": location_text,
+            "key": GOOGLE_API_KEY
+        }
+
+        # Keep-alive session, transport + quota retries with backoff
+        status, data = get_geocode_client().get_json(GEOCODE_API_URL, params)
+        if status != "OK":
+            return status, None
+
+        result = data["results"][0]
+
+        return status, {
+            "formatted_address": result["formatted_address"],
+            "lat": result["geometry"]["location"]["lat"],
+            "lng": result["geometry"]["location"]["lng"],
+            "place_id": result["place_id"],
+            "confidence": 0.9,
+            "source": self.name
+        }
+
+    def geocode(self, location_text: str):
+        if not GOOGLE_API_KEY:
+            return None
+
+        cache = get_geocode_cache()
+        hit, cached = cache.lookup(location_text)
+        if hit:
+            return cached
+
+        status, result = self._request(location_text)
+
+        # Only definitive answers are cached; quota/network errors retry
+        if status in ("OK", "ZERO_RESULTS"):
+            cache.put(location_text, result)
+
+        return result
+
+
+class ChainGeocoder(Geocoder):
+    name = "chain"
+
+    def __init__(self, geocoders: list):
+        self.geocoders = geocoders
+
+    def geocode(self, location_text: str, start: int = 0, fallback=None):
+        for geocoder in self.geocoders[start:]:
+            result = geocoder.geocode(location_text)
+            if result:
+                if result["confidence"] >= CHAIN_MIN_CONFIDENCE:
+                    return result
+                fallback = result
+        return fallback
+
+    def geocode_async(self, location_text: str) -> Future:
+        """
+        Run the leading local geocoders inline; if they miss (or only
+        give a weak answer), continue the chain on the geocode thread
+        pool. Returns a Future.
+        """
+        i, fallback = 0, None
+        while i < len(self.geocoders) and self.geocoders[i].local:
+            result = self.geocoders[i].geocode(location_text)
+            if result:
+                if result["confidence"] >= CHAIN_MIN_CONFIDENCE:
+                    return _done(result)
+                fallback = result
+            i += 1
+
+        if i == len(self.geocoders):
+            return _done(fallback)
+        return get_geocode_client().submit(self.geocode, location_text, i, fallback)
+
+
+def _done(result) -> Future:
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+GEOCODERS_BY_NAME = {
+    PincodeGeocoder.name: PincodeGeocoder,
+    OfflineGeocoder.name: OfflineGeocoder,
+    GoogleGeocoder.name: GoogleGeocoder
+}
+
+
+def load_geocoder(names: list = GEOCODERS) -> Geocoder:
+    unknown = [n for n in names if n not in GEOCODERS_BY_NAME]
+    if unknown:
+        raise ValueError(f"Unknown geocoder(s): {unknown} (choose from {list(GEOCODERS_BY_NAME)})")
+    return ChainGeocoder([GEOCODERS_BY_NAME[n]() for n in names])
+
+
+_geocoder = None
+
+
+def get_geocoder() -> Geocoder:
+    global _geocoder
+    if _geocoder is None:
+        _geocoder = load_geocoder()
+    return _geocoder
+
+
+def location_query(location: dict):
+    """
+    Geocoder query for an extract_location() result, or None.
+    """
+    if not location:
         return None
+    if location.get("text"):
+        return location["text"] + ", Bangalore, India"
+    if location.get("pincode"):
+        return location["pincode"] + ", India"
+    return None
 
-    url = "https://maps.googleapis.com/maps/api/geocode/json"
-    params = {
-        "address": location_text,
-        "key": GOOGLE_API_KEY
-    }
 
-    response = requests.get(url, params=params, timeout=5)
-    data = response.json()
+def start_geocode(result: dict, wait: bool = False):
+    """
+    Geocode a pipeline result's classified location in place: local hits
+    land in analysis["geo"] inline, a network lookup still in flight is
+    left as result["geo_future"] unless wait=True. Unclassified calls
+    (analysis["location"] is None) are never looked up.
+    """
+    analysis = result["analysis"]
+    analysis["geo"] = None
 
-    if data.get("status") != "OK":
+    query = location_query(analysis.get("location"))
+    if query:
+        future = geocode_location_async(query)
+        if wait or future.done():
+            analysis["geo"] = future.result()
+        else:
+            result["geo_future"] = future
+    return result
+
+
+def geocode_location(location_text: str):
+    """
+    Converts text location / PIN into lat/lng (offline tables first,
+    then Google Maps through the persistent geocode cache)
+    """
+    if not location_text:
         return None
+    return get_geocoder().geocode(location_text)
 
-    result = data["results"][0]
 
-    return {
-        "formatted_address": result["formatted_address"],
-        "lat": result["geometry"]["location"]["lat"],
-        "lng": result["geometry"]["location"]["lng"],
-        "place_id": result["place_id"],
-        "confidence": 0.9
-    }
\ No newline at end of file
+def geocode_location_async(location_text: str) -> Future:
+    """
+    Non-blocking geocode_location → Future (already done for offline hits).
+    """
+    if not location_text:
+        return _done(None)
+    return get_geocoder().geocode_async(location_text)
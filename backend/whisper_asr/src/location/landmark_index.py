@@ -0,0 +1,174 @@
+"""
+Fuzzy local landmark / locality index.
+
+ASR often misspells Bangalore places ("Koramangla", "Jaya nagar").
+Names are folded to a phonetic key and indexed by character trigrams
+(inverted index). A lookup only scores entries that share trigrams with
+the query, then ranks them by edit-distance similarity → canonical name
+plus confidence, well under a millisecond for the bundled table.
+"""
+
+import csv
+import os
+import re
+from collections import defaultdict
+
+LANDMARKS_CSV = os.path.join(os.path.dirname(__file__), "data", "landmarks.csv")
+
+# Ordered: multi-letter folds before single letters
+_PHONETIC_FOLDS = [
+    ("aa", "a"), ("ee", "i"), ("oo", "u"), ("ou", "u"),
+    ("th", "t"), ("dh", "d"), ("bh", "b"), ("kh", "k"), ("gh", "g"),
+    ("ph", "f"), ("sh", "s"), ("ck", "k"), ("w", "v"), ("z", "j"),
+    ("q", "k"), ("y", "i")
+]
+
+
+def phonetic_key(text: str) -> str:
+    """
+    "Jaya nagar" / "Jayanagar" → same key; vowels kept (but folded),
+    spaces/punctuation dropped, doubled letters collapsed.
+    """
+    key = re.sub(r"[^a-z]", "", text.lower())
+    for src, dst in _PHONETIC_FOLDS:
+        key = key.replace(src, dst)
+    return re.sub(r"(.)\1+", r"\1", key)
+
+
+# Aliases are often abbreviations ("E City", "KIA") that sit one edit
+# away from everyday words ("the city") → stricter fuzzy thresholds
+ALIAS_EXACT_ONLY_LEN = 6       # phonetic key shorter than this → exact only
+SHORT_ALIAS_MIN_SCORE = 0.9    # aliases of ≤ 2 words
+
+
+def _alias_min_score(alias: str, key: str) -> float:
+    if len(key) < ALIAS_EXACT_ONLY_LEN:
+        return 1.0
+    if len(alias.split()) <= 2:
+        return SHORT_ALIAS_MIN_SCORE
+    return 0.0
+
+
+def _trigrams(key: str):
+    padded = f"^{key}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _similarity(a: str, b: str) -> float:
+    """
+    1 - Levenshtein(a, b) / max(len) (two-row DP, keys are short).
+    """
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+
+    return 1.0 - prev[-1] / max(len(a), len(b))
+
+
+class LandmarkIndex:
+    def __init__(self, rows):
+        """
+        rows: dicts with name, kind, lat, lng, aliases ("a|b")
+        """
+        self.entries = []                  # (key, canonical row, min score)
+        self.postings = defaultdict(list)  # trigram → [entry idx]
+
+        for row in rows:
+            place = {
+                "name": row["name"],
+                "kind": row.get("kind") or "landmark",
+                "lat": float(row["lat"]) if row.get("lat") else None,
+                "lng": float(row["lng"]) if row.get("lng") else None
+            }
+            aliases = [a for a in (row.get("aliases") or "").split("|") if a]
+
+            surfaces = [(row["name"], 0.0)] + [
+                (a, _alias_min_score(a, phonetic_key(a))) for a in aliases
+            ]
+            for surface, min_score in surfaces:
+                key = phonetic_key(surface)
+                if not key:
+                    continue
+                idx = len(self.entries)
+                self.entries.append((key, place, min_score))
+                for gram in _trigrams(key):
+                    self.postings[gram].append(idx)
+
+    @classmethod
+    def from_csv(cls, path: str = LANDMARKS_CSV):
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls(list(csv.DictReader(f)))
+
+    def names(self):
+        return sorted({place["name"] for _, place, _ in self.entries})
+
+    def lookup(self, query: str, min_confidence: float = 0.75):
+        """
+        Returns {name, kind, lat, lng, confidence} or None.
+        """
+        key = phonetic_key(query)
+        if len(key) < 3:
+            return None
+
+        grams = _trigrams(key)
+
+        # Candidate generation: shared-trigram counts
+        counts = defaultdict(int)
+        for gram in grams:
+            for idx in self.postings.get(gram, ()):
+                counts[idx] += 1
+
+        best, best_score = None, 0.0
+        for idx, shared in counts.items():
+            entry_key, place, entry_min = self.entries[idx]
+
+            # Cheap Dice filter before the edit distance
+            dice = 2 * shared / (len(grams) + len(entry_key) + 2)
+            if dice < 0.4:
+                continue
+
+            score = _similarity(key, entry_key)
+            if score < entry_min:
+                continue
+            if score > best_score:
+                best, best_score = place, score
+
+        if best is None or best_score < min_confidence:
+            return None
+
+        return {**best, "confidence": round(best_score, 2)}
+
+    def find_in_text(self, text: str, max_words: int = 4, min_confidence: float = 0.8):
+        """
+        Best landmark over all 1..max_words word windows of text.
+        """
+        words = re.findall(r"[a-z0-9']+", text.lower())
+        best = None
+
+        for i in range(len(words)):
+            for n in range(1, max_words + 1):
+                if i + n > len(words):
+                    break
+                match = self.lookup(" ".join(words[i:i + n]), min_confidence)
+                if match and (best is None or match["confidence"] > best["confidence"]):
+                    best = match
+
+        return best
+
+
+_index = None
+
+
+def get_landmark_index() -> LandmarkIndex:
+    global _index
+    if _index is None:
+        _index = LandmarkIndex.from_csv()
+    return _index
@@ -1,35 +1,82 @@
-def resolve_location(speech_location: dict | None, metadata: dict):
+from src.location.landmark_index import get_landmark_index
+from src.location.pincode_index import get_pincode_index
+
+
+def resolve_location(speech_location: dict | None, metadata: dict, transcript: str = None):
     """
     Industry-grade location resolution.
 
     Rules:
-    1. If speech gives a valid PIN → trust it
+    1. If speech gives a valid PIN → trust it (+ bundled PIN centroid)
     2. Else if speech gives place text → use it WITH metadata
-    3. Else → fallback to metadata region
+       (snapped to a canonical local landmark if one matches)
+    3. Else if the transcript fuzzily names a known landmark → use it
+    4. Else → fallback to metadata region
     """
 
     # 1️⃣ PIN code is strongest
     if speech_location and speech_location.get("pincode"):
-        return {
+        resolved = {
             "level": "precise",
             "pincode": speech_location["pincode"],
             "text": speech_location.get("text"),
             "confidence": speech_location.get("confidence", 0.8)
         }
 
+        # Offline PIN centroid (district centroid for unlisted PINs)
+        pin = get_pincode_index().lookup(speech_location["pincode"])
+        if pin:
+            resolved.update({
+                "area": pin["locality"],
+                "district": pin["district"],
+                "lat": pin["lat"],
+                "lng": pin["lng"],
+                "pin_match": pin["level"]
+            })
+
+        return resolved
+
+    index = get_landmark_index()
+
     # 2️⃣ Place name but no PIN
     if speech_location and speech_location.get("text"):
-        return {
+        resolved = {
             "level": "approx",
             "area": speech_location["text"],
             "city": metadata.get("city"),
             "confidence": 0.6
         }
 
-    # 3️⃣ Hard fallback (THIS IS REAL WORLD)
+        landmark = index.lookup(speech_location["text"])
+        if landmark:
+            resolved.update(_landmark_fields(landmark))
+
+        return resolved
+
+    # 3️⃣ Misspelled locality anywhere in the transcript
+    if transcript:
+        landmark = index.find_in_text(transcript)
+        if landmark:
+            return {
+                "level": "approx",
+                "area": landmark["name"],
+                "city": metadata.get("city"),
+                **_landmark_fields(landmark)
+            }
+
+    # 4️⃣ Hard fallback (THIS IS REAL WORLD)
     return {
         "level": "region",
         "region": metadata.get("region"),
         "city": metadata.get("city"),
         "confidence": 0.4
-    }
\ No newline at end of file
+    }
+
+
+def _landmark_fields(landmark: dict):
+    return {
+        "canonical": landmark["name"],
+        "lat": landmark["lat"],
+        "lng": landmark["lng"],
+        "confidence": round(0.6 + 0.3 * landmark["confidence"], 2)
+    }
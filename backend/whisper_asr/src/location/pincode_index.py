@@ -0,0 +1,167 @@
+# whisper_asr/src/location/pincode_index.py
+
+"""
+Offline India PIN code → centroid / locality lookup.
+
+Source of truth: data/pincodes.csv (approximate post-office-area
+centroids). On first use it is compiled into a compact structured
+array sorted by PIN (4 + 4 + 4 + 2 + 2 bytes per row) plus a small
+JSON string table, cached under PINCODE_CACHE_DIR and memory-mapped on
+every later load → no parsing at start-up, pages shared by workers.
+
+- Exact PIN → np.searchsorted (binary search), "level": "pincode"
+- Unknown PIN in a known sorting district (same first 3 digits) →
+  centroid of that district's PINs, lower confidence, "level": "district"
+"""
+
+import csv
+import glob
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from src.config import PINCODE_CACHE_DIR
+
+PINCODES_CSV = os.path.join(os.path.dirname(__file__), "data", "pincodes.csv")
+
+ROW_DTYPE = np.dtype([
+    ("pin", "<u4"),
+    ("lat", "<f4"),
+    ("lng", "<f4"),
+    ("locality", "<u2"),   # → strings
+    ("district", "<u2")    # → strings
+])
+
+
+def _compile(csv_path: str):
+    strings, string_ids = [], {}
+
+    def intern(s):
+        if s not in string_ids:
+            string_ids[s] = len(strings)
+            strings.append(s)
+        return string_ids[s]
+
+    rows = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            district = f"{row['district']}, {row['state']}"
+            rows.append((
+                int(row["pincode"]),
+                float(row["lat"]),
+                float(row["lng"]),
+                intern(row["locality"]),
+                intern(district)
+            ))
+
+    table = np.array(rows, dtype=ROW_DTYPE)
+    table.sort(order="pin")
+    return table, strings
+
+
+def load_pincode_table(csv_path: str = PINCODES_CSV, cache_dir: str = PINCODE_CACHE_DIR):
+    """
+    (mmap'd table, strings). Compiled cache is keyed by the CSV hash;
+    stale builds are removed.
+    """
+    if not cache_dir:
+        return _compile(csv_path)
+
+    with open(csv_path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:16]
+    path = os.path.join(cache_dir, f"pincodes__{digest}.npy")
+    names_path = path[:-4] + ".json"
+
+    if not (os.path.exists(path) and os.path.exists(names_path)):
+        table, strings = _compile(csv_path)
+
+        # Atomic writes, then drop older builds
+        os.makedirs(cache_dir, exist_ok=True)
+        for target, write in (
+            (names_path, lambda f: f.write(json.dumps(strings).encode("utf-8"))),
+            (path, lambda f: np.save(f, table))
+        ):
+            tmp = f"{target}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                write(f)
+            os.replace(tmp, target)
+
+        for old in glob.glob(os.path.join(cache_dir, "pincodes__*")):
+            if not old.startswith(path[:-4]):
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
+
+    with open(names_path, encoding="utf-8") as f:
+        strings = json.load(f)
+    return np.load(path, mmap_mode="r"), strings
+
+
+class PincodeIndex:
+    def __init__(self, table, strings):
+        self.table = table
+        self.pins = table["pin"]
+        self.strings = strings
+
+    @classmethod
+    def load(cls, csv_path: str = PINCODES_CSV, cache_dir: str = PINCODE_CACHE_DIR):
+        return cls(*load_pincode_table(csv_path, cache_dir))
+
+    def __len__(self):
+        return len(self.pins)
+
+    def lookup(self, pincode):
+        """
+        Returns {pincode, locality, district, lat, lng, level, confidence}
+        or None.
+        """
+        try:
+            pin = int(pincode)
+        except (TypeError, ValueError):
+            return None
+        if not 100000 <= pin <= 999999:
+            return None
+
+        i = int(np.searchsorted(self.pins, pin))
+        if i < len(self.pins) and self.pins[i] == pin:
+            row = self.table[i]
+            return {
+                "pincode": str(pin),
+                "locality": self.strings[row["locality"]],
+                "district": self.strings[row["district"]],
+                "lat": round(float(row["lat"]), 5),
+                "lng": round(float(row["lng"]), 5),
+                "level": "pincode",
+                "confidence": 0.9
+            }
+
+        # Same sorting district (first 3 digits) → district centroid
+        base = pin // 1000 * 1000
+        lo = int(np.searchsorted(self.pins, base))
+        hi = int(np.searchsorted(self.pins, base + 1000))
+        if lo >= hi:
+            return None
+
+        district = self.table[lo:hi]
+        return {
+            "pincode": str(pin),
+            "locality": None,
+            "district": self.strings[district["district"][0]],
+            "lat": round(float(district["lat"].mean()), 5),
+            "lng": round(float(district["lng"].mean()), 5),
+            "level": "district",
+            "confidence": 0.5
+        }
+
+
+_index = None
+
+
+def get_pincode_index() -> PincodeIndex:
+    global _index
+    if _index is None:
+        _index = PincodeIndex.load()
+    return _index
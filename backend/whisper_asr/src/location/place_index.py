@@ -0,0 +1,147 @@
+# whisper_asr/src/location/place_index.py
+
+"""
+Compact array-backed index over the bundled places table
+(data/landmarks.csv) for offline geocoding.
+
+Every surface form (name + aliases) is stored once, normalised, in a
+sorted NumPy string array → exact and prefix lookups are two
+np.searchsorted calls. Longer queries fall back to a token cover:
+every contiguous run of query tokens is looked up the same way, so
+"orion mall main gate" finds "Orion Mall" without scanning the table.
+Coordinates live in float arrays indexed by place id.
+"""
+
+import csv
+import re
+
+import numpy as np
+
+from src.location.landmark_index import LANDMARKS_CSV
+
+# Dropped from queries: the pipeline appends ", Bangalore, India"
+REGION_WORDS = {"bangalore", "bengaluru", "bengalooru", "karnataka", "india"}
+
+
+def normalize_place(text: str) -> str:
+    tokens = re.findall(r"[a-z0-9]+", text.lower())
+    return " ".join(t for t in tokens if t not in REGION_WORDS)
+
+
+class PlaceIndex:
+    def __init__(self, rows):
+        """
+        rows: dicts with name, kind, lat, lng, aliases ("a|b")
+        """
+        self.names, self.kinds, lat, lng = [], [], [], []
+        surfaces = []   # (normalised surface, place id)
+
+        for row in rows:
+            if not row.get("lat") or not row.get("lng"):
+                continue
+            place_id = len(self.names)
+            self.names.append(row["name"])
+            self.kinds.append(row.get("kind") or "landmark")
+            lat.append(float(row["lat"]))
+            lng.append(float(row["lng"]))
+
+            aliases = [a for a in (row.get("aliases") or "").split("|") if a]
+            for surface in {normalize_place(s) for s in [row["name"]] + aliases}:
+                if surface:
+                    surfaces.append((surface, place_id))
+
+        surfaces.sort()
+        self.lat = np.array(lat, dtype=np.float64)
+        self.lng = np.array(lng, dtype=np.float64)
+
+        # 1️⃣ Sorted surfaces → exact / prefix via binary search
+        self.surfaces = np.array([s for s, _ in surfaces])
+        self.surface_place = np.array([p for _, p in surfaces], dtype=np.int32)
+
+        # 2️⃣ Longest surface in tokens → widest window token_cover tries
+        self.max_ntokens = max((len(s.split()) for s, _ in surfaces), default=0)
+
+    @classmethod
+    def from_csv(cls, path: str = LANDMARKS_CSV):
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls(list(csv.DictReader(f)))
+
+    def _place(self, place_id: int, confidence: float):
+        return {
+            "name": self.names[place_id],
+            "kind": self.kinds[place_id],
+            "lat": float(self.lat[place_id]),
+            "lng": float(self.lng[place_id]),
+            "confidence": confidence
+        }
+
+    def _range(self, array, lo_key: str, hi_key: str):
+        return (
+            int(np.searchsorted(array, lo_key, side="left")),
+            int(np.searchsorted(array, hi_key, side="right"))
+        )
+
+    def exact(self, query: str):
+        lo, hi = self._range(self.surfaces, query, query)
+        return int(self.surface_place[lo]) if lo < hi else None
+
+    def prefix(self, query: str):
+        """
+        Place whose (shortest) surface starts with query ("orion" → Orion Mall).
+        """
+        lo, hi = self._range(self.surfaces, query, query + "\uffff")
+        if lo >= hi:
+            return None
+        best = min(range(lo, hi), key=lambda i: len(self.surfaces[i]))
+        return int(self.surface_place[best])
+
+    def token_cover(self, query: str):
+        """
+        (place id, tokens covered) for the first contiguous run of query
+        tokens that is a surface, or None. Earliest run wins, then the
+        longest one at that position, so the answer never depends on
+        set / hash order ("fire brigade near mg road" → MG Road).
+        """
+        tokens = query.split()
+        for start in range(len(tokens)):
+            widest = min(self.max_ntokens, len(tokens) - start)
+            for n in range(widest, 0, -1):
+                place_id = self.exact(" ".join(tokens[start:start + n]))
+                if place_id is not None:
+                    return place_id, n
+        return None
+
+    def lookup(self, text: str):
+        """
+        Returns {name, kind, lat, lng, confidence} or None.
+        """
+        query = normalize_place(text)
+        if not query:
+            return None
+
+        place_id = self.exact(query)
+        if place_id is not None:
+            return self._place(place_id, 0.95)
+
+        if len(query) >= 4:
+            place_id = self.prefix(query)
+            if place_id is not None:
+                return self._place(place_id, 0.85)
+
+        # Confidence falls with the share of query tokens left unmatched
+        cover = self.token_cover(query)
+        if cover is not None:
+            place_id, covered = cover
+            return self._place(place_id, round(0.5 + 0.35 * covered / len(query.split()), 2))
+
+        return None
+
+
+_index = None
+
+
+def get_place_index() -> PlaceIndex:
+    global _index
+    if _index is None:
+        _index = PlaceIndex.from_csv()
+    return _index
@@ -1,6 +1,6 @@
-from sentence_transformers import SentenceTransformer, util
+from src.embedding_service import get_embedding_service
 
-model = SentenceTransformer("all-MiniLM-L6-v2")
+embeddings = get_embedding_service("all-MiniLM-L6-v2")
 
 LOCATION_TEMPLATES = [
     "shopping mall",
@@ -16,13 +16,12 @@ LOCATION_TEMPLATES = [
     "office building"
 ]
 
-template_embeddings = model.encode(
-    LOCATION_TEMPLATES, convert_to_tensor=True
-)
+# Registered only — encoded lazily on first semantic_location / warm_up
+embeddings.register_templates("location", LOCATION_TEMPLATES)
 
 def semantic_location(text: str):
-    emb = model.encode(text, convert_to_tensor=True)
-    scores = util.cos_sim(emb, template_embeddings)[0]
+    emb = embeddings.encode(text)
+    scores = embeddings.cos_sim(emb, embeddings.template_embeddings("location"))[0]
 
     best_idx = scores.argmax().item()
     best_score = scores[best_idx].item()
@@ -0,0 +1,136 @@
+# whisper_asr/src/model_registry.py
+
+"""
+Process-wide model registry.
+
+Every heavy model (Whisper engines, sentence-transformers) is loaded
+lazily ONCE per (kind, name, device, options) and shared by the live
+pipeline, the offline pipeline and the Flask app.
+"""
+
+import threading
+import time
+
+_models = {}
+_lock = threading.Lock()
+_key_locks = {}
+
+
+def _param_bytes(obj, depth=0):
+    # PyTorch modules: exact size of parameters + buffers
+    if hasattr(obj, "parameters") and hasattr(obj, "buffers"):
+        try:
+            return sum(
+                t.numel() * t.element_size()
+                for t in list(obj.parameters()) + list(obj.buffers())
+            )
+        except Exception:
+            return None
+
+    # Wrappers (ASR backends) → look one level down
+    if depth < 2 and hasattr(obj, "model"):
+        return _param_bytes(obj.model, depth + 1)
+
+    return None
+
+
+def _rss_bytes():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+def get_model(kind: str, name: str, loader, device: str = "cpu", **options):
+    """
+    Return the shared instance for this key, calling loader() on first use.
+    """
+    key = (kind, name, device, tuple(sorted(options.items())))
+
+    entry = _models.get(key)
+    if entry:
+        return entry["model"]
+
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    # Per-key lock → concurrent first callers wait instead of double-loading
+    with key_lock:
+        entry = _models.get(key)
+        if entry:
+            return entry["model"]
+
+        rss_before = _rss_bytes()
+        start = time.time()
+        model = loader()
+        load_sec = time.time() - start
+        rss_after = _rss_bytes()
+
+        nbytes = _param_bytes(model)
+        if nbytes is None and rss_before is not None and rss_after is not None:
+            nbytes = max(rss_after - rss_before, 0)
+
+        _models[key] = {
+            "model": model,
+            "kind": kind,
+            "name": name,
+            "device": device,
+            "options": options,
+            "load_sec": round(load_sec, 2),
+            "bytes": nbytes
+        }
+
+        return model
+
+
+def get_asr_backend(backend: str, model_name: str, device: str = "cpu", compute_type: str = "int8"):
+    from src.asr.backends import load_backend
+
+    return get_model(
+        "asr",
+        model_name,
+        lambda: load_backend(backend, model_name, device, compute_type),
+        device=device,
+        backend=backend,
+        compute_type=compute_type
+    )
+
+
+def get_sentence_model(name: str = "all-MiniLM-L6-v2", device: str = "cpu"):
+    def load():
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(name, device=device)
+
+    return get_model("sentence", name, load, device=device)
+
+
+def get_onnx_sentence_model(name: str = "all-MiniLM-L6-v2", quantize: bool = True):
+    def load():
+        from src.onnx_embedder import OnnxSentenceEncoder
+        return OnnxSentenceEncoder(name, quantize=quantize)
+
+    return get_model("sentence-onnx", name, load, quantize=quantize)
+
+
+def resident_models():
+    """
+    Report loaded models and their (approximate) memory use.
+    """
+    return [
+        {
+            "kind": e["kind"],
+            "name": e["name"],
+            "device": e["device"],
+            "options": e["options"],
+            "load_sec": e["load_sec"],
+            "memory_mb": round(e["bytes"] / 2**20, 1) if e["bytes"] is not None else None
+        }
+        for e in _models.values()
+    ]
+
+
+def clear():
+    with _lock:
+        _models.clear()
+        _key_locks.clear()
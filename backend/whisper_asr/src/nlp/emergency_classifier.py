@@ -1,65 +1,72 @@
-from collections import defaultdict
-from .keyword_sets import EMERGENCY_KEYWORDS, PRIORITY_KEYWORDS
+from .keyword_matcher import KeywordMatcher
 from .location_extractor import extract_location
 from .semantic_fallback import semantic_classify
 
+# Semantic intent score needed when no keyword fired
+SEMANTIC_THRESHOLD = 0.6
+
 
 class EmergencyClassifier:
-    def classify(self, text: str):
+    def __init__(self):
+        # Compiled once; rebuilds if keyword_sets are re-bound
+        # (matcher.rebuild() after in-place edits)
+        self.matcher = KeywordMatcher()
+
+    def classify(self, text: str, location: dict = None):
+        """
+        location: precomputed extract_location() result (callers that
+        start geocoding before classification pass it in)
+        """
         if not text:
             return self._empty()
 
         text = text.lower()
-        scores = defaultdict(int)
-        keywords = []
 
         # ------------------------------------
         # 1️⃣ Keyword-based scoring (PRIMARY)
+        #    single pass: scores + keywords + priority
         # ------------------------------------
-        for etype, groups in EMERGENCY_KEYWORDS.items():
-            for kw in groups.get("strong", []):
-                if kw in text:
-                    scores[etype] += 3
-                    keywords.append(kw)
-
-            for kw in groups.get("weak", []):
-                if kw in text:
-                    scores[etype] += 1
-                    keywords.append(kw)
+        match = self.matcher.match(text)
+        scores = match["scores"]
 
-        location = extract_location(text)
+        if location is None:
+            location = extract_location(text)
 
         # ------------------------------------
         # 2️⃣ Semantic fallback (ONLY if no keywords)
         # ------------------------------------
         if not scores:
-            intent, score = semantic_classify(text)
+            return self.build_result(match, location, semantic_classify(text))
 
-            if score > 0.6:
-                return {
-                    "type": intent,
-                    "priority": "medium",
-                    "confidence": round(score, 2),
-                    "keywords": [],
-                    "location": location
-                }
+        return self.build_result(match, location)
 
-            return self._empty()
+    def build_result(self, match: dict, location, semantic: tuple = None):
+        """
+        Final classify() dict from a matcher summary (matcher.match /
+        matcher.summarize), plus the best semantic (intent, score) for
+        text without keyword hits. Shared with the incremental and bulk
+        re-analysis paths.
+        """
+        if match["scores"]:
+            return self._keyword_result(match, location)
+
+        if semantic and semantic[1] > SEMANTIC_THRESHOLD:
+            return self._semantic_result(semantic[0], semantic[1], location)
+
+        return self._empty()
 
+    def _keyword_result(self, match: dict, location):
         # ------------------------------------
         # 3️⃣ Pick best keyword-based intent
         # ------------------------------------
+        scores = match["scores"]
         etype = max(scores, key=scores.get)
         score = scores[etype]
 
         # ------------------------------------
-        # 4️⃣ Priority detection
+        # 4️⃣ Priority detection (from the same pass)
         # ------------------------------------
-        priority = "low"
-        for level, kws in PRIORITY_KEYWORDS.items():
-            if any(k in text for k in kws):
-                priority = level
-                break
+        priority = match["priority"] or "low"
 
         confidence = min(0.5 + 0.1 * score, 0.95)
 
@@ -67,7 +74,16 @@ class EmergencyClassifier:
             "type": etype,
             "priority": priority,
             "confidence": round(confidence, 2),
-            "keywords": list(set(keywords)),
+            "keywords": match["keywords"],
+            "location": location
+        }
+
+    def _semantic_result(self, intent: str, score: float, location):
+        return {
+            "type": intent,
+            "priority": "medium",
+            "confidence": round(score, 2),
+            "keywords": [],
             "location": location
         }
 
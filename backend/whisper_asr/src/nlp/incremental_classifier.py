@@ -0,0 +1,96 @@
+# whisper_asr/src/nlp/incremental_classifier.py
+
+from .emergency_classifier import EmergencyClassifier
+from .keyword_matcher import tokenize
+from .location_extractor import extract_location
+from .semantic_fallback import semantic_classify
+
+
+class IncrementalClassifier:
+    """
+    Streaming version of EmergencyClassifier.
+
+    update(new_text) takes ONLY newly committed text and keeps running
+    state, so per-chunk cost is proportional to the new text:
+    - keyword automaton state carries over → multi-word keywords split
+      across chunks ("heart | attack") still match
+    - distinct keywords / scores / priority accumulate
+    - location + semantic fallback look at new text + a short tail
+    """
+
+    def __init__(self, classifier: EmergencyClassifier = None, context_chars: int = 80):
+        self.classifier = classifier or EmergencyClassifier()
+        self.matcher = self.classifier.matcher
+        self.context_chars = context_chars
+        self.reset()
+
+    def reset(self):
+        self._state = 0
+        self._hits = {}            # distinct keyword ids, first-seen order
+        self._tail = ""
+        self._texts = []           # kept only to rescan if keyword_sets change
+        self._version = self.matcher.version
+        self.location = None
+        self._semantic = ("unknown", 0.0)
+
+    def _rescan(self):
+        # keyword_sets changed mid-call → ids are stale, rescan once
+        texts = self._texts
+        self._state, self._hits, self._version = 0, {}, self.matcher.version
+        for text in texts:
+            hits, self._state = self.matcher.scan(tokenize(text), self._state)
+            self._hits.update(dict.fromkeys(hits))
+
+    def update(self, new_text: str) -> dict:
+        """
+        Feed newly committed text; returns the same dict shape as
+        EmergencyClassifier.classify for the whole call so far.
+        """
+        if new_text:
+            new_text = new_text.lower()
+            self._texts.append(new_text)
+
+            if self.matcher.refresh() != self._version:
+                self._rescan()
+            else:
+                hits, self._state = self.matcher.scan(tokenize(new_text), self._state)
+                self._hits.update(dict.fromkeys(hits))
+
+            window = (self._tail + " " + new_text).strip()
+            self._tail = window[-self.context_chars:]
+
+            # Location: keep the most confident one seen so far, or a
+            # longer version of it once the next chunk completes it
+            location = extract_location(window)
+            if location and self._better_location(location):
+                self.location = location
+
+            # Semantic fallback only while no keyword has fired
+            match = self.matcher.summarize(self._hits)
+            if not match["scores"]:
+                intent, score = semantic_classify(window)
+                if score > self._semantic[1]:
+                    self._semantic = (intent, score)
+
+        return self.result()
+
+    def _better_location(self, location: dict) -> bool:
+        if not self.location:
+            return True
+
+        new_conf = location.get("confidence", 0)
+        old_conf = self.location.get("confidence", 0)
+        if new_conf != old_conf:
+            return new_conf > old_conf
+
+        new_text = (location.get("text") or "").lower()
+        old_text = (self.location.get("text") or "").lower()
+        return bool(old_text) and old_text in new_text and new_text != old_text
+
+    def result(self) -> dict:
+        match = self.matcher.summarize(self._hits)
+        result = self.classifier.build_result(match, self.location, self._semantic)
+
+        # Unclassified so far → still report the location heard
+        result["location"] = self.location
+        return result
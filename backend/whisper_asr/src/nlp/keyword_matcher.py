@@ -0,0 +1,229 @@
+# whisper_asr/src/nlp/keyword_matcher.py
+
+"""
+Single-pass keyword matcher (Aho-Corasick over word tokens).
+
+- Word-boundary aware: "fire" does NOT match "fired", "gas" not "vegas"
+- Inflections are explicit whole-token variants: -s / -ed / -ing of the
+  last word ("attacked", "leaking") plus keyword_sets.KEYWORD_FORMS
+  ("burnt", "threatening"); NO_INFLECTION keeps "fired" / "smoking" out
+- Multi-word keywords ("heart attack", "not breathing") are token paths
+- One linear scan returns type scores, matched keywords and priority
+- Rebuilt when keyword_sets are re-bound (identity check per match);
+  after editing the dicts in place, call rebuild()
+"""
+
+import re
+from collections import deque
+
+from . import keyword_sets
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STRONG_WEIGHT = 3
+WEAK_WEIGHT = 1
+
+
+def tokenize(text: str):
+    return TOKEN_RE.findall(text.lower())
+
+
+# Only pluralised: "fired" an employee, "smoking" a cigarette,
+# "stolen" / "missing" are already inflected
+NO_INFLECTION = {"fire", "smoke", "stolen", "fell", "missing", "dying", "gun", "gas"}
+
+
+def _inflections(word: str):
+    """
+    Regular forms of one word: plural, plus -ed / -ing ("attack" →
+    "attacks", "attacked", "attacking") unless in NO_INFLECTION.
+    """
+    forms = [] if word.endswith("s") else [word + "s"]
+    if word in NO_INFLECTION or len(word) < 4 or word.endswith(("ed", "ing")):
+        return forms
+    stem = word[:-1] if word.endswith("e") else word
+    return forms + [stem + "ed", stem + "ing"]
+
+
+def _variants(tokens: tuple, forms=()):
+    # Whole-token variants of the last word, so "fired" / "vegas" still
+    # never match
+    yield tokens
+    for last in _inflections(tokens[-1]) + list(forms):
+        yield tokens[:-1] + (last,)
+
+
+class KeywordMatcher:
+    """
+    Token-level Aho-Corasick automaton over EMERGENCY_KEYWORDS and
+    PRIORITY_KEYWORDS.
+
+    Scoring matches the original classifier: each distinct keyword adds
+    its weight once (strong=3, weak=1) to its emergency type.
+    """
+
+    def __init__(self, emergency_keywords=None, priority_keywords=None):
+        # None → follow keyword_sets (and pick up later edits)
+        self._emergency_src = emergency_keywords
+        self._priority_src = priority_keywords
+        self._built_from = (None, None)
+        self.version = 0           # bumped on every (re)build
+        self._ensure_built()
+
+    # --------------------------------------------------
+    # Build
+    # --------------------------------------------------
+    def _sources(self):
+        emergency = self._emergency_src
+        priority = self._priority_src
+        if emergency is None:
+            emergency = keyword_sets.EMERGENCY_KEYWORDS
+        if priority is None:
+            priority = keyword_sets.PRIORITY_KEYWORDS
+        return emergency, priority
+
+    def _ensure_built(self):
+        # Identity, not content: a couple of pointer compares per match
+        emergency, priority = self._sources()
+        if emergency is not self._built_from[0] or priority is not self._built_from[1]:
+            self._build(emergency, priority)
+            self._built_from = (emergency, priority)
+            self.version += 1
+
+    def _build(self, emergency: dict, priority: dict):
+        # keyword → [(kind, key, weight)]
+        tags = {}
+        self.type_order = list(emergency)
+        for etype, groups in emergency.items():
+            for kw in groups.get("strong", []):
+                tags.setdefault(kw, []).append(("type", etype, STRONG_WEIGHT))
+            for kw in groups.get("weak", []):
+                tags.setdefault(kw, []).append(("type", etype, WEAK_WEIGHT))
+
+        self.priority_order = list(priority)
+        for level, kws in priority.items():
+            for kw in kws:
+                tags.setdefault(kw, []).append(("priority", level, 0))
+
+        # Trie over tokens
+        self._goto = [{}]
+        self._out = [[]]
+        self._keywords = []
+
+        # A variant that is itself a keyword ("burning") stays that keyword
+        own = {tuple(tokenize(kw)) for kw in tags}
+
+        for kw, kw_tags in tags.items():
+            tokens = tuple(tokenize(kw))
+            if not tokens:
+                continue
+
+            kw_id = len(self._keywords)
+            self._keywords.append((kw, kw_tags))
+
+            forms = keyword_sets.KEYWORD_FORMS.get(kw, ())
+            for variant in _variants(tokens, forms):
+                if variant != tokens and variant in own:
+                    continue
+                state = 0
+                for tok in variant:
+                    nxt = self._goto[state].get(tok)
+                    if nxt is None:
+                        nxt = len(self._goto)
+                        self._goto[state][tok] = nxt
+                        self._goto.append({})
+                        self._out.append([])
+                    state = nxt
+                if kw_id not in self._out[state]:
+                    self._out[state].append(kw_id)
+
+        # Failure links (BFS)
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for tok, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and tok not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(tok, 0)
+                self._out[nxt] = self._out[nxt] + [
+                    k for k in self._out[self._fail[nxt]] if k not in self._out[nxt]
+                ]
+
+    def refresh(self) -> int:
+        """
+        Pick up re-bound keyword sets; returns the current build version
+        (callers holding scan state compare it to detect a rebuild).
+        """
+        self._ensure_built()
+        return self.version
+
+    def rebuild(self):
+        """
+        Recompile from the current keyword sets (after in-place edits).
+        """
+        self._built_from = (None, None)
+        self._ensure_built()
+
+    # --------------------------------------------------
+    # Match
+    # --------------------------------------------------
+    def scan(self, tokens, state: int = 0):
+        """
+        Advance the automaton over tokens.
+
+        Returns:
+            matched keyword ids (in order of occurrence), end state
+            (pass the end state back in to continue across chunks)
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = []
+
+        for tok in tokens:
+            while state and tok not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(tok, 0)
+            if out[state]:
+                hits.extend(out[state])
+
+        return hits, state
+
+    def summarize(self, kw_ids):
+        """
+        Distinct keyword ids → scores, keywords, priority.
+        """
+        scores = {}
+        keywords = []
+        levels = set()
+
+        for kw_id in kw_ids:
+            kw, kw_tags = self._keywords[kw_id]
+            counted = False
+            for kind, key, weight in kw_tags:
+                if kind == "type":
+                    scores[key] = scores.get(key, 0) + weight
+                    counted = True
+                else:
+                    levels.add(key)
+            if counted:
+                keywords.append(kw)
+
+        # Keyword-set order → same tie-breaking as the original classifier
+        scores = {t: scores[t] for t in self.type_order if t in scores}
+        priority = next((lvl for lvl in self.priority_order if lvl in levels), None)
+        return {"scores": scores, "keywords": keywords, "priority": priority}
+
+    def match(self, text: str) -> dict:
+        """
+        Returns:
+        {
+            scores: {etype: score},
+            keywords: matched emergency keywords (first-seen order),
+            priority: highest matched level, or None
+        }
+        """
+        self._ensure_built()
+        hits, _ = self.scan(tokenize(text))
+        return self.summarize(dict.fromkeys(hits))
@@ -40,4 +40,10 @@ PRIORITY_KEYWORDS = {
     "medium": [
         "pain", "fell", "fight", "stolen"
     ]
-}
\ No newline at end of file
+}
+# Irregular forms the matcher can't derive (-s / -ed / -ing are automatic)
+KEYWORD_FORMS = {
+    "burn": ["burnt"],
+    "threat": ["threaten", "threatens", "threatened", "threatening"],
+    "fight": ["fought"]
+}
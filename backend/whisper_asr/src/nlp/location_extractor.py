@@ -1,13 +1,27 @@
 import re
 
-PIN_REGEX = r"\b([1-9][0-9]{5})\b"
+PIN_REGEX = re.compile(r"\b([1-9][0-9]{5})\b")
 
 PLACE_SUFFIXES = [
     "street", "road", "lane", "avenue", "circle", "cross",
     "mall", "hospital", "college", "school", "university",
     "station", "airport", "temple", "church", "mosque",
-    "pg", "hostel", "apartment", "residency", "society",
-    "habitat", "illuminar", "rv", "R.V.", "college"
+    "pg", "hostel", "apartment", "apartments", "residency", "society",
+    "habitat", "illuminar", "rv", "R.V.", "colony", "layout", "campus"
+]
+# Deliberately NOT suffixes: "main", "park", "market", "nagar", "halli"
+# are everyday words / name fragments ("cannot park here", "main hall");
+# such places are caught by KNOWN_LANDMARKS or the fuzzy landmark index
+
+# Well-known Bangalore landmarks / localities, matched on their own
+KNOWN_LANDMARKS = [
+    "mg road", "brigade road", "church street", "majestic",
+    "koramangala", "indiranagar", "jayanagar", "whitefield",
+    "electronic city", "hsr layout", "btm layout", "marathahalli",
+    "hebbal", "yeshwanthpur", "malleshwaram", "basavanagudi",
+    "banashankari", "rajajinagar", "orion mall", "forum mall",
+    "phoenix marketcity", "kempegowda airport", "silk board",
+    "cubbon park", "lalbagh", "victoria hospital", "nimhans"
 ]
 
 STOPWORDS = {
@@ -15,53 +29,130 @@ STOPWORDS = {
     "come", "fast", "soon", "please",
     "near", "in", "on", "at", "live", "stay",
     "there", "here", "has", "have", "is", "are",
-    "only", "also", "near"
+    "only", "also", "near", "a", "an", "and", "my", "our",
+    "from", "of", "this", "that", "it", "we", "he", "she", "they",
+    "help", "quickly", "send", "someone", "behind", "opposite", "next"
 }
 
+MAX_NAME_TOKENS = 3
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+SEGMENT_RE = re.compile(r"[^.,!?;:\n]+")
+
+
+def _tokens(text: str):
+    return tuple(TOKEN_RE.findall(text.lower()))
+
+
+def _build_trie():
+    """
+    Token trie: {token: node}, node["$"] = kind ("suffix" | "landmark").
+    Built once at import.
+    """
+    root = {}
+    for kind, phrases in (("suffix", PLACE_SUFFIXES), ("landmark", KNOWN_LANDMARKS)):
+        for phrase in phrases:
+            node = root
+            for tok in _tokens(phrase):
+                node = node.setdefault(tok, {})
+            # a landmark that is also a suffix keeps "landmark"
+            if node.get("$") != "landmark":
+                node["$"] = kind
+    return root
+
+
+_TRIE = _build_trie()
+_MAX_PHRASE = max(len(_tokens(p)) for p in PLACE_SUFFIXES + KNOWN_LANDMARKS)
+
+
+def _candidates(original: str):
+    """
+    One left-to-right scan. Each trie walk is bounded by _MAX_PHRASE and
+    each name walk-back by MAX_NAME_TOKENS → O(n) overall, no regex
+    backtracking. Names and phrases never cross punctuation.
+
+    Known landmarks own their tokens: a suffix word inside one ("church"
+    in "church street", "road" in "mg road") is not a suffix hit, and a
+    walk-back stops where a landmark ends.
+
+    Yields (start_char, end_char, kind) in scan order.
+    """
+    lower = original.lower()
+
+    for seg in SEGMENT_RE.finditer(lower):
+        toks = [
+            (m.group(0), m.start(), m.end())
+            for m in TOKEN_RE.finditer(lower, seg.start(), seg.end())
+        ]
+        n = len(toks)
+
+        hits = []   # (first token, last token, kind)
+        for i in range(n):
+            node = _TRIE.get(toks[i][0])
+            j = i
+            while node is not None:
+                kind = node.get("$")
+                if kind:
+                    hits.append((i, j, kind))
+                j += 1
+                if j >= n or j - i >= _MAX_PHRASE:
+                    break
+                node = node.get(toks[j][0])
+
+        in_landmark = set()
+        for i, j, kind in hits:
+            if kind == "landmark":
+                in_landmark.update(range(i, j + 1))
+                yield toks[i][1], toks[j][2], "landmark"
+
+        for i, j, kind in hits:
+            if kind != "suffix" or in_landmark.intersection(range(i, j + 1)):
+                continue
+            # Walk back over the place name (no stopwords / landmarks)
+            k = i
+            while (
+                k > 0 and i - k < MAX_NAME_TOKENS
+                and toks[k - 1][0] not in STOPWORDS
+                and len(toks[k - 1][0]) >= 2
+                and k - 1 not in in_landmark
+            ):
+                k -= 1
+            if k < i:
+                yield toks[k][1], toks[j][2], "suffix"
+
 
 def extract_location(text: str):
     if not text:
         return None
 
     original = text.strip()
-    lower = original.lower()
 
     # --------------------------------------------------
-    # 1️⃣ ACRONYM + PLACE (BDA apartments, RV college)
+    # 1️⃣ Named place (Church Street, Orion Mall, RV college)
+    #    or known landmark (Koramangala) — earliest, then longest;
+    #    a landmark beats any suffix name overlapping it
     # --------------------------------------------------
-    acronym_pattern = re.compile(
-        r"\b([A-Z]{2,5})\s+(apartment|apartments|colony|layout|society|residency|pg|hostel|college|campus|hospital|mall)\b",
-        re.IGNORECASE
-    )
+    candidates = list(_candidates(original))
+    landmarks = [(s, e) for s, e, kind in candidates if kind == "landmark"]
 
-    match = acronym_pattern.search(original)
-    if match:
-        return {
-            "text": match.group(0).title(),
-            "confidence": 0.95
-        }
+    best = None
+    for start, end, kind in candidates:
+        if kind == "suffix" and any(s < end and start < e for s, e in landmarks):
+            continue
+        if best is None or start < best[0] or (start == best[0] and end > best[1]):
+            best = (start, end, kind)
 
-    # --------------------------------------------------
-    # 2️⃣ Named place (Church Street, Orion Mall)
-    # --------------------------------------------------
-    name_pattern = re.compile(
-        r"\b([a-z]{2,}(?:\s[a-z]{2,})*)\s("
-        + "|".join(PLACE_SUFFIXES)
-        + r")\b",
-        re.IGNORECASE
-    )
-
-    match = name_pattern.search(original)
-    if match:
+    if best:
+        start, end, kind = best
         return {
-            "text": match.group(0).title(),
+            "text": " ".join(w.capitalize() for w in original[start:end].split()),
             "confidence": 0.95
         }
 
     # --------------------------------------------------
-    # 3️⃣ PIN fallback
+    # 2️⃣ PIN fallback
     # --------------------------------------------------
-    pin_match = re.search(PIN_REGEX, lower)
+    pin_match = PIN_REGEX.search(original)
     if pin_match:
         return {
             "text": None,
@@ -69,4 +160,4 @@ def extract_location(text: str):
             "confidence": 0.8
         }
 
-    return None
\ No newline at end of file
+    return None
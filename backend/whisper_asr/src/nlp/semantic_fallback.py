@@ -1,6 +1,8 @@
-from sentence_transformers import SentenceTransformer, util
+import numpy as np
 
-model = SentenceTransformer("all-MiniLM-L6-v2")
+from src.embedding_service import get_embedding_service
+
+embeddings = get_embedding_service("all-MiniLM-L6-v2")
 
 INTENT_TEMPLATES = {
     "ambulance": [
@@ -24,19 +26,60 @@ INTENT_TEMPLATES = {
     ]
 }
 
-template_embeddings = {
-    k: model.encode(v, convert_to_tensor=True)
-    for k, v in INTENT_TEMPLATES.items()
-}
+# All templates as ONE set (grouped by intent, in dict order);
+# registered only — encoded lazily on first use / warm_up
+INTENTS = list(INTENT_TEMPLATES)
+TEMPLATE_TEXTS = [t for intent in INTENTS for t in INTENT_TEMPLATES[intent]]
+TEMPLATE_INTENT = np.array(
+    [i for i, intent in enumerate(INTENTS) for _ in INTENT_TEMPLATES[intent]]
+)
+# Column offset where each intent's templates start (for reduceat)
+_INTENT_STARTS = np.searchsorted(TEMPLATE_INTENT, np.arange(len(INTENTS)))
+
+embeddings.register_templates("intents", TEMPLATE_TEXTS)
+
+_matrix = None
+
+
+def _normalize(m: np.ndarray) -> np.ndarray:
+    m = np.asarray(m, dtype=np.float32)
+    return m / np.maximum(np.linalg.norm(m, axis=1, keepdims=True), 1e-12)
 
-def semantic_classify(text: str):
-    emb = model.encode(text, convert_to_tensor=True)
 
-    best = ("unknown", 0.0)
+def _template_matrix() -> np.ndarray:
+    """
+    (n_templates, dim) unit-norm matrix, built once.
+    """
+    global _matrix
+    if _matrix is None:
+        _matrix = _normalize(embeddings.template_embeddings("intents"))
+    return _matrix
 
-    for intent, t_emb in template_embeddings.items():
-        score = util.cos_sim(emb, t_emb).max().item()
-        if score > best[1]:
-            best = (intent, score)
 
-    return best
\ No newline at end of file
+def semantic_classify_batch(texts: list):
+    """
+    Encode all texts in one call and score every (text, template)
+    pair with a single matmul.
+
+    Returns:
+        [(intent, score)] in input order
+    """
+    if not texts:
+        return []
+
+    queries = _normalize(embeddings.encode(list(texts), convert_to_tensor=False))
+    sims = queries @ _template_matrix().T             # cosine similarities
+
+    # Max over each intent's contiguous block of columns
+    per_intent = np.maximum.reduceat(sims, _INTENT_STARTS, axis=1)
+    best = per_intent.argmax(axis=1)
+
+    results = []
+    for row, b in enumerate(best):
+        score = float(per_intent[row, b])
+        results.append((INTENTS[b], score) if score > 0 else ("unknown", 0.0))
+    return results
+
+
+def semantic_classify(text: str):
+    return semantic_classify_batch([text])[0]
\ No newline at end of file
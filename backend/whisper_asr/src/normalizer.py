@@ -2,27 +2,64 @@
 Text normalization utilities.
 
 - Converts Hindi (Devanagari) → Romanized English (ITRANS)
-- Leaves English text unchanged
-- Safe to use on mixed-language input
+- Converts Kannada → Romanized English (ITRANS)
+- Leaves English text unchanged (ASCII fast path, no transliteration)
+- Safe to use on mixed-language input: only Indic spans are touched
+- Memoized: the same string is never transliterated twice
 """
 
+import re
+from functools import lru_cache
+
 from indic_transliteration import sanscript
 from indic_transliteration.sanscript import transliterate
 
+# Unicode blocks → source scheme
+_SCRIPT_BLOCKS = (
+    ("\u0900", "\u097f", sanscript.DEVANAGARI),
+    ("\u0c80", "\u0cff", sanscript.KANNADA),
+)
+
+# One pass: runs of Devanagari OR runs of Kannada (incl. inner spaces)
+_INDIC_SPAN = re.compile(
+    "|".join(f"[{lo}-{hi}](?:[{lo}-{hi}\\s]*[{lo}-{hi}])?" for lo, hi, _ in _SCRIPT_BLOCKS)
+)
+
+
+def _scheme_for(char: str):
+    for lo, hi, scheme in _SCRIPT_BLOCKS:
+        if lo <= char <= hi:
+            return scheme
+    return None
+
+
+def _transliterate_span(match) -> str:
+    span = match.group(0)
+    try:
+        return transliterate(span, _scheme_for(span[0]), sanscript.ITRANS)
+    except Exception:
+        # If anything fails, keep the original span safely
+        return span
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(text: str) -> str:
+    return _INDIC_SPAN.sub(_transliterate_span, text)
+
 
 def normalize_text(text: str) -> str:
     """
     Normalize text for downstream NLP.
 
-    Hindi (देवनागरी) → romanized English
+    Hindi (देवनागरी) / Kannada (ಕನ್ನಡ) → romanized English
     English → unchanged
     """
     if not text or not isinstance(text, str):
         return text
 
-    try:
-        # If text contains Devanagari, transliterate it
-        return transliterate(text, sanscript.DEVANAGARI, sanscript.ITRANS)
-    except Exception:
-        # If anything fails, return original text safely
-        return text
\ No newline at end of file
+    # Fast path: pure ASCII needs no work (most Whisper output, since
+    # decoding is forced to English)
+    if text.isascii():
+        return text
+
+    return _normalize_cached(text)
@@ -0,0 +1,122 @@
+# whisper_asr/src/onnx_embedder.py
+
+"""
+ONNX Runtime backend for sentence embeddings (int8, CPU).
+
+First use exports the sentence-transformer's transformer to ONNX,
+quantizes the weights to int8 (dynamic quantization) and caches the
+result + tokenizer under ONNX_CACHE_DIR. Later processes only load
+the cached .onnx file — PyTorch is not needed at inference time.
+
+encode() mirrors SentenceTransformer.encode for the MiniLM family:
+mean pooling over the attention mask, then L2 normalisation.
+"""
+
+import os
+import re
+
+import numpy as np
+
+from src.config import ONNX_CACHE_DIR
+
+
+def _model_dir(model_name: str, cache_dir: str = ONNX_CACHE_DIR):
+    return os.path.join(cache_dir, re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name))
+
+
+def export_onnx(model_name: str, cache_dir: str = ONNX_CACHE_DIR, quantize: bool = True):
+    """
+    One-time export (+ int8 quantization). Returns the .onnx path to use.
+    """
+    out_dir = _model_dir(model_name, cache_dir)
+    fp32_path = os.path.join(out_dir, "model.onnx")
+    int8_path = os.path.join(out_dir, "model-int8.onnx")
+    target = int8_path if quantize else fp32_path
+
+    if os.path.exists(target):
+        return target
+
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    print(f"📦 Exporting {model_name} to ONNX (one-time)")
+    os.makedirs(out_dir, exist_ok=True)
+
+    st = SentenceTransformer(model_name, device="cpu")
+    transformer = st[0].auto_model.eval()
+    tokenizer = st.tokenizer
+    tokenizer.save_pretrained(out_dir)
+
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    input_names = [k for k in ("input_ids", "attention_mask", "token_type_ids") if k in sample]
+    dynamic = {k: {0: "batch", 1: "seq"} for k in input_names}
+    dynamic["last_hidden_state"] = {0: "batch", 1: "seq"}
+
+    if not os.path.exists(fp32_path):
+        tmp = fp32_path + ".tmp"
+        with torch.no_grad():
+            torch.onnx.export(
+                transformer,
+                tuple(sample[k] for k in input_names),
+                tmp,
+                input_names=input_names,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic,
+                opset_version=14
+            )
+        os.replace(tmp, fp32_path)
+
+    if quantize:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+
+        tmp = int8_path + ".tmp.onnx"
+        quantize_dynamic(fp32_path, tmp, weight_type=QuantType.QInt8)
+        os.replace(tmp, int8_path)
+
+    print(f"✅ ONNX model cached: {target}")
+    return target
+
+
+class OnnxSentenceEncoder:
+    def __init__(self, model_name: str, cache_dir: str = ONNX_CACHE_DIR, quantize: bool = True):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        path = export_onnx(model_name, cache_dir, quantize)
+
+        self.model_name = model_name
+        self.tokenizer = AutoTokenizer.from_pretrained(os.path.dirname(path))
+        self.session = ort.InferenceSession(path, providers=["CPUExecutionProvider"])
+        self._inputs = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, texts, convert_to_tensor: bool = False, batch_size: int = 32, **kwargs):
+        single = isinstance(texts, str)
+        if single:
+            texts = [texts]
+
+        out = []
+        for b in range(0, len(texts), batch_size):
+            enc = self.tokenizer(
+                texts[b:b + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=256,
+                return_tensors="np"
+            )
+            feeds = {k: v.astype(np.int64) for k, v in enc.items() if k in self._inputs}
+            hidden = self.session.run(None, feeds)[0]
+
+            # Mean pooling over real tokens, then L2 normalise
+            mask = enc["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            pooled /= np.maximum(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12)
+            out.append(pooled.astype(np.float32))
+
+        emb = np.concatenate(out) if out else np.zeros((0, 0), dtype=np.float32)
+        if single:
+            emb = emb[0]
+
+        if convert_to_tensor:
+            import torch
+            return torch.from_numpy(emb)
+        return emb
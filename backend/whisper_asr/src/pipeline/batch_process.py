@@ -0,0 +1,105 @@
+# src/pipeline/batch_process.py
+
+import json
+import os
+import time
+
+from src.pipeline.process_call import CallProcessor
+from src.streaming.audio_utils import load_audio
+from src.streaming.vad import EnergyVAD
+
+
+class BatchCheckpoint:
+    """
+    Append-only JSONL log of finished recordings.
+    One line per recording → a crash loses at most the current batch.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done = set()
+
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        self.done.add(json.loads(line)["audio_path"])
+
+    def record(self, entry: dict):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        self.done.add(entry["audio_path"])
+
+
+class BatchCallProcessor:
+    """
+    Re-transcribes many recordings with batched Whisper passes.
+
+    Steps (per batch of recordings):
+    1. Decode + VAD-trim every recording
+    2. ONE batched ASR call across all their 30 s windows
+    3. Same NLP/geo analysis as CallProcessor, per recording
+    """
+
+    def __init__(self, processor: CallProcessor = None, batch_size: int = 8):
+        self.processor = processor or CallProcessor()
+        self.batch_size = batch_size
+
+    def process_batch(self, wav_paths: list):
+        audios = []
+        vad_stats = []
+
+        for path in wav_paths:
+            audio = load_audio(path)
+            if self.processor.use_vad:
+                vad = EnergyVAD()
+                audio = vad.trim(audio)
+                vad_stats.append(vad.stats())
+            else:
+                vad_stats.append(None)
+            audios.append(audio)
+
+        transcripts = self.processor.asr.transcribe_batch(
+            audios, batch_size=self.batch_size
+        )
+
+        results = []
+        for path, (text, lang, _raw), stats in zip(wav_paths, transcripts, vad_stats):
+            result = self.processor.analyse_transcript(text, lang)
+            result["vad"] = stats
+            result["audio_path"] = path
+            results.append(result)
+
+        # Lookups ran alongside the rest of the batch; collect them now
+        for result in results:
+            geo_future = result.pop("geo_future", None)
+            if geo_future is not None:
+                result["analysis"]["geo"] = geo_future.result()
+
+        return results
+
+    def run(self, wav_paths: list, checkpoint: BatchCheckpoint, on_result=None):
+        """
+        Process every recording not yet in the checkpoint.
+        Returns (processed_count, elapsed_sec).
+        """
+        todo = [p for p in wav_paths if p not in checkpoint.done]
+        print(f"📦 {len(todo)} to process, {len(wav_paths) - len(todo)} already done")
+
+        start = time.time()
+        processed = 0
+
+        for b in range(0, len(todo), self.batch_size):
+            group = todo[b:b + self.batch_size]
+
+            for result in self.process_batch(group):
+                if on_result:
+                    on_result(result)
+                checkpoint.record(result)
+                processed += 1
+
+            print(f"✅ {processed}/{len(todo)} recordings")
+
+        return processed, time.time() - start
@@ -1,40 +1,190 @@
 # src/pipeline/process_call.py
 
+import time
+
 from src.asr_service import WhisperASRService
+from src.config import CASCADE_TRIAGE, TRIAGE_MODEL_NAME, TRIAGE_SECONDS
 from src.nlp.emergency_classifier import EmergencyClassifier
 from src.normalizer import normalize_text
-from src.location.geocoder import geocode_location
+from src.nlp.location_extractor import extract_location
+from src.location.geocoder import start_geocode
+from src.streaming.audio_utils import load_audio, SAMPLE_RATE
+from src.db.call_repository import upsert_call, update_call, update_call_geo
+from src.streaming.vad import EnergyVAD
 
 class CallProcessor:
     """
     Orchestrates the full offline call analysis pipeline.
 
     Steps:
-    1. Transcribe full audio (NO chunking)
+    0. Drop silence / hold noise (energy VAD)
+    1a. (cascade) Small model on the first seconds → provisional triage
+    1b. Transcribe full audio with the main model (NO chunking)
     2. Normalize language (Hindi/English safe)
     3. Classify emergency + extract location
     """
 
-    def __init__(self):
+    def __init__(self, use_vad: bool = True, cascade: bool = CASCADE_TRIAGE):
         self.asr = WhisperASRService()
+        self.cascade = cascade
+        self._triage_asr = None   # loaded on the first call with a triage consumer
         self.classifier = EmergencyClassifier()
+        self.use_vad = use_vad
+
+    @property
+    def triage_asr(self):
+        if self.cascade and self._triage_asr is None:
+            self._triage_asr = WhisperASRService(model_name=TRIAGE_MODEL_NAME)
+        return self._triage_asr
 
-    def process(self, wav_path: str):
+    def process(
+        self,
+        wav_path: str,
+        on_provisional=None,
+        wait_for_geo: bool = False,
+        geocode: bool = True
+    ):
         """
         Main entry point for:
         - run_call_analysis.py
         - Flask / Twilio webhook
 
+        on_provisional(result) is called with the fast triage result
+        (stage="provisional") before the full transcript is decoded;
+        without a consumer the triage pass is skipped entirely.
+        The triage never waits for geocoding; its lookup overlaps the
+        full decode and usually leaves the final one a cache hit.
+
+        Geocoding never holds the ASR thread: a lookup still in flight
+        comes back as result["geo_future"] (wait_for_geo=True blocks
+        on it instead). geocode=False leaves it to the caller
+        (start_geocode), as the process pool does in the parent.
+
         Returns a structured dict safe for dashboards / DB.
         """
+        start = time.time()
+        metrics = {}
 
         # -----------------------------
-        # 1️⃣ Speech-to-text (FULL AUDIO)
+        # 0️⃣ VAD (skip non-speech before ASR)
         # -----------------------------
-        text, detected_lang, raw_text = self.asr.transcribe(wav_path)
+        vad_stats = None
+
+        # Decoded in-process (no ffmpeg for WAV), reused by VAD + ASR
+        audio = load_audio(wav_path)
+
+        if self.use_vad:
+            vad = EnergyVAD()
+            audio = vad.trim(audio)
+            vad_stats = vad.stats()
+            print(f"🔇 VAD skipped {vad_stats['skipped_sec']}s of {vad_stats['total_sec']}s")
+
+        # -----------------------------
+        # 1️⃣a Fast triage (small model, first seconds only)
+        # -----------------------------
+        if self.cascade and on_provisional and len(audio):
+            head = audio[:int(TRIAGE_SECONDS * SAMPLE_RATE)]
+            text, detected_lang, raw_text = self.triage_asr.transcribe(head)
+
+            provisional = self.analyse_transcript(text, detected_lang, geocode=geocode)
+            provisional.pop("geo_future", None)
+            provisional["stage"] = "provisional"
+            provisional["vad"] = vad_stats
+
+            metrics["time_to_first_triage_sec"] = round(time.time() - start, 2)
+            print(
+                f"⚡ Provisional triage in {metrics['time_to_first_triage_sec']}s: "
+                f"{provisional['analysis']['type']} / {provisional['analysis']['priority']}"
+            )
+
+            on_provisional(provisional)
+
+        # -----------------------------
+        # 1️⃣b Speech-to-text (FULL AUDIO)
+        # -----------------------------
+        if not len(audio):
+            text, detected_lang, raw_text = "", "unknown", ""
+        else:
+            text, detected_lang, raw_text = self.asr.transcribe(audio)
+
+        # -----------------------------
+        # 2️⃣ + 3️⃣ Normalize + NLP
+        # -----------------------------
+        result = self.analyse_transcript(text, detected_lang, wait_for_geo, geocode)
+        result["stage"] = "final"
+        result["vad"] = vad_stats
+
+        metrics["time_to_final_sec"] = round(time.time() - start, 2)
+        metrics.setdefault("time_to_first_triage_sec", metrics["time_to_final_sec"])
+        result["metrics"] = metrics
+        print(f"⏱️  Metrics: {metrics}")
+
+        return result
+
+    def process_and_save(self, wav_path: str, phone_number: str = None):
+        """
+        process() + persistence: the provisional triage inserts the row
+        as soon as it is ready, the final transcript updates that row.
+        Rows are keyed by recording (audio_path), so a retried job
+        refines its earlier provisional row instead of adding another.
+        A geocode still in flight is attached to the row when it lands,
+        so the ASR worker moves on to the next call immediately.
+        """
+        call_id = None
+
+        def to_call_data(result):
+            return {
+                "phone_number": phone_number or "Unknown",
+                "audio_path": wav_path,
+                "language": result["language"],
+                "transcript": result["transcript"],
+                "analysis": result["analysis"],
+                "stage": result["stage"]
+            }
+
+        def save_provisional(provisional):
+            nonlocal call_id
+            call_id = upsert_call(to_call_data(provisional))
+
+        result = self.process(wav_path, on_provisional=save_provisional)
+        geo_future = result.pop("geo_future", None)
+
+        if call_id is None:
+            call_id = upsert_call(to_call_data(result))
+        else:
+            update_call(call_id, to_call_data(result))
+
+        if geo_future is not None:
+            def attach_geo(future, call_id=call_id):
+                if future.exception() is None and future.result():
+                    update_call_geo(call_id, future.result())
+
+            geo_future.add_done_callback(attach_geo)
+
+        result["call_id"] = call_id
+        return result
+
+    def analyse_transcript(
+        self,
+        text: str,
+        detected_lang: str,
+        wait_for_geo: bool = False,
+        geocode: bool = True
+    ):
+        """
+        Text half of the pipeline (normalize → classify → geocode).
+        Shared with the batch re-transcription CLI.
+
+        Geocoding starts right after classification and only for
+        classified calls (see start_geocode). wait_for_geo=False never
+        blocks on it: a lookup still in flight is returned as
+        result["geo_future"] (analysis["geo"] stays None until it
+        resolves).
+        """
 
         # -----------------------------
-        # 2️⃣ Normalize text
+        # 2️⃣ Normalize text (ASR output is already normalized →
+        #    ASCII fast path / memo hit, no second transliteration)
         # -----------------------------
         normalized_text = normalize_text(text)
 
@@ -46,24 +196,22 @@ class CallProcessor:
         # -----------------------------
         # 3️⃣ NLP analysis
         # -----------------------------
-        analysis = self.classifier.classify(normalized_text)
-
-        # 📍 Enhance location with Google Maps
-        raw_location = analysis.get("location")
-
-        if raw_location and raw_location.get("text"):
-            query = raw_location["text"] + ", Bangalore, India"
-            geo = geocode_location(query)
-        else:
-            geo = None
-
-        analysis["geo"] = geo
+        location = extract_location(normalized_text.lower()) if normalized_text else None
+        analysis = self.classifier.classify(normalized_text, location=location)
+        analysis["geo"] = None
 
         # -----------------------------
         # 4️⃣ Final structured output
         # -----------------------------
-        return {
+        result = {
             "language": detected_lang,
             "transcript": normalized_text,
             "analysis": analysis
         }
+
+        # 📍 Offline table inline, Google on the pooled client
+        #    (place name → places table / Google, PIN → bundled PIN table)
+        if geocode:
+            start_geocode(result, wait=wait_for_geo)
+
+        return result
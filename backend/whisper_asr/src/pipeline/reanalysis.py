@@ -0,0 +1,144 @@
+# src/pipeline/reanalysis.py
+
+"""
+Re-score stored transcripts after keyword_sets / classifier changes.
+
+- Keyword automaton + location extraction run in a process pool
+- Rows with no keyword hit go through ONE batched semantic pass
+  (semantic_classify_batch) in the parent, so MiniLM loads once
+- Rows whose location changed are re-geocoded (or get NULL coordinates
+  when geocoding is off / fails), never a new place with old lat/lng
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+FIELDS = (
+    "emergency_type", "priority", "confidence", "keywords",
+    "location_text", "latitude", "longitude"
+)
+
+_classifier = None
+
+_NO_MATCH = {"scores": {}, "keywords": [], "priority": None}
+
+
+def _init_worker():
+    global _classifier
+    from src.nlp.emergency_classifier import EmergencyClassifier
+    _classifier = EmergencyClassifier()
+
+
+def _keyword_pass(rows: list):
+    """
+    Worker: keyword match + location for a batch of rows.
+    Returns [(row, matcher summary, location)].
+    """
+    from src.nlp.location_extractor import extract_location
+
+    out = []
+    for row in rows:
+        text = (row["transcript"] or "").lower()
+        location = extract_location(text) if text else None
+
+        match = _classifier.matcher.match(text) if text else _NO_MATCH
+        out.append((row, match, location))
+    return out
+
+
+class Reanalyzer:
+    def __init__(self, workers: int = None, use_semantic: bool = True, geocode: bool = True):
+        self.workers = workers or os.cpu_count() or 1
+        self.use_semantic = use_semantic
+        self.geocode = geocode
+
+        # Parent-side classifier: result shaping + semantic fallback
+        from src.nlp.emergency_classifier import EmergencyClassifier
+        self.classifier = EmergencyClassifier()
+
+    def _finish(self, keyword_results: list):
+        """
+        Resolve rows without keyword hits with one batched semantic call.
+        Returns [(row, new_fields)].
+        """
+        pending = [
+            i for i, (row, match, _) in enumerate(keyword_results)
+            if not match["scores"] and row["transcript"]
+        ]
+
+        semantic = {}
+        if self.use_semantic and pending:
+            from src.nlp.semantic_fallback import semantic_classify_batch
+            texts = [keyword_results[i][0]["transcript"].lower() for i in pending]
+            semantic = dict(zip(pending, semantic_classify_batch(texts)))
+
+        out = []
+        for i, (row, match, location) in enumerate(keyword_results):
+            result = self.classifier.build_result(match, location, semantic.get(i))
+
+            location_text = (result["location"] or {}).get("text")
+            lat, lng = row.get("latitude"), row.get("longitude")
+            if location_text != row.get("location_text"):
+                lat, lng = self._coordinates(result["location"])
+
+            out.append((row, {
+                "id": row["id"],
+                "emergency_type": result["type"],
+                "priority": result["priority"],
+                "confidence": result["confidence"],
+                "keywords": result["keywords"],
+                "location_text": location_text,
+                "latitude": lat,
+                "longitude": lng
+            }))
+        return out
+
+    def _coordinates(self, location):
+        """
+        (lat, lng) for a changed location; (None, None) when there is no
+        location, geocoding is disabled or finds nothing.
+        """
+        if not self.geocode:
+            return None, None
+
+        from src.location.geocoder import geocode_location, location_query
+
+        query = location_query(location)
+        geo = geocode_location(query) if query else None
+        return (geo["lat"], geo["lng"]) if geo else (None, None)
+
+    def run(self, batches, on_batch):
+        """
+        batches: iterable of row lists (e.g. iter_call_transcripts)
+        on_batch([(row, new_fields)]) is called per batch, in order.
+        At most workers × 2 batches are in flight.
+        """
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as pool:
+            limit = self.workers * 2
+            in_flight = []
+
+            for rows in batches:
+                in_flight.append(pool.submit(_keyword_pass, rows))
+                if len(in_flight) >= limit:
+                    on_batch(self._finish(in_flight.pop(0).result()))
+
+            for future in in_flight:
+                on_batch(self._finish(future.result()))
+
+
+def diff_fields(row: dict, new: dict):
+    """
+    {field: (old, new)} for fields that changed.
+    """
+    changes = {}
+    for field in FIELDS:
+        old = row.get(field)
+        if field == "keywords":
+            changed = sorted(old or []) != sorted(new[field] or [])
+        elif field == "confidence":
+            changed = round(old or 0.0, 2) != round(new[field] or 0.0, 2)
+        else:
+            changed = old != new[field]
+        if changed:
+            changes[field] = (old, new[field])
+    return changes
@@ -0,0 +1,157 @@
+# src/pipeline/worker_pool.py
+
+"""
+Multi-process ASR execution.
+
+Each worker process owns ONE CallProcessor (model loaded once per
+worker, at startup) and a fixed share of the CPU threads. Work is
+dispatched with a bounded number of calls in flight.
+"""
+
+import os
+import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+
+from src.asr_service import WHISPER_MODEL_NAME
+from src.location.geocoder import start_geocode
+
+# Rough resident size per loaded Whisper model (MB, CPU)
+MODEL_MEMORY_MB = {
+    "tiny": 400,
+    "base": 600,
+    "small": 1200,
+    "medium": 2800,
+    "large-v2": 5500,
+    "large-v3": 5500
+}
+
+_processor = None
+
+
+def _available_memory_mb():
+    try:
+        import psutil
+        return psutil.virtual_memory().available // 2**20
+    except Exception:
+        pass
+
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 2**20
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def default_pool_size(model_name: str = WHISPER_MODEL_NAME, threads_per_worker: int = 4):
+    """
+    Workers = min(cores / threads_per_worker, free memory / model size), ≥ 1.
+    """
+    by_cpu = max(1, (os.cpu_count() or 1) // threads_per_worker)
+
+    free_mb = _available_memory_mb()
+    model_mb = MODEL_MEMORY_MB.get(model_name, 3000)
+    by_mem = max(1, int(free_mb * 0.8) // model_mb) if free_mb else by_cpu
+
+    return min(by_cpu, by_mem)
+
+
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+def _init_worker(threads: int):
+    # OMP/MKL limits arrive through the environment the parent set
+    # before spawning (they must be in place before the child's imports
+    # load torch / CTranslate2); torch's own pool is pinned here too
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+    global _processor
+    from src.pipeline.process_call import CallProcessor
+    _processor = CallProcessor()
+
+
+def _process(wav_path: str):
+    # Geocoding is started by the parent (start_geocode) once the
+    # transcript is back, so no lookup ever holds this worker
+    return _processor.process(wav_path, geocode=False)
+
+
+def _process_and_save(wav_path: str, phone_number: str = None):
+    return _processor.process_and_save(wav_path, phone_number)
+
+
+class ASRWorkerPool:
+    """
+    Process pool for CallProcessor jobs.
+
+    - workers: process count (default: sized by cores + memory)
+    - max_in_flight: submit() blocks once this many calls are pending
+    """
+
+    def __init__(self, workers: int = None, threads_per_worker: int = 4, max_in_flight: int = None):
+        self.workers = workers or default_pool_size(threads_per_worker=threads_per_worker)
+        self.max_in_flight = max_in_flight or self.workers * 2
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+
+        print(f"🧵 Starting ASR pool: {self.workers} workers × {threads_per_worker} threads")
+
+        # Spawned children copy os.environ at start → set the thread
+        # limits here, before any child exists. Workers are started on
+        # demand, so this stays set for the pool's (= process') lifetime.
+        for var in THREAD_ENV_VARS:
+            os.environ[var] = str(threads_per_worker)
+
+        # spawn → no torch/OpenMP state inherited through fork
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(threads_per_worker,)
+        )
+
+    def submit(self, wav_path: str, fn=_process, *args):
+        """
+        Returns a Future; blocks while max_in_flight calls are pending.
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(fn, wav_path, *args)
+        except Exception:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def process(self, wav_path: str):
+        """
+        Same contract as CallProcessor.process (blocks on ASR, not on
+        geocoding: a lookup in flight is result["geo_future"]).
+        """
+        return start_geocode(self.submit(wav_path).result())
+
+    def process_and_save(self, wav_path: str, phone_number: str = None):
+        """
+        Same contract as CallProcessor.process_and_save (blocking);
+        the worker writes the provisional + final rows itself.
+        """
+        return self.submit(wav_path, _process_and_save, phone_number).result()
+
+    def map(self, wav_paths):
+        """
+        Yields (wav_path, result) in completion order.
+        """
+        from concurrent.futures import as_completed
+
+        pending = {}
+        for path in wav_paths:
+            pending[self.submit(path)] = path
+
+        for future in as_completed(pending):
+            yield pending[future], start_geocode(future.result())
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -1,15 +1,55 @@
 # src/streaming/audio_chunker.py
 
-import wave
-import math
 import os
+import wave
+import tempfile
+from contextlib import contextmanager
+
+import numpy as np
+
+from .audio_utils import SAMPLE_RATE
+
+
+def iter_chunks(
+    audio: np.ndarray,
+    chunk_duration_sec: float = 3.0,
+    hop_duration_sec: float = 1.5,
+    sample_rate: int = SAMPLE_RATE
+):
+    """
+    Yield overlapping windows over ONE decoded audio buffer.
+
+    Every chunk is a zero-copy NumPy view (basic slicing), so nothing
+    is written to disk and nothing is decoded twice.
+
+    Yields:
+        (start_sec, chunk) tuples
+    """
+    samples_per_chunk = int(sample_rate * chunk_duration_sec)
+    samples_per_hop = int(sample_rate * hop_duration_sec)
+    total = len(audio)
+
+    pos = 0
+    while pos < total:
+        yield pos / sample_rate, audio[pos:pos + samples_per_chunk]
+        pos += samples_per_hop
+
 
 def chunk_wav(
     wav_path: str,
     chunk_duration_sec: float = 3.0,
     hop_duration_sec: float = 1.5,
-    out_dir: str = "tmp_chunks"
+    out_dir: str | None = None
 ):
+    """
+    Legacy file-based chunker (prefer iter_chunks). Returns chunk paths.
+
+    Without out_dir the chunks go to a fresh mkdtemp directory, so two
+    live sessions never overwrite each other's chunk_NNN.wav files. The
+    caller owns that directory (temp_chunk_wav() removes it for you).
+    """
+    if out_dir is None:
+        out_dir = tempfile.mkdtemp(prefix="respondr_chunks_")
     os.makedirs(out_dir, exist_ok=True)
 
     with wave.open(wav_path, "rb") as wf:
@@ -41,4 +81,16 @@ def chunk_wav(
             pos += frames_per_hop
             idx += 1
 
-    return chunk_paths
\ No newline at end of file
+    return chunk_paths
+
+
+@contextmanager
+def temp_chunk_wav(wav_path: str, chunk_duration_sec: float = 3.0, hop_duration_sec: float = 1.5):
+    """
+    chunk_wav() into a temp directory that is removed when the block exits.
+
+        with temp_chunk_wav(path) as chunk_paths:
+            ...
+    """
+    with tempfile.TemporaryDirectory(prefix="respondr_chunks_") as tmp_dir:
+        yield chunk_wav(wav_path, chunk_duration_sec, hop_duration_sec, out_dir=tmp_dir)
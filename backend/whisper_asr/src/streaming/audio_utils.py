@@ -1,17 +1,278 @@
+import hashlib
+import struct
 import subprocess
-import os
+import threading
+import wave
+from collections import OrderedDict
+from math import gcd
 
-def ensure_pcm_wav(in_path: str, out_path: str):
-    if os.path.exists(out_path):
-        return out_path
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+# WAVE format tags
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_ALAW = 0x0006
+WAVE_FORMAT_MULAW = 0x0007
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+# --------------------------------------------------
+# G.711 (telephony) decode tables — 256 entries each
+# --------------------------------------------------
+def _mulaw_table():
+    u = ~np.arange(256, dtype=np.uint8)
+    sign = (u & 0x80) != 0
+    exponent = (u >> 4) & 0x07
+    mantissa = u & 0x0F
+    magnitude = ((mantissa.astype(np.int32) << 3) + 0x84) << exponent
+    sample = magnitude - 0x84
+    return (np.where(sign, -sample, sample) / 32768.0).astype(np.float32)
+
+
+def _alaw_table():
+    a = np.arange(256, dtype=np.uint8) ^ 0x55
+    sign = (a & 0x80) != 0
+    exponent = (a >> 4) & 0x07
+    mantissa = (a & 0x0F).astype(np.int32)
+    magnitude = np.where(
+        exponent == 0,
+        (mantissa << 4) + 8,
+        ((mantissa << 4) + 0x108) << np.maximum(exponent - 1, 0)
+    )
+    return (np.where(sign, magnitude, -magnitude) / 32768.0).astype(np.float32)
+
+
+_MULAW = _mulaw_table()
+_ALAW = _alaw_table()
+
+
+# --------------------------------------------------
+# WAV parsing (PCM / float / µ-law / A-law)
+# --------------------------------------------------
+def _parse_wav(data: bytes):
+    """
+    Returns (samples float32 [n, channels], sample_rate).
+    Raises ValueError for anything that is not a supported WAV.
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise ValueError("not a RIFF/WAVE file")
+
+    fmt = None
+    payload = None
+    pos = 12
+
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        size = struct.unpack_from("<I", data, pos + 4)[0]
+        body = data[pos + 8:pos + 8 + size]
+
+        if chunk_id == b"fmt ":
+            tag, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", body)
+            if tag == WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                tag = struct.unpack_from("<H", body, 24)[0]
+            fmt = (tag, channels, rate, bits)
+        elif chunk_id == b"data":
+            payload = body
+
+        pos += 8 + size + (size & 1)   # chunks are word-aligned
+
+    if fmt is None or payload is None:
+        raise ValueError("missing fmt/data chunk")
+
+    tag, channels, rate, bits = fmt
+    width = bits // 8
+    usable = len(payload) - len(payload) % (width * channels)
+    raw = np.frombuffer(payload[:usable], dtype=np.uint8)
+
+    if tag == WAVE_FORMAT_MULAW and bits == 8:
+        samples = _MULAW[raw]
+    elif tag == WAVE_FORMAT_ALAW and bits == 8:
+        samples = _ALAW[raw]
+    elif tag == WAVE_FORMAT_PCM and bits == 8:
+        samples = (raw.astype(np.float32) - 128.0) / 128.0
+    elif tag == WAVE_FORMAT_PCM and bits == 16:
+        samples = raw.view("<i2").astype(np.float32) / 32768.0
+    elif tag == WAVE_FORMAT_PCM and bits == 24:
+        b = raw.reshape(-1, 3).astype(np.int32)
+        ints = (b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)) << 8 >> 8
+        samples = ints.astype(np.float32) / 8388608.0
+    elif tag == WAVE_FORMAT_PCM and bits == 32:
+        samples = raw.view("<i4").astype(np.float32) / 2147483648.0
+    elif tag == WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+        samples = raw.view("<f4").astype(np.float32)
+    else:
+        raise ValueError(f"unsupported WAV format tag={tag} bits={bits}")
+
+    return samples.reshape(-1, channels), rate
+
+
+# --------------------------------------------------
+# Polyphase resampling
+# --------------------------------------------------
+def _polyphase_filter(up: int, down: int, half_width: int = 10, beta: float = 5.0):
+    # Kaiser-windowed sinc low-pass at the narrower Nyquist
+    cutoff = 1.0 / max(up, down)
+    n = np.arange(-half_width * max(up, down), half_width * max(up, down) + 1)
+    h = cutoff * np.sinc(cutoff * n) * np.kaiser(len(n), beta)
+    return (h / h.sum() * up).astype(np.float32)
+
+
+def _resample_numpy(x: np.ndarray, up: int, down: int, block: int = 1 << 16):
+    h = _polyphase_filter(up, down)
+    taps = len(h)
+    center = (taps - 1) // 2
+
+    # Polyphase matrix: row p holds h[p], h[p+up], h[p+2up], ...
+    per_phase = -(-taps // up)
+    poly = np.zeros((up, per_phase), dtype=np.float32)
+    for p in range(up):
+        coeffs = h[p::up]
+        poly[p, :len(coeffs)] = coeffs
+
+    pad = per_phase
+    xp = np.concatenate([np.zeros(pad, np.float32), x, np.zeros(pad, np.float32)])
+
+    n_out = -(-len(x) * up // down)
+    out = np.empty(n_out, dtype=np.float32)
+    j = np.arange(per_phase)
+
+    # Vectorised over output blocks (bounded memory)
+    for start in range(0, n_out, block):
+        n = np.arange(start, min(start + block, n_out))
+        t = n * down + center
+        phase = t % up
+        base = t // up + pad
+        out[start:start + len(n)] = np.einsum(
+            "ij,ij->i", poly[phase], xp[base[:, None] - j[None, :]]
+        )
+
+    return out
 
+
+def resample(x: np.ndarray, orig_sr: int, target_sr: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Rational polyphase resampling (e.g. 8 kHz telephony → 16 kHz).
+    Uses scipy.signal.resample_poly when installed, NumPy otherwise.
+    """
+    if orig_sr == target_sr:
+        return x.astype(np.float32, copy=False)
+
+    g = gcd(orig_sr, target_sr)
+    up, down = target_sr // g, orig_sr // g
+
+    try:
+        from scipy.signal import resample_poly
+        return resample_poly(x, up, down).astype(np.float32)
+    except ImportError:
+        return _resample_numpy(x.astype(np.float32, copy=False), up, down)
+
+
+# --------------------------------------------------
+# Content-hash keyed decode cache
+# --------------------------------------------------
+class _AudioCache:
+    """
+    LRU of decoded buffers keyed by SHA-1 of the file bytes, so a
+    re-used path with new content is never served stale audio.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20):
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            audio = self._items.get(key)
+            if audio is not None:
+                self._items.move_to_end(key)
+            return audio
+
+    def put(self, key, audio: np.ndarray):
+        with self._lock:
+            if key in self._items or audio.nbytes > self.max_bytes:
+                return
+            self._items[key] = audio
+            self._bytes += audio.nbytes
+            while self._bytes > self.max_bytes:
+                _, old = self._items.popitem(last=False)
+                self._bytes -= old.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+
+_cache = _AudioCache()
+
+
+def decode_audio_bytes(data: bytes) -> np.ndarray:
+    """
+    In-process decode of WAV bytes → mono 16 kHz float32.
+    """
+    samples, rate = _parse_wav(data)
+    mono = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+    return resample(mono, rate, SAMPLE_RATE)
+
+
+def _ffmpeg_decode(path: str) -> np.ndarray:
     cmd = [
-        "ffmpeg", "-y",
-        "-i", in_path,
+        "ffmpeg", "-nostdin",
+        "-i", path,
+        "-f", "s16le",
         "-ac", "1",
-        "-ar", "16000",
-        "-sample_fmt", "s16",
-        out_path
+        "-ar", str(SAMPLE_RATE),
+        "-"
     ]
-    subprocess.run(cmd, check=True)
-    return out_path
\ No newline at end of file
+    out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+
+def load_audio(path: str) -> np.ndarray:
+    """
+    Decode any audio file ONCE into a mono 16 kHz float32 buffer.
+
+    - WAV (PCM / float / µ-law / A-law) is decoded in-process
+    - Other containers fall back to one ffmpeg subprocess
+    - Results are cached by content hash (read-only arrays)
+
+    The result can be sliced into chunks (see audio_chunker.iter_chunks)
+    and passed straight to WhisperASRService.transcribe.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    key = hashlib.sha1(data).hexdigest()
+    audio = _cache.get(key)
+    if audio is not None:
+        return audio
+
+    try:
+        audio = decode_audio_bytes(data)
+    except ValueError:
+        audio = _ffmpeg_decode(path)
+
+    audio.setflags(write=False)   # shared via cache → never mutate
+    _cache.put(key, audio)
+    return audio
+
+
+def ensure_pcm_wav(in_path: str, out_path: str):
+    """
+    Write a 16 kHz mono s16 WAV copy of in_path (legacy helper).
+    Always regenerated from the current input → no stale outputs.
+    """
+    audio = load_audio(in_path)
+    pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2")
+
+    with wave.open(out_path, "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(SAMPLE_RATE)
+        out.writeframes(pcm.tobytes())
+
+    return out_path
@@ -3,10 +3,12 @@
 import time
 
 from src.asr_service import WhisperASRService
-from src.nlp.emergency_classifier import EmergencyClassifier
+from src.nlp.incremental_classifier import IncrementalClassifier
 
-from .audio_chunker import chunk_wav
-from .audio_utils import ensure_pcm_wav
+from .audio_chunker import iter_chunks
+from .audio_utils import load_audio
+from .stable_decoder import StablePrefixDecoder
+from .vad import EnergyVAD
 from .state import EmergencyState
 from src.streaming.transcript_buffer import TranscriptBuffer
 from src.normalizer import normalize_text
@@ -16,35 +18,56 @@ from src.location.metadata_provider import get_caller_metadata
 from src.location.location_fusion import resolve_location
 
 
-def run_live_simulation(wav_path: str):
+def run_live_simulation(
+    wav_path: str,
+    stable_prefix: bool = True,
+    hop_duration_sec: float = 1.5,
+    use_vad: bool = True
+):
     """
     Simulate a live emergency call with streaming ASR + NLP.
 
     Fully automated pipeline:
+    - Energy VAD gate (silent chunks never reach Whisper)
     - Streaming ASR (English decoding)
     - Rolling transcript buffer
-    - NLP emergency classification
+    - Incremental NLP emergency classification (new text only)
     - Location fusion (speech hints + caller metadata)
     - No follow-up questions required
+
+    stable_prefix=True  → non-overlapping hops through StablePrefixDecoder;
+                          only text consecutive hypotheses agree on is
+                          committed (no re-decoded / duplicated words)
+    stable_prefix=False → legacy 3s window / 1.5s hop, each window
+                          transcribed independently
     """
 
     # --------------------------------------------------
     # Initialize services
     # --------------------------------------------------
     asr = WhisperASRService()
-    clf = EmergencyClassifier()
+    clf = IncrementalClassifier()
     state = EmergencyState()
+    vad = EnergyVAD() if use_vad else None
 
     # --------------------------------------------------
-    # Ensure PCM WAV (16kHz, mono)
+    # Decode ONCE to 16kHz mono float32 (no temp files)
     # --------------------------------------------------
-    pcm_path = wav_path.replace(".wav", "_pcm.wav")
-    wav_path = ensure_pcm_wav(wav_path, pcm_path)
+    audio = load_audio(wav_path)
 
     # --------------------------------------------------
-    # Chunk audio for streaming simulation
+    # Chunk audio for streaming simulation (in-memory views)
     # --------------------------------------------------
-    chunks = chunk_wav(wav_path)
+    if stable_prefix:
+        decoder = StablePrefixDecoder(asr)
+        chunks = iter_chunks(
+            audio,
+            chunk_duration_sec=hop_duration_sec,
+            hop_duration_sec=hop_duration_sec
+        )
+    else:
+        decoder = None
+        chunks = iter_chunks(audio, hop_duration_sec=hop_duration_sec)
 
     print("🚨 Live call started\n")
 
@@ -53,27 +76,22 @@ def run_live_simulation(wav_path: str):
     # --------------------------------------------------
     buffer = TranscriptBuffer(max_chars=500)
 
-    # --------------------------------------------------
-    # Streaming loop
-    # --------------------------------------------------
-    for i, chunk in enumerate(chunks):
-        # 1️⃣ ASR
-        clean_text, detected_lang, raw_text = asr.transcribe(chunk)
-
-        # 2️⃣ Update rolling buffer
+    def analyse(label: str, clean_text: str):
+        # 2️⃣ Update rolling buffer (display only)
         full_text = buffer.add(clean_text)
 
-        # 3️⃣ Normalize text (noop for English, safe for mixed input)
-        normalized_text = normalize_text(full_text)
+        # 3️⃣ Normalize ONLY the new text (noop for English)
+        normalized_text = normalize_text(clean_text)
 
-        # 4️⃣ NLP classification (on full context)
-        nlp_result = clf.classify(normalized_text)
+        # 4️⃣ Incremental NLP (running scores, cost ∝ new text)
+        nlp_result = clf.update(normalized_text)
 
         # 5️⃣ Location fusion (NO PIN DEPENDENCY)
         metadata = get_caller_metadata()
         final_location = resolve_location(
             nlp_result.get("location"),
-            metadata
+            metadata,
+            transcript=normalized_text
         )
 
         # 6️⃣ Merge final location into NLP result
@@ -88,7 +106,7 @@ def run_live_simulation(wav_path: str):
         # --------------------------------------------------
         # Logs (debug / demo)
         # --------------------------------------------------
-        print(f"⏱️  Chunk {i}")
+        print(f"⏱️  {label}")
         print("ASR (chunk):", clean_text)
         print("ASR (buffered):", full_text)
         print("ASR (normalized):", normalized_text)
@@ -96,7 +114,38 @@ def run_live_simulation(wav_path: str):
         print("STATE:", state.snapshot())
         print("-" * 60)
 
-        time.sleep(1.5)
+    # --------------------------------------------------
+    # Streaming loop
+    # --------------------------------------------------
+    for i, (start_sec, chunk) in enumerate(chunks):
+        # 0️⃣ VAD gate
+        if vad and not vad.is_speech(chunk):
+            print(f"🔇 Chunk {i} @ {start_sec:.1f}s skipped (no speech)")
+            time.sleep(hop_duration_sec)
+            continue
+
+        # 1️⃣ ASR
+        if decoder:
+            decoder.insert_audio(chunk)
+            clean_text = decoder.process()
+        else:
+            clean_text, detected_lang, raw_text = asr.transcribe(chunk)
+
+        analyse(f"Chunk {i} @ {start_sec:.1f}s", clean_text)
+
+        time.sleep(hop_duration_sec)
+
+    # Flush the uncommitted tail
+    if decoder:
+        tail_text = decoder.finish()
+        if tail_text:
+            analyse("Final flush", tail_text)
 
     print("\n✅ Call ended")
-    return state.snapshot()
\ No newline at end of file
+
+    snapshot = state.snapshot()
+    if vad:
+        snapshot["vad"] = vad.stats()
+        print("🔇 VAD:", snapshot["vad"])
+
+    return snapshot
@@ -0,0 +1,126 @@
+# src/streaming/stable_decoder.py
+
+import numpy as np
+
+from src.normalizer import normalize_text
+from .audio_utils import SAMPLE_RATE
+
+
+def _norm_word(word: str) -> str:
+    return word.strip().lower().strip(".,!?;:\"'")
+
+
+class StablePrefixDecoder:
+    """
+    Streaming decoder based on local agreement between hypotheses.
+
+    - Audio is fed in non-overlapping pieces (insert_audio)
+    - Each step re-decodes ONLY the uncommitted audio + the new piece,
+      with the last committed words passed as a text prompt (context)
+    - A word is committed once two consecutive hypotheses agree on it
+    - Committed text is emitted exactly once → no duplicated phrases
+    """
+
+    def __init__(
+        self,
+        asr,
+        max_buffer_sec: float = 12.0,
+        prompt_chars: int = 200,
+        sample_rate: int = SAMPLE_RATE
+    ):
+        self.asr = asr
+        self.sample_rate = sample_rate
+        self.max_buffer_sec = max_buffer_sec
+        self.prompt_chars = prompt_chars
+
+        self.audio = np.zeros(0, dtype=np.float32)
+        self.buffer_offset = 0.0     # stream time (sec) of self.audio[0]
+        self.committed = []          # [(start, end, word)]
+        self.committed_until = 0.0   # end time of last committed word
+        self.tail = []               # previous uncommitted hypothesis
+        self.language = "unknown"
+
+    # --------------------------------------------------
+    # Public API
+    # --------------------------------------------------
+    def insert_audio(self, chunk: np.ndarray):
+        self.audio = np.concatenate(
+            [self.audio, chunk.astype(np.float32, copy=False)]
+        )
+
+    def process(self) -> str:
+        """
+        Decode the uncommitted buffer and return NEWLY committed text.
+        """
+        if not len(self.audio):
+            return ""
+
+        words, self.language = self.asr.transcribe_words(
+            self.audio, prompt=self._prompt()
+        )
+
+        # Shift to stream time and drop words already committed
+        hypothesis = [
+            (s + self.buffer_offset, e + self.buffer_offset, w)
+            for s, e, w in words
+            if e + self.buffer_offset > self.committed_until
+        ]
+
+        # Longest common prefix with the previous hypothesis
+        n = 0
+        while (
+            n < len(hypothesis) and n < len(self.tail)
+            and _norm_word(hypothesis[n][2]) == _norm_word(self.tail[n][2])
+        ):
+            n += 1
+
+        new_words = hypothesis[:n]
+        self.tail = hypothesis[n:]
+
+        # Nothing stable for too long → force-commit to bound the buffer
+        if not new_words and self._buffer_sec() > self.max_buffer_sec:
+            new_words, self.tail = self.tail, []
+
+        return self._commit(new_words)
+
+    def finish(self) -> str:
+        """
+        Flush the uncommitted tail at end of call.
+        """
+        tail, self.tail = self.tail, []
+        text = self._commit(tail)
+        self.audio = np.zeros(0, dtype=np.float32)
+        return text
+
+    @property
+    def text(self) -> str:
+        return normalize_text(" ".join(w.strip() for _, _, w in self.committed))
+
+    # --------------------------------------------------
+    # Internals
+    # --------------------------------------------------
+    def _commit(self, words) -> str:
+        if not words:
+            return ""
+
+        self.committed.extend(words)
+        self.committed_until = words[-1][1]
+        self._trim_audio()
+
+        return normalize_text(" ".join(w.strip() for _, _, w in words))
+
+    def _trim_audio(self):
+        # Keep only audio after the last committed word
+        cut = int((self.committed_until - self.buffer_offset) * self.sample_rate)
+        if cut > 0:
+            self.audio = self.audio[cut:]
+            self.buffer_offset += cut / self.sample_rate
+
+    def _buffer_sec(self) -> float:
+        return len(self.audio) / self.sample_rate
+
+    def _prompt(self):
+        if not self.committed:
+            return None
+        text = " ".join(w.strip() for _, _, w in self.committed)
+        return text[-self.prompt_chars:]
@@ -0,0 +1,156 @@
+# src/streaming/vad.py
+
+import numpy as np
+
+from .audio_utils import SAMPLE_RATE
+
+
+class EnergyVAD:
+    """
+    Lightweight frame-level energy VAD (no model, pure NumPy).
+
+    - trim(audio)      → drop non-speech spans from a whole recording
+    - is_speech(chunk) → gate individual live chunks
+    - stats()          → how much audio was skipped so far
+    """
+
+    def __init__(
+        self,
+        frame_ms: int = 30,
+        margin_db: float = 10.0,
+        min_threshold_db: float = -50.0,
+        pad_ms: int = 200,
+        min_silence_ms: int = 300,
+        min_speech_ms: int = 120,
+        sample_rate: int = SAMPLE_RATE
+    ):
+        self.sample_rate = sample_rate
+        self.frame_len = int(sample_rate * frame_ms / 1000)
+        self.margin_db = margin_db
+        self.min_threshold_db = min_threshold_db
+        self.pad_frames = max(1, pad_ms // frame_ms)
+        self.min_silence_frames = max(1, min_silence_ms // frame_ms)
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+
+        self._noise_floor_db = None
+        self.total_samples = 0
+        self.speech_samples = 0
+
+    # --------------------------------------------------
+    # Frame energy
+    # --------------------------------------------------
+    def _frame_db(self, audio: np.ndarray) -> np.ndarray:
+        n = len(audio) // self.frame_len
+        if n == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        frames = audio[:n * self.frame_len].reshape(n, self.frame_len)
+        rms = np.sqrt(np.mean(frames.astype(np.float32) ** 2, axis=1))
+        return 20 * np.log10(rms + 1e-10)
+
+    def _threshold(self, db: np.ndarray, floor_db: float) -> float:
+        return max(self.min_threshold_db, floor_db + self.margin_db)
+
+    def _speech_mask(self, db: np.ndarray, threshold: float) -> np.ndarray:
+        mask = db > threshold
+
+        # Pad speech on both sides (keeps word onsets / tails)
+        kernel = np.ones(2 * self.pad_frames + 1)
+        mask = np.convolve(mask, kernel, mode="same") > 0
+
+        # Fill short gaps, then drop short blips
+        self._fill_runs(mask, False, self.min_silence_frames)
+        self._fill_runs(mask, True, self.min_speech_frames)
+        return mask
+
+    @staticmethod
+    def _fill_runs(mask: np.ndarray, value: bool, min_len: int):
+        # Flip interior runs of `value` shorter than min_len
+        edges = np.flatnonzero(np.diff(mask.astype(np.int8))) + 1
+        bounds = np.concatenate([[0], edges, [len(mask)]])
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if mask[start] == value and end - start < min_len:
+                if not value and (start == 0 or end == len(mask)):
+                    continue
+                mask[start:end] = not value
+
+    # --------------------------------------------------
+    # Public API
+    # --------------------------------------------------
+    def speech_spans(self, audio: np.ndarray):
+        """
+        Returns:
+            [(start_sample, end_sample)] of detected speech
+        """
+        db = self._frame_db(audio)
+        if not len(db):
+            return []
+
+        mask = self._speech_mask(db, self._threshold(db, np.percentile(db, 10)))
+
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], mask, [0]]).astype(np.int8)))
+        spans = []
+        for start, end in zip(edges[0::2], edges[1::2]):
+            s = int(start) * self.frame_len
+            e = len(audio) if end == len(mask) else int(end) * self.frame_len
+            spans.append((s, e))
+        return spans
+
+    def trim(self, audio: np.ndarray, gap_ms: int = 100) -> np.ndarray:
+        """
+        Keep only speech spans, joined by short silences so Whisper
+        does not merge words across cut points.
+        """
+        spans = self.speech_spans(audio)
+        gap = np.zeros(int(self.sample_rate * gap_ms / 1000), dtype=np.float32)
+
+        pieces = []
+        for s, e in spans:
+            if pieces:
+                pieces.append(gap)
+            pieces.append(audio[s:e])
+
+        speech = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+
+        self.total_samples += len(audio)
+        self.speech_samples += sum(e - s for s, e in spans)
+        return speech
+
+    def is_speech(self, chunk: np.ndarray) -> bool:
+        """
+        Streaming gate. Tracks a running noise floor across chunks
+        (falls fast, rises slowly) since one chunk may be all speech.
+        """
+        db = self._frame_db(chunk)
+        self.total_samples += len(chunk)
+        if not len(db):
+            return False
+
+        floor = float(np.percentile(db, 10))
+        if self._noise_floor_db is None:
+            self._noise_floor_db = floor
+        else:
+            self._noise_floor_db = min(
+                floor, 0.95 * self._noise_floor_db + 0.05 * floor
+            )
+
+        mask = self._speech_mask(db, self._threshold(db, self._noise_floor_db))
+        speech = bool(mask.any())
+        if speech:
+            self.speech_samples += len(chunk)
+        return speech
+
+    def stats(self) -> dict:
+        total = self.total_samples / self.sample_rate
+        speech = self.speech_samples / self.sample_rate
+        return {
+            "total_sec": round(total, 2),
+            "speech_sec": round(speech, 2),
+            "skipped_sec": round(total - speech, 2),
+            "skipped_ratio": round((total - speech) / total, 2) if total else 0.0
+        }
+
+    def reset(self):
+        self._noise_floor_db = None
+        self.total_samples = 0
+        self.speech_samples = 0
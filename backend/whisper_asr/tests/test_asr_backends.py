@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+import src.asr.backends as backends
+from src.asr.backends import ASRBackend, load_backend
+from src.asr_service import WhisperASRService
+
+
+class StubBackend(ASRBackend):
+    name = "stub"
+
+    def __init__(self, text=" Fire near Orion Mall ", language="en"):
+        self.text = text
+        self.language = language
+        self.calls = []
+
+    def transcribe(self, audio, language=None, prompt=None,
+                   word_timestamps=False, condition_on_previous_text=True):
+        self.calls.append({
+            "audio": audio, "language": language, "prompt": prompt,
+            "word_timestamps": word_timestamps,
+            "condition_on_previous_text": condition_on_previous_text
+        })
+        return {
+            "text": self.text,
+            "language": self.language,
+            "segments": [{"start": 0.0, "end": 1.2, "text": self.text, "words": [
+                {"start": 0.0, "end": 0.4, "word": " Fire"},
+                {"start": 0.4, "end": 1.2, "word": " near"}
+            ]}]
+        }
+
+
+def test_transcribe_keeps_the_contract():
+    stub = StubBackend()
+    asr = WhisperASRService(backend=stub)
+
+    clean_text, detected_language, raw_text = asr.transcribe(np.zeros(16000, dtype=np.float64))
+
+    assert (clean_text, detected_language, raw_text) == ("Fire near Orion Mall", "en", "Fire near Orion Mall")
+    assert stub.calls[0]["audio"].dtype == np.float32
+    assert stub.calls[0]["language"] == "en"
+
+
+def test_transcribe_normalizes_indic_output():
+    asr = WhisperASRService(backend=StubBackend(text="आग लगी है", language="hi"))
+
+    clean_text, detected_language, raw_text = asr.transcribe(np.zeros(16000, dtype=np.float32))
+
+    assert raw_text == "आग लगी है"
+    assert detected_language == "hi"
+    assert clean_text.isascii() and clean_text
+
+
+def test_transcribe_words_asks_for_word_timestamps():
+    stub = StubBackend()
+    asr = WhisperASRService(backend=stub)
+
+    words, language = asr.transcribe_words(np.zeros(16000, dtype=np.float32), prompt="Fire")
+
+    assert words == [(0.0, 0.4, " Fire"), (0.4, 1.2, " near")]
+    assert language == "en"
+    assert stub.calls[0]["word_timestamps"] is True
+    assert stub.calls[0]["condition_on_previous_text"] is False
+    assert stub.calls[0]["prompt"] == "Fire"
+
+
+def test_transcribe_batch_keeps_the_contract_and_order():
+    stub = StubBackend()
+    asr = WhisperASRService(backend=stub)
+    audios = [np.full(8000, i, dtype=np.float32) for i in range(3)]
+
+    results = asr.transcribe_batch(audios, batch_size=2)
+
+    assert results == [("Fire near Orion Mall", "en", "Fire near Orion Mall")] * 3
+    assert [call["audio"][0] for call in stub.calls] == [0, 1, 2]
+
+
+class BrokenFasterWhisper:
+    name = backends.FasterWhisperBackend.name
+
+    def __init__(self, *args, **kwargs):
+        raise RuntimeError("model download failed")
+
+
+class FakeOpenAIWhisper(StubBackend):
+    name = backends.OpenAIWhisperBackend.name
+
+    def __init__(self, model_name, device="cpu"):
+        super().__init__()
+        self.model_name = model_name
+
+
+def test_load_backend_falls_back_to_openai_whisper(monkeypatch):
+    monkeypatch.setattr(backends, "FasterWhisperBackend", BrokenFasterWhisper)
+    monkeypatch.setattr(backends, "OpenAIWhisperBackend", FakeOpenAIWhisper)
+
+    backend = load_backend("faster-whisper", "tiny")
+
+    assert isinstance(backend, FakeOpenAIWhisper)
+    assert backend.model_name == "tiny"
+
+
+def test_load_backend_rejects_unknown_engines():
+    with pytest.raises(ValueError):
+        load_backend("vosk", "tiny")
@@ -0,0 +1,57 @@
+import os
+import shutil
+import wave
+
+import numpy as np
+import pytest
+
+from src.streaming.audio_chunker import chunk_wav, iter_chunks, temp_chunk_wav
+
+
+@pytest.fixture
+def wav_path(tmp_path):
+    path = tmp_path / "call.wav"
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(8000)
+        wf.writeframes(np.zeros(8000 * 6, dtype=np.int16).tobytes())   # 6 s
+    return str(path)
+
+
+def test_chunk_wav_creates_missing_out_dir(wav_path, tmp_path):
+    out_dir = tmp_path / "nested" / "chunks"
+
+    paths = chunk_wav(wav_path, out_dir=str(out_dir))
+
+    assert isinstance(paths, list) and len(paths) == 4
+    assert all(os.path.dirname(p) == str(out_dir) for p in paths)
+    with wave.open(paths[0], "rb") as wf:
+        assert wf.getnframes() == 8000 * 3
+
+
+def test_chunk_wav_default_dirs_never_collide(wav_path):
+    first, second = chunk_wav(wav_path), chunk_wav(wav_path)
+
+    try:
+        assert os.path.dirname(first[0]) != os.path.dirname(second[0])
+    finally:
+        for paths in (first, second):
+            shutil.rmtree(os.path.dirname(paths[0]))
+
+
+def test_temp_chunk_wav_removes_its_directory(wav_path):
+    with temp_chunk_wav(wav_path) as paths:
+        chunk_dir = os.path.dirname(paths[0])
+        assert all(os.path.exists(p) for p in paths)
+
+    assert not os.path.exists(chunk_dir)
+
+
+def test_iter_chunks_are_views():
+    audio = np.arange(16000 * 4, dtype=np.float32)
+
+    chunks = list(iter_chunks(audio, 3.0, 1.5))
+
+    assert [start for start, _ in chunks] == [0.0, 1.5, 3.0]
+    assert all(np.shares_memory(chunk, audio) for _, chunk in chunks)
@@ -0,0 +1,145 @@
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+from src.streaming import audio_utils
+from src.streaming.audio_utils import (
+    WAVE_FORMAT_ALAW, WAVE_FORMAT_MULAW, WAVE_FORMAT_PCM,
+    _ALAW, _MULAW, _parse_wav, _resample_numpy, load_audio
+)
+
+
+def riff(tag: int, channels: int, rate: int, bits: int, payload: bytes) -> bytes:
+    block = channels * bits // 8
+    fmt = struct.pack("<HHIIHH", tag, channels, rate, rate * block, block, bits)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"data" + struct.pack("<I", len(payload)) + payload + b"\0" * (len(payload) & 1)
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def mulaw_encode(sample: int) -> int:
+    """
+    Reference G.711 µ-law encoder (ITU-T, 14-bit magnitude + bias).
+    """
+    sign = 0x80 if sample < 0 else 0
+    magnitude = min(abs(sample), 32635) + 0x84
+    exponent = magnitude.bit_length() - 8
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    return ~(sign | (exponent << 4) | mantissa) & 0xFF
+
+
+def sine(rate: int, seconds: float = 0.5, freq: float = 440.0):
+    t = np.arange(int(rate * seconds)) / rate
+    return np.sin(2 * np.pi * freq * t)
+
+
+def test_pcm16_8khz_round_trip():
+    pcm = (sine(8000) * 20000).astype("<i2")
+
+    samples, rate = _parse_wav(riff(WAVE_FORMAT_PCM, 1, 8000, 16, pcm.tobytes()))
+
+    assert rate == 8000 and samples.shape == (len(pcm), 1)
+    assert samples.dtype == np.float32
+    np.testing.assert_array_equal(samples[:, 0], pcm / 32768.0)
+
+
+def test_pcm16_matches_wave_module(tmp_path):
+    pcm = (sine(8000) * 12000).astype("<i2")
+    stereo = np.stack([pcm, -pcm], axis=1)
+    path = tmp_path / "stereo.wav"
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(8000)
+        wf.writeframes(stereo.tobytes())
+
+    samples, rate = _parse_wav(path.read_bytes())
+
+    np.testing.assert_array_equal(samples, stereo / 32768.0)
+
+
+def test_mulaw_table_matches_reference_encoder():
+    # Every code decodes to a value that encodes back to it (0x7F is -0)
+    for code in range(256):
+        decoded = int(round(float(_MULAW[code]) * 32768))
+        expected = 0xFF if code == 0x7F else code
+        assert mulaw_encode(decoded) == expected
+    assert _MULAW[0xFF] == 0.0
+    assert _MULAW[0x00] == pytest.approx(-32124 / 32768)
+
+
+def test_mulaw_8khz_round_trip():
+    pcm = (sine(8000) * 30000).astype(np.int16)
+    codes = np.array([mulaw_encode(int(s)) for s in pcm], dtype=np.uint8)
+
+    samples, rate = _parse_wav(riff(WAVE_FORMAT_MULAW, 1, 8000, 8, codes.tobytes()))
+
+    # G.711 step grows with magnitude: ≤ 1/16 of the sample + bias
+    error = np.abs(samples[:, 0] * 32768 - pcm)
+    assert rate == 8000
+    assert np.all(error <= np.abs(pcm) / 16 + 8)
+
+
+def test_alaw_table_endpoints():
+    assert _ALAW[0xD5] == pytest.approx(8 / 32768)
+    assert _ALAW[0x55] == pytest.approx(-8 / 32768)
+    assert _ALAW[0xAA] == pytest.approx(32256 / 32768)
+    assert _ALAW[0x2A] == pytest.approx(-32256 / 32768)
+
+    samples, _ = _parse_wav(riff(WAVE_FORMAT_ALAW, 1, 8000, 8, bytes([0xD5, 0x2A])))
+    np.testing.assert_array_equal(samples[:, 0], _ALAW[[0xD5, 0x2A]])
+
+
+def test_pcm24_sign_extension():
+    payload = b"".join(v.to_bytes(3, "little", signed=True) for v in (0, 1, -1, 8388607, -8388608))
+
+    samples, _ = _parse_wav(riff(WAVE_FORMAT_PCM, 1, 16000, 24, payload))
+
+    np.testing.assert_allclose(
+        samples[:, 0], np.array([0, 1, -1, 8388607, -8388608]) / 8388608.0, rtol=1e-6
+    )
+
+
+def test_rejects_non_wav():
+    with pytest.raises(ValueError):
+        _parse_wav(b"ID3\x03not a wav at all")
+    with pytest.raises(ValueError):
+        _parse_wav(riff(0x0055, 1, 8000, 16, b"\0\0"))   # MP3-in-WAV
+
+
+@pytest.mark.parametrize("orig_sr, up, down", [(8000, 2, 1), (44100, 160, 441)])
+def test_resample_sine_matches_reference(orig_sr, up, down):
+    out = _resample_numpy(sine(orig_sr).astype(np.float32), up, down)
+    reference = sine(16000)
+
+    assert out.dtype == np.float32
+    assert abs(len(out) - len(reference)) <= 1
+
+    # Away from the zero-padded edges the filter is transparent at 440 Hz
+    n = min(len(out), len(reference))
+    interior = slice(200, n - 200)
+    assert np.max(np.abs(out[interior] - reference[interior])) < 1e-2
+
+
+def test_cache_key_follows_content_not_path(tmp_path):
+    audio_utils._cache.clear()
+
+    def write(path, value):
+        path.write_bytes(riff(WAVE_FORMAT_PCM, 1, 16000, 16, np.full(1600, value, "<i2").tobytes()))
+
+    first = tmp_path / "call.wav"
+    write(first, 1000)
+    before = load_audio(str(first))
+
+    # Same path, new content → decoded again, never the stale buffer
+    write(first, -1000)
+    after = load_audio(str(first))
+    assert before[0] > 0 > after[0]
+
+    # Different path, same content → served from the cache
+    copy = tmp_path / "copy.wav"
+    copy.write_bytes(first.read_bytes())
+    assert load_audio(str(copy)) is after
+    assert not after.flags.writeable
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+import src.embedding_service as embedding_service
+from src.embedding_service import EmbeddingService
+
+SENTENCES = [
+    "there is a fire near orion mall please come fast",
+    "my father collapsed he is not breathing",
+    "two bikes crashed on outer ring road someone is bleeding",
+    "a man is following me and threatening me",
+    "smoke coming out of the kitchen of our apartment",
+    "someone broke into the house and stole jewellery",
+    "please send an ambulance to koramangala fifth block",
+    "hello can you hear me",
+]
+
+
+class FakeTorchModel:
+    def encode(self, texts, convert_to_tensor=False, **kwargs):
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+def test_cos_sim_is_numpy():
+    a = np.array([1.0, 0.0])
+    b = np.array([[1.0, 0.0], [0.0, 2.0], [-3.0, 0.0]])
+
+    scores = EmbeddingService.cos_sim(a, b)
+
+    assert isinstance(scores, np.ndarray)
+    np.testing.assert_allclose(scores, [[1.0, 0.0, -1.0]], atol=1e-6)
+
+
+def test_failed_onnx_load_never_caches_torch_vectors_under_onnx_key(tmp_path, monkeypatch):
+    def broken_onnx(name):
+        raise RuntimeError("export failed")
+
+    monkeypatch.setattr(embedding_service, "get_onnx_sentence_model", broken_onnx)
+    monkeypatch.setattr(embedding_service, "get_sentence_model", lambda name: FakeTorchModel())
+
+    service = EmbeddingService(cache_dir=str(tmp_path), backend="onnx")
+    service._backend_checked = True   # pretend onnxruntime is installed
+    service.register_templates("t", ["a", "b"])
+    service.template_embeddings("t")
+
+    files = [p.name for p in tmp_path.iterdir()]
+    assert service.backend == "torch"
+    assert len(files) == 1 and "onnx" not in files[0]
+
+
+def test_missing_onnxruntime_resolves_to_torch_before_keying(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_service.importlib.util, "find_spec", lambda name: None)
+    monkeypatch.setattr(embedding_service, "get_sentence_model", lambda name: FakeTorchModel())
+
+    service = EmbeddingService(cache_dir=str(tmp_path), backend="onnx")
+    service.register_templates("t", ["a"])
+    service.template_embeddings("t")
+
+    assert [p.name for p in tmp_path.iterdir()][0].startswith("all-MiniLM-L6-v2__t__")
+
+
+def test_onnx_int8_matches_torch(tmp_path):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("transformers")
+    sentence_transformers = pytest.importorskip("sentence_transformers")
+
+    from src.nlp.semantic_fallback import TEMPLATE_TEXTS, TEMPLATE_INTENT
+    from src.onnx_embedder import OnnxSentenceEncoder
+
+    torch_model = sentence_transformers.SentenceTransformer(embedding_service.DEFAULT_MODEL, device="cpu")
+    onnx_model = OnnxSentenceEncoder(embedding_service.DEFAULT_MODEL, cache_dir=str(tmp_path))
+
+    expected = torch_model.encode(SENTENCES, convert_to_tensor=False)
+    actual = onnx_model.encode(SENTENCES)
+
+    assert isinstance(actual, np.ndarray)
+    cosine = np.diag(EmbeddingService.cos_sim(expected, actual))
+    assert cosine.min() >= 0.98
+
+    # Same intent picked for every sentence
+    def intents(model, queries):
+        templates = np.asarray(model.encode(TEMPLATE_TEXTS, convert_to_tensor=False))
+        return TEMPLATE_INTENT[(EmbeddingService.cos_sim(queries, templates)).argmax(axis=1)]
+
+    np.testing.assert_array_equal(intents(torch_model, expected), intents(onnx_model, actual))
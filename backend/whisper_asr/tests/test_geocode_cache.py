@@ -0,0 +1,126 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+import src.db.database as database
+import src.location.geocode_cache as geocode_cache
+import src.location.geocoder as geocoder
+from src.location.geocode_cache import GeocodeCache
+
+PLACES = {
+    "orion mall, bangalore, india": (13.0108, 77.5550),
+    "christ university, bangalore, india": (12.9345, 77.6060),
+    "manipal hospital, bangalore, india": (12.9592, 77.6484),
+}
+QUERIES = [
+    "Orion Mall, Bangalore, India",
+    "orion  mall, Bangalore, India",      # same place, different spelling
+    "Christ University, Bangalore, India",
+    "Manipal Hospital, Bangalore, India",
+    "Nowhere Layout, Bangalore, India",   # ZERO_RESULTS
+] * 20
+
+
+class StandIn(BaseHTTPRequestHandler):
+    served = []
+
+    def do_GET(self):
+        address = parse_qs(urlparse(self.path).query)["address"][0]
+        self.served.append(address)
+
+        key = " ".join(address.lower().split())
+        if key in PLACES:
+            lat, lng = PLACES[key]
+            body = {"status": "OK", "results": [{
+                "formatted_address": address,
+                "geometry": {"location": {"lat": lat, "lng": lng}},
+                "place_id": "standin-" + key.split(",")[0].replace(" ", "-")
+            }]}
+        else:
+            body = {"status": "ZERO_RESULTS", "results": []}
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    StandIn.served = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "geocode.db")
+    monkeypatch.setattr(geocoder, "GOOGLE_API_KEY", "stand-in")
+    monkeypatch.setattr(geocoder, "GEOCODE_API_URL", f"http://127.0.0.1:{server.server_port}/geocode/json")
+    monkeypatch.setattr(geocode_cache, "_cache", GeocodeCache())
+
+    yield StandIn.served
+    server.shutdown()
+    server.server_close()
+
+
+def test_repeat_lookups_hit_the_network_once_per_place(stand_in):
+    google = geocoder.GoogleGeocoder()
+
+    results = [google.geocode(q) for q in QUERIES]
+
+    # 3 known places (two spellings share a key) + 1 ZERO_RESULTS
+    assert len(stand_in) == 4
+    assert results[0]["lat"] == 13.0108 and results[1] == results[0]
+    assert results[4] is None
+    assert geocode_cache.get_geocode_cache().snapshot()["misses"] == 4
+
+
+def test_cache_survives_restart(stand_in, monkeypatch):
+    google = geocoder.GoogleGeocoder()
+    for q in QUERIES:
+        google.geocode(q)
+
+    # Fresh process-level cache, same SQLite table
+    monkeypatch.setattr(geocode_cache, "_cache", GeocodeCache())
+    served_before = len(stand_in)
+    results = [google.geocode(q) for q in QUERIES]
+
+    assert len(stand_in) == served_before
+    assert results[2]["lat"] == 12.9345
+    assert results[4] is None
+    stats = geocode_cache.get_geocode_cache().snapshot()
+    assert stats["misses"] == 0 and stats["db_hits"] == 4
+
+
+def test_negative_entries_expire(stand_in, monkeypatch):
+    monkeypatch.setattr(geocode_cache, "_cache", GeocodeCache(negative_ttl=0.2))
+    google = geocoder.GoogleGeocoder()
+    query = "Nowhere Layout, Bangalore, India"
+
+    assert google.geocode(query) is None
+    assert google.geocode(query) is None
+    assert len(stand_in) == 1
+
+    time.sleep(0.3)
+    assert google.geocode(query) is None
+    assert len(stand_in) == 2
+
+
+def test_lookup_reports_hits_and_misses(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "geocode.db")
+    cache = GeocodeCache()
+
+    assert cache.lookup("Orion Mall") == (False, None)
+
+    cache.put("Nowhere Layout", None)
+    cache.put("Orion Mall", {"lat": 13.0108, "lng": 77.5550})
+
+    assert cache.lookup("nowhere   layout!") == (True, None)
+    assert cache.lookup("orion mall") == (True, {"lat": 13.0108, "lng": 77.5550})
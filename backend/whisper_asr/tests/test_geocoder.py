@@ -0,0 +1,92 @@
+import threading
+
+import src.location.geocoder as geocoder
+from src.location.geocoder import ChainGeocoder, Geocoder, OfflineGeocoder, start_geocode
+
+
+class FakeRemote(Geocoder):
+    name = "remote"
+
+    def __init__(self, result=None):
+        self.result = result
+        self.queries = []
+
+    def geocode(self, location_text: str):
+        self.queries.append(location_text)
+        return self.result
+
+
+STATION = {"formatted_address": "Koramangala Police Station", "lat": 12.9361, "lng": 77.6190,
+           "place_id": "remote-1", "confidence": 0.9, "source": "remote"}
+QUERY = "Koramangala Police Station, Bangalore, India"
+
+
+def test_weak_local_hit_lets_the_chain_continue():
+    remote = FakeRemote(STATION)
+    chain = ChainGeocoder([OfflineGeocoder(), remote])
+
+    assert chain.geocode(QUERY) == STATION
+    assert chain.geocode_async(QUERY).result(timeout=5) == STATION
+    assert remote.queries == [QUERY, QUERY]
+
+
+def test_weak_local_hit_is_the_fallback_on_a_remote_miss():
+    chain = ChainGeocoder([OfflineGeocoder(), FakeRemote(None)])
+
+    for result in (chain.geocode(QUERY), chain.geocode_async(QUERY).result(timeout=5)):
+        assert result["formatted_address"].startswith("Koramangala,")
+        assert result["confidence"] < 0.85
+
+
+def test_confident_local_hit_ends_the_chain():
+    remote = FakeRemote(STATION)
+    chain = ChainGeocoder([OfflineGeocoder(), remote])
+
+    assert chain.geocode("Koramangala")["source"] == "offline"
+    assert chain.geocode_async("Koramangala").result(timeout=5)["source"] == "offline"
+    assert remote.queries == []
+
+
+class SlowRemote(FakeRemote):
+    def __init__(self, result):
+        super().__init__(result)
+        self.release = threading.Event()
+
+    def geocode(self, location_text: str):
+        self.release.wait(5)
+        return super().geocode(location_text)
+
+
+def classified(location):
+    return {"analysis": {"type": "police", "location": location}}
+
+
+def test_start_geocode_skips_unclassified_calls(monkeypatch):
+    remote = FakeRemote(STATION)
+    monkeypatch.setattr(geocoder, "_geocoder", ChainGeocoder([remote]))
+
+    result = start_geocode({"analysis": {"type": "unknown", "location": None}}, wait=True)
+
+    assert result["analysis"]["geo"] is None
+    assert remote.queries == []
+
+
+def test_start_geocode_never_blocks_on_a_network_lookup(monkeypatch):
+    remote = SlowRemote(STATION)
+    monkeypatch.setattr(geocoder, "_geocoder", ChainGeocoder([remote]))
+
+    result = start_geocode(classified({"text": "Koramangala Police Station"}))
+
+    assert result["analysis"]["geo"] is None
+    remote.release.set()
+    assert result["geo_future"].result(timeout=5) == STATION
+    assert remote.queries == ["Koramangala Police Station, Bangalore, India"]
+
+
+def test_start_geocode_fills_local_hits_inline(monkeypatch):
+    monkeypatch.setattr(geocoder, "_geocoder", ChainGeocoder([OfflineGeocoder(), FakeRemote(None)]))
+
+    result = start_geocode(classified({"text": "Koramangala"}))
+
+    assert result["analysis"]["geo"]["source"] == "offline"
+    assert "geo_future" not in result
@@ -0,0 +1,49 @@
+import pytest
+
+from src.nlp.keyword_matcher import KeywordMatcher
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return KeywordMatcher()
+
+
+@pytest.mark.parametrize("text, etype, keyword", [
+    ("he attacked my brother", "police", "attack"),
+    ("someone murdered him", "police", "murder"),
+    ("a man is threatening me", "police", "threat"),
+    ("my hand got burnt", "ambulance", "burn"),
+    ("two people fighting outside", "police", "fight"),
+    ("cylinder leaking", "fire", "leak"),
+    ("the building blasted", "fire", "blast"),
+    ("fires everywhere", "fire", "fire"),
+    ("two accidents on the flyover", "ambulance", "accident"),
+])
+def test_inflected_forms_match(matcher, text, etype, keyword):
+    result = matcher.match(text)
+    assert etype in result["scores"]
+    assert keyword in result["keywords"]
+
+
+@pytest.mark.parametrize("text", [
+    "he got fired from his job",
+    "we are going to vegas",
+    "my uncle is smoking outside",
+    "the firing range is closed",
+])
+def test_no_false_inflections(matcher, text):
+    assert matcher.match(text)["scores"] == {}
+
+
+def test_variant_that_is_a_keyword_counts_once(matcher):
+    # "burning" is a fire keyword of its own, not an inflection of "burn"
+    assert matcher.match("the burning house") == {
+        "scores": {"fire": 3}, "keywords": ["burning"], "priority": None
+    }
+
+
+def test_multi_word_keywords_and_priority(matcher):
+    result = matcher.match("my father had a heart attack and is not breathing")
+    assert result["keywords"][0] == "heart attack"
+    assert result["scores"]["ambulance"] == 3
+    assert result["priority"] == "critical"
@@ -0,0 +1,36 @@
+import pytest
+
+from src.nlp.location_extractor import extract_location
+
+
+@pytest.mark.parametrize("text, place", [
+    ("man stabbed brigade road", "Brigade Road"),
+    ("robbery happened btm layout", "Btm Layout"),
+    ("there is a fight outside hsr layout", "Hsr Layout"),
+    ("car crashed into church street", "Church Street"),
+    ("chain snatching on mg road", "Mg Road"),
+    ("someone fainted in forum mall", "Forum Mall"),
+])
+def test_known_landmark_beats_walk_back(text, place):
+    assert extract_location(text)["text"] == place
+
+
+@pytest.mark.parametrize("text, place", [
+    ("accident on sarjapur road", "Sarjapur Road"),
+    ("i am at rv college", "Rv College"),
+])
+def test_suffix_names_still_found(text, place):
+    assert extract_location(text)["text"] == place
+
+
+@pytest.mark.parametrize("text", [
+    "you cannot park here",
+    "he is in the main hall",
+    "going to the market now",
+])
+def test_everyday_words_are_not_places(text):
+    assert extract_location(text) is None
+
+
+def test_pincode_fallback():
+    assert extract_location("560034 please come")["pincode"] == "560034"
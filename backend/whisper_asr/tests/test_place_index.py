@@ -0,0 +1,32 @@
+from src.location.place_index import PlaceIndex
+
+ROWS = [
+    {"name": "Brigade Road", "kind": "road", "lat": "12.9719", "lng": "77.6076", "aliases": ""},
+    {"name": "MG Road", "kind": "road", "lat": "12.9756", "lng": "77.6050", "aliases": "Mahatma Gandhi Road"},
+    {"name": "Orion Mall", "kind": "mall", "lat": "13.0110", "lng": "77.5550", "aliases": ""},
+    {"name": "Orion Mall Gate 2", "kind": "landmark", "lat": "13.0112", "lng": "77.5548", "aliases": ""},
+]
+
+
+def test_token_cover_needs_a_contiguous_run():
+    index = PlaceIndex(ROWS)
+
+    # "brigade" and "road" both occur, but not next to each other
+    assert index.lookup("Fire Brigade Near Mg Road, Bangalore, India")["name"] == "MG Road"
+    assert index.lookup("road near brigade") is None
+
+
+def test_token_cover_prefers_earliest_then_longest_run():
+    index = PlaceIndex(ROWS)
+
+    assert index.lookup("outside orion mall gate 2 near mg road")["name"] == "Orion Mall Gate 2"
+    assert index.lookup("mg road then orion mall")["name"] == "MG Road"
+
+
+def test_token_cover_confidence_tracks_unmatched_tokens():
+    index = PlaceIndex(ROWS)
+
+    assert index.lookup("orion mall")["confidence"] == 0.95
+    loose = index.lookup("orion mall main gate")["confidence"]
+    looser = index.lookup("someone fainted on the pavement next to orion mall")["confidence"]
+    assert 0.85 > loose > looser
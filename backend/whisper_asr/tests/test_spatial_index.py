@@ -0,0 +1,112 @@
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.db.database as database
+from src.db.call_repository import update_call_geo, update_call_status
+from src.db.database import get_connection, init_calls_table
+from src.db.spatial_index import check_nearby_query, find_nearby_calls, init_spatial_index
+
+NOW = datetime(2026, 10, 18, 12, 0, 0)
+ORION = (13.0108, 77.5550)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "calls.db")
+    init_calls_table()
+    init_spatial_index()
+
+
+def add_call(lat, lng, minutes_ago=5, status="new"):
+    conn = get_connection()
+    cur = conn.execute(
+        "INSERT INTO calls (timestamp, latitude, longitude, status) VALUES (?, ?, ?, ?)",
+        ((NOW - timedelta(minutes=minutes_ago)).isoformat(), lat, lng, status)
+    )
+    conn.commit()
+    conn.close()
+    return cur.lastrowid
+
+
+def rtree_ids():
+    conn = get_connection()
+    ids = {row[0] for row in conn.execute("SELECT id FROM calls_rtree")}
+    conn.close()
+    return ids
+
+
+def nearby(lat=ORION[0], lng=ORION[1], **kwargs):
+    return [c["id"] for c in find_nearby_calls(lat, lng, now=NOW, **kwargs)]
+
+
+def test_triggers_keep_rtree_in_sync(db):
+    located = add_call(*ORION)
+    unlocated = add_call(None, None)
+    assert rtree_ids() == {located}
+
+    update_call_geo(unlocated, {"lat": ORION[0] + 0.001, "lng": ORION[1]})
+    assert rtree_ids() == {located, unlocated}
+
+    update_call_geo(located, {"lat": 12.9345, "lng": 77.6060})   # moved across town
+    assert nearby() == [unlocated]
+
+    conn = get_connection()
+    conn.execute("DELETE FROM calls WHERE id = ?", (unlocated,))
+    conn.commit()
+    conn.close()
+    assert rtree_ids() == {located}
+
+
+def test_backfill_indexes_rows_that_predate_the_tree(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "calls.db")
+    init_calls_table()
+    old = add_call(*ORION)
+
+    init_spatial_index()
+    init_spatial_index()   # idempotent
+
+    assert rtree_ids() == {old}
+
+
+def test_radius_time_and_status_filters(db):
+    near = add_call(ORION[0] + 0.002, ORION[1])           # ~220 m
+    nearest = add_call(*ORION)
+    far = add_call(ORION[0] + 0.01, ORION[1])             # ~1.1 km
+    stale = add_call(*ORION, minutes_ago=120)
+    closed = add_call(*ORION)
+    update_call_status(closed, "resolved")
+
+    assert nearby(radius_m=500, minutes=60) == [nearest, near]
+    assert far in nearby(radius_m=2000, minutes=60)
+    assert stale in nearby(radius_m=500, minutes=180)
+    assert closed in nearby(radius_m=500, minutes=60, include_closed=True)
+
+    for row in find_nearby_calls(*ORION, radius_m=500, minutes=60, now=NOW):
+        assert row["distance_m"] <= 500
+
+
+@pytest.mark.parametrize("args", [
+    (math.nan, ORION[1], 500, 60),
+    (ORION[0], math.inf, 500, 60),
+    (ORION[0], ORION[1], math.nan, 60),
+    (ORION[0], ORION[1], 500, -math.inf),
+    (91.0, ORION[1], 500, 60),
+    (ORION[0], -181.0, 500, 60),
+    (ORION[0], ORION[1], -500, 60),
+    (ORION[0], ORION[1], 0, 60),
+    (ORION[0], ORION[1], 500, -5),
+    (ORION[0], ORION[1], 1e9, 60),
+    (ORION[0], ORION[1], 500, 1e9),
+])
+def test_out_of_range_queries_are_rejected(args):
+    with pytest.raises(ValueError):
+        check_nearby_query(*args)
+    with pytest.raises(ValueError):
+        find_nearby_calls(*args, now=NOW)
+
+
+def test_in_range_query_is_accepted(db):
+    check_nearby_query(-90, 180, 50000, 60)
+    assert find_nearby_calls(*ORION, now=NOW) == []
@@ -4,13 +4,28 @@ import os
 import requests
 
 from src.pipeline.process_call import CallProcessor
+from src.model_registry import resident_models
+from src.embedding_service import get_embedding_service
+from src.location.geocode_cache import get_geocode_cache
+from src.config import JOB_WORKERS, ASR_POOL_WORKERS, ASR_THREADS_PER_WORKER
+from src.pipeline.worker_pool import ASRWorkerPool
+from src.jobs.job_queue import (
+    init_jobs_table,
+    enqueue_job,
+    get_job,
+    update_job_stage,
+    requeue_stale_jobs,
+    count_jobs_by_status
+)
+from src.jobs.worker import start_workers
 from src.db.call_repository import (
-    save_call,
     get_all_calls,
     get_calls_by_status,
     get_call,
     update_call_status
 )
+from src.db.database import init_calls_table
+from src.db.spatial_index import init_spatial_index, find_nearby_calls, check_nearby_query
 
 # --------------------------------------------------
 # App + Pipeline
@@ -20,11 +35,37 @@ app = Flask(__name__)
 CORS(app)  # 🔓 Allow frontend (Next.js) to access backend
 
 # ⚠️ IMPORTANT: Create CallProcessor ONCE (prevents Whisper reload)
-processor = CallProcessor()
+# Built lazily: pool workers are spawned processes that re-import this
+# module, and must not load a model / start a pool of their own.
+processor = None
+
+
+def get_processor():
+    """
+    In-process CallProcessor, or a multi-process ASRWorkerPool
+    (config.ASR_POOL_WORKERS). Both expose .process(wav_path).
+    """
+    global processor
+    if processor is None:
+        if ASR_POOL_WORKERS == 0:
+            processor = CallProcessor()
+        else:
+            processor = ASRWorkerPool(
+                workers=ASR_POOL_WORKERS,
+                threads_per_worker=ASR_THREADS_PER_WORKER
+            )
+    return processor
+
 
 RECORDINGS_DIR = "recordings"
 os.makedirs(RECORDINGS_DIR, exist_ok=True)
 
+# Calls schema (adds columns older DBs lack), durable job queue,
+# spatial index over calls (idempotent; safe in spawned children too)
+init_calls_table()
+init_jobs_table()
+init_spatial_index()
+
 # --------------------------------------------------
 # Twilio credentials (ENV ONLY — NEVER HARDCODE)
 # --------------------------------------------------
@@ -87,7 +128,40 @@ def voice():
     return Response(twiml, mimetype="text/xml")
 
 # --------------------------------------------------
-# Recording callback (Twilio → ASR → NLP → DB)
+# Recording job (worker thread: download → ASR → NLP → DB)
+# --------------------------------------------------
+
+def handle_recording_job(job):
+    payload = job["payload"]
+    local_path = payload["local_path"]
+
+    update_job_stage(job["id"], "downloading")
+    print(f"⬇️ Downloading: {payload['wav_url']}")
+    download_recording(payload["wav_url"], local_path)
+    print(f"✅ Saved: {local_path}")
+
+    phone_number = payload.get("phone_number") or "Unknown"
+    print(f"📱 Phone number captured: {phone_number}")
+
+    # Provisional row appears after fast triage; final transcript
+    # updates the same row
+    update_job_stage(job["id"], "transcribing")
+    print("🧠 Running ASR + NLP pipeline...")
+    result = get_processor().process_and_save(local_path, phone_number)
+
+    print("\n🚨 NEW CALL ANALYSIS")
+    print(result)
+
+    return {
+        "call_id": result["call_id"],
+        "transcript": result["transcript"],
+        "type": result["analysis"].get("type"),
+        "priority": result["analysis"].get("priority"),
+        "metrics": result["metrics"]
+    }
+
+# --------------------------------------------------
+# Recording callback (Twilio → job queue, returns at once)
 # --------------------------------------------------
 
 @app.route("/recording", methods=["POST"])
@@ -102,43 +176,19 @@ def recording():
     if not recording_url:
         return "No recording", 400
 
-    wav_url = recording_url + ".wav"
-    local_path = os.path.join(RECORDINGS_DIR, f"{recording_sid}.wav")
-
-    try:
-        print(f"⬇️ Downloading: {wav_url}")
-        download_recording(wav_url, local_path)
-        print(f"✅ Saved: {local_path}")
-
-        print("🧠 Running ASR + NLP pipeline...")
-        result = processor.process(local_path)
-
-        phone_number = request.args.get("from")
-        if not phone_number:
-            phone_number = request.form.get("From")
-        if not phone_number:
-            phone_number = "Unknown"
-        
-        print(f"📱 Phone number captured: {phone_number}")
-
-        call_data = {
-            "phone_number": phone_number,
-            "audio_path": local_path,
-            "language": result["language"],
-            "transcript": result["transcript"],
-            "analysis": result["analysis"]
-        }
-
-        save_call(call_data)
+    phone_number = request.args.get("from")
+    if not phone_number:
+        phone_number = request.form.get("From")
 
-        print("\n🚨 NEW CALL ANALYSIS")
-        print(result)
+    job_id = enqueue_job("recording", {
+        "recording_sid": recording_sid,
+        "wav_url": recording_url + ".wav",
+        "local_path": os.path.join(RECORDINGS_DIR, f"{recording_sid}.wav"),
+        "phone_number": phone_number
+    })
+    print(f"📥 Queued job {job_id}")
 
-    except Exception:
-        import traceback
-        traceback.print_exc()
-
-    return "OK", 200
+    return jsonify({"success": True, "job_id": job_id}), 200
 
 # --------------------------------------------------
 # API ROUTES (FOR FRONTEND DASHBOARD)
@@ -158,6 +208,36 @@ def api_get_calls():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route("/api/calls/nearby", methods=["GET"])
+def api_nearby_calls():
+    """
+    Active calls within radius_m of (lat, lng) in the last `minutes`
+    → spot several callers reporting the same incident.
+    """
+    try:
+        lat = float(request.args["lat"])
+        lng = float(request.args["lng"])
+        radius_m = float(request.args.get("radius_m", 500))
+        minutes = float(request.args.get("minutes", 60))
+    except (KeyError, ValueError):
+        return jsonify({
+            "success": False,
+            "error": "lat and lng are required; radius_m and minutes must be numbers"
+        }), 400
+
+    try:
+        check_nearby_query(lat, lng, radius_m, minutes)
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    calls = find_nearby_calls(lat, lng, radius_m, minutes)
+    return jsonify({
+        "success": True,
+        "calls": calls,
+        "count": len(calls)
+    })
+
+
 @app.route("/api/calls/<int:call_id>/dispatch", methods=["POST"])
 def api_dispatch_call(call_id):
     call = get_call(call_id)
@@ -177,11 +257,54 @@ def api_resolve_call(call_id):
     update_call_status(call_id, "resolved")
     return jsonify({"success": True})
 
+
+@app.route("/api/jobs/<int:job_id>", methods=["GET"])
+def api_get_job(job_id):
+    job = get_job(job_id)
+    if not job:
+        return jsonify({"success": False, "error": "Job not found"}), 404
+
+    return jsonify({"success": True, "job": job})
+
+
+@app.route("/api/jobs", methods=["GET"])
+def api_job_counts():
+    return jsonify({"success": True, "counts": count_jobs_by_status()})
+
+
+@app.route("/api/models", methods=["GET"])
+def api_models():
+    models = resident_models()
+    return jsonify({
+        "success": True,
+        "models": models,
+        "count": len(models)
+    })
+
+
+@app.route("/api/geocode/stats", methods=["GET"])
+def api_geocode_stats():
+    return jsonify({
+        "success": True,
+        "stats": get_geocode_cache().snapshot()
+    })
+
 # --------------------------------------------------
 # Run (NO DEBUG, NO AUTO-RELOAD)
 # --------------------------------------------------
 
 if __name__ == "__main__":
+    # Stale 'running' jobs from a crashed server are retried
+    requeue_stale_jobs()
+
+    # Pay the MiniLM load + template encoding before the first call
+    get_embedding_service().warm_up()
+
+    # One job thread per pool process keeps every worker busy
+    pool = get_processor()
+    job_threads = pool.workers if isinstance(pool, ASRWorkerPool) else JOB_WORKERS
+    start_workers(handle_recording_job, count=job_threads, kind="recording")
+
     app.run(
         host="0.0.0.0",
         port=8080,